@@ -0,0 +1,89 @@
+"""Shared helpers: benchmark environment, stubbed upstream modules and metrics."""
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+from typing import Any
+
+
+def prepare_environment(log_level: str = "WARNING", admission: bool = False) -> None:
+    """
+    Configure the service for benchmarking. Must run before anything from
+    `src` is imported (settings are cached on first use).
+
+    State goes to a throw-away DATA_DIR so runs do not influence each other.
+    """
+    os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="bench-state-"))
+    os.environ["LOG_LEVEL"] = log_level
+    os.environ["ADMISSION_ENABLED"] = "true" if admission else "false"
+
+
+def install_stub_modules(latency_ms: float = 2.0, found_ratio: float = 0.1, seed: int = 1) -> None:
+    """
+    Replace every holehe/ignorant module function with a stub upstream.
+
+    Stubs sleep for an exponentially distributed time around `latency_ms`
+    and report the payload as found with probability `found_ratio`. The
+    email validator's DNS deliverability lookup is switched off as well.
+    """
+    import email_validator
+
+    from src.infrastructure.modules.holehe_modules import HOLEHE_MODULES, IGNORANT_MODULES
+
+    email_validator.CHECK_DELIVERABILITY = False
+
+    rng = random.Random(seed)
+
+    def outcome(name: str) -> dict[str, Any]:
+        return {
+            "name": name,
+            "domain": f"{name}.example",
+            "rateLimit": False,
+            "exists": rng.random() < found_ratio,
+            "emailrecovery": None,
+            "phoneNumber": None,
+            "others": None,
+        }
+
+    def email_stub(name: str):
+        async def module(email, client, out):
+            await asyncio.sleep(rng.expovariate(1000 / latency_ms))
+            out.append(outcome(name))
+        return module
+
+    def phone_stub(name: str):
+        async def module(phone, country_code, client, out):
+            await asyncio.sleep(rng.expovariate(1000 / latency_ms))
+            out.append(outcome(name))
+        return module
+
+    for name, config in HOLEHE_MODULES.items():
+        config.func = email_stub(name)
+    for name, config in IGNORANT_MODULES.items():
+        config.func = phone_stub(name)
+
+
+def metric(value: float, unit: str, higher_is_better: bool = False) -> dict[str, Any]:
+    """One result entry of the JSON report."""
+    return {"value": round(value, 4), "unit": unit, "higher_is_better": higher_is_better}
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..1) of the samples."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def latency_metrics(prefix: str, latencies: list[float], elapsed: float, errors: int) -> dict[str, dict[str, Any]]:
+    """Throughput and latency percentiles for one load level (latencies in seconds)."""
+    latencies_ms = [latency * 1000 for latency in latencies]
+    return {
+        f"{prefix}.rps": metric(len(latencies) / elapsed, "req/s", higher_is_better=True),
+        f"{prefix}.mean_ms": metric(statistics.fmean(latencies_ms), "ms"),
+        f"{prefix}.p50_ms": metric(percentile(latencies_ms, 0.50), "ms"),
+        f"{prefix}.p90_ms": metric(percentile(latencies_ms, 0.90), "ms"),
+        f"{prefix}.p99_ms": metric(percentile(latencies_ms, 0.99), "ms"),
+        f"{prefix}.errors": metric(errors, "count"),
+    }
@@ -0,0 +1,94 @@
+"""
+Compare two benchmark result files and fail on regressions.
+
+    python -m benchmarks.compare baseline.json current.json --threshold 0.1 \
+        --metric-threshold endpoint.=0.2
+
+Exits with status 1 when any metric present in both files got worse by
+more than its threshold (relative change, in the metric's bad direction).
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _load(path: str) -> dict[str, dict[str, Any]]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))["metrics"]
+
+
+def _threshold_for(name: str, default: float, overrides: list[tuple[str, float]]) -> float:
+    """Threshold of the longest matching metric-name prefix, else the default."""
+    matches = [(prefix, value) for prefix, value in overrides if name.startswith(prefix)]
+    return max(matches, key=lambda match: len(match[0]))[1] if matches else default
+
+
+def _override(value: str) -> tuple[str, float]:
+    prefix, _, threshold = value.partition("=")
+    return prefix, float(threshold)
+
+
+def compare(
+    baseline: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+    threshold: float,
+    overrides: list[tuple[str, float]]
+) -> list[str]:
+    """
+    Print a comparison table and return the names of regressed metrics.
+
+    Args:
+        baseline: Metrics of the reference run
+        current: Metrics of the run under test
+        threshold: Allowed relative worsening, e.g. 0.1 for 10%
+        overrides: (metric name prefix, threshold) pairs
+
+    Returns:
+        list[str]: Regressed metric names
+    """
+    regressions = []
+    names = [name for name in current if name in baseline]
+    width = max((len(name) for name in names), default=0)
+
+    for name in names:
+        old, new = baseline[name]["value"], current[name]["value"]
+        higher_is_better = current[name].get("higher_is_better", False)
+        if old == 0:
+            change = 0.0 if new == 0 else float("inf")
+        else:
+            change = (new - old) / abs(old)
+        worsening = -change if higher_is_better else change
+
+        limit = _threshold_for(name, threshold, overrides)
+        regressed = worsening > limit
+        if regressed:
+            regressions.append(name)
+        status = "REGRESSION" if regressed else ("improved" if worsening < 0 else "ok")
+        print(f"{name:<{width}}  {old:>12.3f} -> {new:>12.3f}  {change:+8.1%}  {status}")
+
+    for name in sorted(set(baseline) ^ set(current)):
+        print(f"{name:<{width}}  only in {'baseline' if name in baseline else 'current'}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare benchmark results")
+    parser.add_argument("baseline", help="Baseline results JSON")
+    parser.add_argument("current", help="Current results JSON")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Allowed relative worsening (default 0.1)")
+    parser.add_argument(
+        "--metric-threshold", type=_override, action="append", default=[],
+        help="PREFIX=VALUE threshold for metrics starting with PREFIX (repeatable)"
+    )
+    args = parser.parse_args()
+
+    regressions = compare(_load(args.baseline), _load(args.current), args.threshold, args.metric_threshold)
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed: {', '.join(regressions)}")
+        sys.exit(1)
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+End-to-end endpoint benchmarks.
+
+Requests go through the full ASGI app (routing, validation, admission,
+services, serialization) in-process; module functions are stubbed, so the
+numbers measure the service itself, not the sites behind it.
+"""
+import asyncio
+import itertools
+import time
+from typing import Any, Callable
+
+import httpx
+
+from benchmarks.common import latency_metrics
+
+EMAIL_SEARCH = "/api/v2/email/search"
+PHONE_SEARCH = "/api/v2/phone/search"
+SEARCH_DIRECT = "/api/v2/orchestrator/search-direct"
+
+
+def _email(i: int) -> str:
+    return f"bench.user{i}@example.com"
+
+
+def _phone(i: int) -> str:
+    return f"+7931{i % 10_000_000:07d}"
+
+
+async def _load(
+    client: httpx.AsyncClient,
+    path: str,
+    make_body: Callable[[int], dict[str, Any]],
+    concurrency: int,
+    requests: int
+) -> tuple[list[float], float, int]:
+    """Closed-loop load: `concurrency` workers send `requests` requests in total."""
+    counter = itertools.count()
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while (i := next(counter)) < requests:
+            started_at = time.perf_counter()
+            response = await client.post(path, json=make_body(i))
+            latencies.append(time.perf_counter() - started_at)
+            if response.status_code != 200:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - started_at, errors
+
+
+async def _run(concurrency_levels: list[int], batch_sizes: list[int], requests: int) -> dict[str, dict[str, Any]]:
+    from main import app
+
+    results = {}
+    # Unique payloads per request so single-flight dedup does not flatter the numbers
+    offset = itertools.count(step=requests)
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            # Warm-up (imports, caches, latency estimates)
+            await _load(client, EMAIL_SEARCH, lambda i: {"payload": _email(i)}, 4, 8)
+
+            for concurrency in concurrency_levels:
+                base = next(offset)
+                latencies, elapsed, errors = await _load(
+                    client, EMAIL_SEARCH, lambda i: {"payload": _email(base + i)}, concurrency, requests
+                )
+                results.update(latency_metrics(f"endpoint.email_search.c{concurrency}", latencies, elapsed, errors))
+
+                base = next(offset)
+                latencies, elapsed, errors = await _load(
+                    client, PHONE_SEARCH, lambda i: {"payload": _phone(base + i)}, concurrency, requests
+                )
+                results.update(latency_metrics(f"endpoint.phone_search.c{concurrency}", latencies, elapsed, errors))
+
+            concurrency = min(concurrency_levels)
+            for batch in batch_sizes:
+                base = next(offset)
+
+                def batch_body(i: int) -> dict[str, Any]:
+                    first = (base + i) * batch
+                    return {"queries": [
+                        _email(first + j) if j % 2 == 0 else _phone(first + j) for j in range(batch)
+                    ]}
+
+                batch_requests = max(4, requests // batch)
+                latencies, elapsed, errors = await _load(client, SEARCH_DIRECT, batch_body, concurrency, batch_requests)
+                results.update(
+                    latency_metrics(f"endpoint.search_direct.b{batch}.c{concurrency}", latencies, elapsed, errors)
+                )
+    return results
+
+
+def run(concurrency_levels: list[int], batch_sizes: list[int], requests: int) -> dict[str, dict[str, Any]]:
+    """
+    Benchmark /email/search, /phone/search and /orchestrator/search-direct.
+
+    Args:
+        concurrency_levels: Concurrent clients for the search endpoints
+        batch_sizes: Query batch sizes for search-direct (run at the lowest concurrency)
+        requests: Requests per load level
+
+    Returns:
+        dict: metric name -> metric
+    """
+    return asyncio.run(_run(concurrency_levels, batch_sizes, requests))
@@ -0,0 +1,92 @@
+"""Micro-benchmarks: result adaptation, response building and serialization."""
+import json
+import statistics
+import timeit
+from typing import Any, Callable
+
+from benchmarks.common import metric
+
+MODULE_COUNT = 120  # roughly the number of active email modules
+
+
+def _per_op_us(func: Callable[[], Any], repeat: int) -> float:
+    """Median time per call in microseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return statistics.median(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def _raises(func: Callable[[], Any], exception: type) -> Callable[[], None]:
+    def call() -> None:
+        try:
+            func()
+        except exception:
+            pass
+    return call
+
+
+def _aggregated_response():
+    from src.core.constants import ResponseStatus, ResultCode
+    from src.domain.models.response import AggregatedResponse, DataRecord, ModuleResult
+
+    results = {}
+    for i in range(MODULE_COUNT):
+        found = i % 10 == 0
+        results[f"module{i}"] = ModuleResult(
+            module_name=f"module{i}",
+            status=ResponseStatus.OK,
+            code=200 if found else 204,
+            message="ok" if found else "No data found",
+            records=[DataRecord(result="Найден", result_code=ResultCode.FOUND, email_recovery="ex****@gmail.com")] if found else [],
+            latency_ms=123.4
+        )
+    return AggregatedResponse(total_modules=MODULE_COUNT, successful=MODULE_COUNT, failed=0, results=results)
+
+
+def run(repeat: int = 5) -> dict[str, dict[str, Any]]:
+    """
+    Run the micro-benchmarks.
+
+    Args:
+        repeat: Timing repetitions (the median is reported)
+
+    Returns:
+        dict: metric name -> metric
+    """
+    from fastapi.encoders import jsonable_encoder
+
+    from src.controllers.email_controller import EmailController
+    from src.domain.exceptions import NoDataFoundException
+    from src.domain.services.legacy_adapter_service import LegacyAdapterService
+    from src.domain.services.legacy_response_service import LegacyResponseService
+    from src.infrastructure.response_builders.legacy_response_builder import LegacyResponseBuilder
+
+    holehe_found = [{
+        "name": "site", "domain": "site.example", "rateLimit": False, "exists": True,
+        "emailrecovery": "ex****@gmail.com", "phoneNumber": "+7 *** ***-**-99", "others": None,
+    }]
+    holehe_not_found = [{**holehe_found[0], "exists": False}]
+    ignorant_found = [{"name": "site", "domain": "site.example", "rateLimit": False, "exists": True}]
+
+    aggregated = _aggregated_response()
+    controller = EmailController()
+    search_response = controller._convert_to_sfera_format(aggregated, "bench@example.com")
+    records = LegacyAdapterService.cast_holehe_to_isphere(holehe_found)
+    legacy_service = LegacyResponseService()
+
+    cases = {
+        "legacy_adapter.holehe_found": lambda: LegacyAdapterService.cast_holehe_to_isphere(holehe_found),
+        "legacy_adapter.holehe_not_found": _raises(
+            lambda: LegacyAdapterService.cast_holehe_to_isphere(holehe_not_found), NoDataFoundException
+        ),
+        "legacy_adapter.ignorant_found": lambda: LegacyAdapterService.cast_ignorant_to_isphere(ignorant_found),
+        "response.legacy_builder_ok": lambda: LegacyResponseBuilder.ok(records),
+        "response.legacy_convert": lambda: legacy_service.convert_to_legacy_format(search_response),
+        f"response.sfera_convert_{MODULE_COUNT}": lambda: controller._convert_to_sfera_format(aggregated, "bench@example.com"),
+        f"serialization.jsonable_encoder_{MODULE_COUNT}": lambda: json.dumps(jsonable_encoder(search_response)),
+        f"serialization.model_dump_json_{MODULE_COUNT}": lambda: search_response.model_dump_json(),
+    }
+    return {
+        f"micro.{name}.us_per_op": metric(_per_op_us(func, repeat), "us")
+        for name, func in cases.items()
+    }
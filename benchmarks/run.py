@@ -0,0 +1,95 @@
+"""
+Run the benchmark suite and write the results as JSON.
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --suite micro --suite startup --quick
+    python -m benchmarks.run --suite endpoints --loop uvloop --output uvloop.json
+    python -m benchmarks.compare baseline.json bench.json --threshold 0.1
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.common import install_stub_modules, prepare_environment
+
+SUITES = ("endpoints", "micro", "startup")
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Service benchmark suite")
+    parser.add_argument("--suite", action="append", choices=SUITES, help="Suite to run (repeatable, default: all)")
+    parser.add_argument("--output", default="benchmark-results.json", help="JSON results file")
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 8, 32], help="Comma-separated client counts")
+    parser.add_argument("--batch-sizes", type=_int_list, default=[1, 10, 50], help="Comma-separated search-direct batch sizes")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per load level")
+    parser.add_argument("--stub-latency-ms", type=float, default=2.0, help="Mean latency of stubbed upstream modules")
+    parser.add_argument("--found-ratio", type=float, default=0.1, help="Share of stubbed module calls reporting FOUND")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions for micro and startup benchmarks")
+    parser.add_argument("--admission", action="store_true", help="Keep admission control enabled")
+    parser.add_argument("--log-level", default="WARNING", help="Service log level during the run")
+    parser.add_argument("--loop", choices=("asyncio", "uvloop"), default="asyncio", help="Event loop for the endpoints suite")
+    parser.add_argument("--quick", action="store_true", help="Small run for smoke checks")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.requests, args.repeat = 20, 2
+
+    prepare_environment(log_level=args.log_level, admission=args.admission)
+    if args.loop == "uvloop":
+        import uvloop
+        uvloop.install()
+    suites = args.suite or list(SUITES)
+    metrics = {}
+
+    if "micro" in suites:
+        from benchmarks import micro
+        metrics.update(micro.run(repeat=args.repeat))
+
+    if "startup" in suites:
+        from benchmarks import startup
+        metrics.update(startup.run(repeat=args.repeat))
+
+    if "endpoints" in suites:
+        from benchmarks import endpoints
+        install_stub_modules(latency_ms=args.stub_latency_ms, found_ratio=args.found_ratio)
+        metrics.update(endpoints.run(args.concurrency, args.batch_sizes, args.requests))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            "revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "suites": suites,
+            "options": {key: value for key, value in vars(args).items() if key not in ("suite", "output")},
+        },
+        "metrics": metrics,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    width = max(len(name) for name in metrics) if metrics else 0
+    for name, entry in metrics.items():
+        print(f"{name:<{width}}  {entry['value']:>12.3f} {entry['unit']}")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
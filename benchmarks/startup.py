@@ -0,0 +1,56 @@
+"""Startup time: fresh interpreter importing the app and running its lifespan startup."""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.common import metric
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def startup():
+    async with main.app.router.lifespan_context(main.app):
+        return time.perf_counter()
+
+ready = asyncio.run(startup())
+print(json.dumps({"import": imported - started, "lifespan": ready - imported}))
+"""
+
+
+def run(repeat: int = 5) -> dict[str, dict[str, Any]]:
+    """
+    Measure cold start in fresh interpreters.
+
+    Args:
+        repeat: Number of interpreter launches (the median is reported)
+
+    Returns:
+        dict: metric name -> metric
+    """
+    imports, lifespans, processes = [], [], []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=ROOT, env=dict(os.environ), capture_output=True, text=True, check=True
+        )
+        processes.append(time.perf_counter() - started_at)
+        timings = json.loads(completed.stdout.strip().splitlines()[-1])
+        imports.append(timings["import"])
+        lifespans.append(timings["lifespan"])
+
+    return {
+        "startup.import_ms": metric(statistics.median(imports) * 1000, "ms"),
+        "startup.lifespan_ms": metric(statistics.median(lifespans) * 1000, "ms"),
+        "startup.process_ms": metric(statistics.median(processes) * 1000, "ms"),
+    }
@@ -16,8 +16,13 @@ from src.core.exception_handlers import (
 from src.api.v1.email import router as router_email
 from src.api.v1.phone import router as router_phone
 from src.api.v1.orchestrator import router as router_orchestrator
+from src.api.v1.admin import router as router_admin
+from src.api.v1.history import router as router_history
 from src.domain.exceptions import DomainException
 from src.domain.models.response import HealthResponse, ResponseHeaders
+from src.infrastructure.lifecycle import worker_lifecycle
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+from src.server import runtime_info
 
 # Setup logging
 setup_logging()
@@ -36,9 +41,9 @@ async def lifespan(app: FastAPI):
     logger.info(f"Mode: {settings.MODE}")
     logger.info(f"Debug: {settings.DEBUG}")
     
-    yield
+    async with worker_lifecycle():
+        yield
     
-    # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}")
 
 
@@ -69,6 +74,8 @@ app.add_exception_handler(Exception, sfera_general_exception_handler)
 app.include_router(router_email)
 app.include_router(router_phone)
 app.include_router(router_orchestrator)
+app.include_router(router_admin)
+app.include_router(router_history)
 
 logger.info("Sfera OSINT Service started successfully")
 
@@ -104,30 +111,25 @@ async def health_check():
 
 @app.get("/status", response_model=HealthResponse)
 async def status_check():
-    """Status check endpoint in Sfera format."""
+    """Live runtime state of the answering worker in Sfera format."""
     settings = get_settings()
     return HealthResponse(
         headers=ResponseHeaders(sender=f"{settings.APP_NAME} - sfera.core"),
         body={
             "status": "ok", 
             "version": settings.APP_VERSION,
-            "service": settings.APP_NAME
+            "service": settings.APP_NAME,
+            **get_stats_registry().snapshot()
         },
         extra={
             "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
-            "mode": settings.MODE
+            "mode": settings.MODE,
+            "runtime": runtime_info()
         }
     )
 
 
 if __name__ == "__main__":
-    import uvicorn
+    from src.server import main as run_server
     
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        workers=settings.WORKERS,
-        reload=settings.DEBUG,
-        log_level="info"
-    )
\ No newline at end of file
+    run_server()
\ No newline at end of file
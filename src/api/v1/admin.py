@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, Query
+from src.controllers.admin_controller import AdminController
+from src.core.constants import ProfileFormat
+from src.core.security import require_admin_token
+from src.domain.models.response import AdminResponse
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+from src.core.config import get_settings
+settings = get_settings()
+router = APIRouter(
+    prefix=f"{settings.API_V1_PREFIX}/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)]
+)
+
+admin_controller = AdminController()
+
+
+@router.get("/timeouts", response_model=AdminResponse)
+async def get_module_timeouts():
+    """Get current adaptive per-module timeouts and the latency behind them."""
+    return admin_controller.get_module_timeouts()
+
+
+@router.get("/blocking", response_model=AdminResponse)
+async def get_blocking_report():
+    """Get which modules and phases block the event loop, worst offenders first."""
+    return admin_controller.get_blocking_report()
+
+
+@router.get("/profile/cpu")
+async def profile_cpu(
+    seconds: float = Query(10, gt=0, description="Profiling window (capped by PROFILE_MAX_SECONDS)"),
+    format: ProfileFormat = Query(ProfileFormat.COLLAPSED, description="collapsed stacks or cProfile pstats"),
+    tasks: bool = Query(False, description="Also sample asyncio task await stacks (collapsed only)")
+):
+    """Profile the answering worker's event loop thread and download the result."""
+    return await admin_controller.profile_cpu(seconds, format, tasks)
+
+
+@router.get("/profile/memory", response_model=AdminResponse)
+async def profile_memory(
+    seconds: float = Query(30, gt=0, description="Window between the two tracemalloc snapshots"),
+    top: int = Query(30, ge=1, le=500, description="Largest differences returned"),
+    frames: int = Query(1, ge=1, le=50, description="Traceback depth per allocation")
+):
+    """Diff tracemalloc snapshots taken `seconds` apart to find memory growth."""
+    return await admin_controller.profile_memory(seconds, top, frames)
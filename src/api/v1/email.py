@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
 from src.controllers.email_controller import EmailController
 from src.domain.models.search import EmailSearchRequest
 from src.domain.models.response import SearchResponse, ModuleListResponse
+from src.infrastructure.admission.admission_controller import enforce_admission
 
 from src.core.logging import get_logger
 
@@ -26,7 +28,17 @@ async def get_all_email_modules():
     return email_controller.get_all_modules()
 
 
-@router.post("/search", response_model=SearchResponse)
+@router.get("/modules/smart", response_model=ModuleListResponse)
+async def explain_smart_email_modules(
+    payload: Optional[str] = Query(None, description="Email whose segment drives the selection"),
+    module_budget: Optional[int] = Query(None, ge=1, description="Maximum number of modules"),
+    time_budget: Optional[float] = Query(None, gt=0, description="Maximum expected module time in seconds")
+):
+    """Explain which modules 'smart' selection picks and why."""
+    return email_controller.explain_smart_selection(payload, module_budget, time_budget)
+
+
+@router.post("/search", response_model=SearchResponse, dependencies=[Depends(enforce_admission)])
 async def search_email(
     request: EmailSearchRequest,
     only_found: bool = Query(False, description="Return only modules with found data")
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Query
+from src.controllers.history_controller import HistoryController
+from src.domain.models.response import HistoryResponse
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+from src.core.config import get_settings
+settings = get_settings()
+router = APIRouter(prefix=f"{settings.API_V1_PREFIX}/history", tags=["history"])
+
+history_controller = HistoryController()
+
+
+@router.get("", response_model=HistoryResponse)
+async def get_history(
+    payload: str = Query(..., description="Email or phone (any spelling of the same identity)"),
+    module: Optional[str] = Query(None, description="Only results of this module"),
+    since: Optional[datetime] = Query(None, description="Only results observed at or after this time"),
+    limit: int = Query(100, ge=1, le=10000, description="Maximum results, newest first")
+):
+    """Get what modules returned for a payload in earlier searches (HISTORY_ENABLED)."""
+    return await history_controller.get_history(payload, module, since, limit)
@@ -1,10 +1,14 @@
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, Request
 from src.controllers.orchestrator_controller import OrchestratorController
 from src.domain.models.orchestrator import (
     OrchestratorRequest, 
     OrchestratorResponse,
     DirectSearchRequest
 )
+from src.core.constants import NDJSON_MEDIA_TYPE
+from src.infrastructure.admission.admission_controller import enforce_admission
+from src.infrastructure.validators.query_stream import iter_queries
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -15,19 +19,46 @@ router = APIRouter(prefix=f"{settings.API_V1_PREFIX}/orchestrator", tags=["orche
 orchestrator_controller = OrchestratorController()
 
 
-@router.post("/search", response_model=OrchestratorResponse)
-async def orchestrator_search(request: OrchestratorRequest):
+@router.post("/search", response_model=OrchestratorResponse, dependencies=[Depends(enforce_admission)])
+async def orchestrator_search(request: OrchestratorRequest, accept: Optional[str] = Header(None)):
     """
     Main orchestrator endpoint that uses validator service.
-    Returns Sfera-compliant response.
+    Streams a Sfera-compliant response (NDJSON records with `Accept: application/x-ndjson`).
     """
-    return await orchestrator_controller.process_with_validator(request)
+    return await orchestrator_controller.process_with_validator(request, ndjson=NDJSON_MEDIA_TYPE in (accept or ""))
 
 
-@router.post("/search-direct", response_model=OrchestratorResponse)
-async def orchestrator_search_direct(request: DirectSearchRequest):
+@router.post("/search-direct", response_model=OrchestratorResponse, dependencies=[Depends(enforce_admission)])
+async def orchestrator_search_direct(request: DirectSearchRequest, accept: Optional[str] = Header(None)):
     """
     Direct search endpoint that bypasses validator service.
-    Returns Sfera-compliant response.
+    Streams a Sfera-compliant response (NDJSON records with `Accept: application/x-ndjson`).
     """
-    return await orchestrator_controller.process_direct(request)
+    return await orchestrator_controller.process_direct(request, ndjson=NDJSON_MEDIA_TYPE in (accept or ""))
+
+
+@router.post("/search-stream", response_model=OrchestratorResponse, dependencies=[Depends(enforce_admission)])
+async def orchestrator_search_stream(
+    request: Request,
+    direct: bool = Query(False, description="Bypass the validator service"),
+    accept: Optional[str] = Header(None)
+):
+    """
+    Search an NDJSON / line-delimited upload (`Content-Type: application/x-ndjson`,
+    chunked uploads welcome): one query per line, as plain text, a JSON string
+    or {"query": ...}. Lines are processed while the upload is still arriving.
+    Streams a Sfera-compliant response (NDJSON records with `Accept: application/x-ndjson`).
+    """
+    queries = iter_queries(request.stream(), settings.ORCHESTRATOR_INGEST_MAX_LINE)
+    return await orchestrator_controller.process_stream(
+        queries, direct=direct, ndjson=NDJSON_MEDIA_TYPE in (accept or "")
+    )
+
+
+@router.get("/results/{token}", response_model=OrchestratorResponse)
+async def orchestrator_results(token: str):
+    """
+    Next page of results that did not fit into an orchestrator response.
+    Follow `continuation` until it is null.
+    """
+    return orchestrator_controller.get_continuation(token)
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
 from src.controllers.phone_controller import PhoneController
 from src.domain.models.search import PhoneSearchRequest
 from src.domain.models.response import SearchResponse, ModuleListResponse
+from src.infrastructure.admission.admission_controller import enforce_admission
 
 from src.core.logging import get_logger
 
@@ -25,7 +27,17 @@ async def get_all_phone_modules():
     return phone_controller.get_all_modules()
 
 
-@router.post("/search", response_model=SearchResponse)
+@router.get("/modules/smart", response_model=ModuleListResponse)
+async def explain_smart_phone_modules(
+    payload: Optional[str] = Query(None, description="Phone number whose segment drives the selection"),
+    module_budget: Optional[int] = Query(None, ge=1, description="Maximum number of modules"),
+    time_budget: Optional[float] = Query(None, gt=0, description="Maximum expected module time in seconds")
+):
+    """Explain which modules 'smart' selection picks and why."""
+    return phone_controller.explain_smart_selection(payload, module_budget, time_budget)
+
+
+@router.post("/search", response_model=SearchResponse, dependencies=[Depends(enforce_admission)])
 async def search_phone(
     request: PhoneSearchRequest,
     only_found: bool = Query(False, description="Return only modules with found data")
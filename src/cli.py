@@ -0,0 +1,296 @@
+"""
+Command line tools.
+
+    python -m src.cli bulk --input emails.txt --output results.ndjson
+    python -m src.cli bulk --input emails.txt --output results --format parquet --processes 4
+    python -m src.cli bulk --input emails.txt --output results --format arrow
+
+`bulk` searches a file (or stdin) of emails and phones without going
+through the HTTP API: one query per line (plain, a JSON string or
+{"query": ...}), read as the run progresses and searched with the same
+services, scheduler, executors, caches and persisted state as the API
+workers. Results are committed to the output every few seconds together
+with a checkpoint, so an interrupted run picks up where it stopped
+(--restart starts over). --processes splits the input across worker
+processes, each writing its own shard of the output. Progress and
+throughput are reported on stderr.
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import AsyncIterator, Optional
+
+from src.core.constants import BulkFormat
+
+# "-" as input or output: stdin / stdout
+STDIO = "-"
+
+# Input bytes read per batch by the reader thread
+READ_CHUNK = 1 << 16
+
+
+def _shard(value: str) -> tuple[int, int]:
+    index, _, count = value.partition("/")
+    try:
+        shard = (int(index), int(count))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected K/N, e.g. 0/4")
+    if not 0 <= shard[0] < shard[1]:
+        raise argparse.ArgumentTypeError("shard K/N needs 0 <= K < N")
+    return shard
+
+
+def _shard_outputs(args: argparse.Namespace) -> tuple[Optional[str], Optional[str], str]:
+    """(output path, checkpoint path, columnar part prefix) of this process's shard."""
+    index, count = args.shard
+    if args.output == STDIO:
+        return None, None, "part"
+    if args.format in (BulkFormat.PARQUET, BulkFormat.ARROW):
+        prefix = f"part-{index}-of-{count}" if count > 1 else "part"
+        # Dot files are ignored by dataset readers
+        return args.output, os.path.join(args.output, f".{prefix}.checkpoint"), prefix
+    path = args.output
+    if count > 1:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{index}-of-{count}{ext}"
+    return path, f"{path}.checkpoint", "part"
+
+
+class BulkRun:
+    """
+    One process's share of a bulk run.
+
+    At most --concurrency queries are searched at once; the input is only
+    read further when one finishes. Completed queries are buffered and
+    committed (output first, then checkpoint) every --commit-interval
+    seconds or --commit-results results.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        from src.controllers.orchestrator_controller import OrchestratorController
+        from src.infrastructure.persistence.bulk_output import BulkCheckpoint, open_writer
+
+        self.args = args
+        self.label = f"bulk {args.shard[0]}/{args.shard[1]}"
+        output, checkpoint_path, prefix = _shard_outputs(args)
+        self.checkpoint = BulkCheckpoint.load(checkpoint_path) if checkpoint_path else None
+        if self.checkpoint is not None and args.restart:
+            self.checkpoint.discard()
+            self.checkpoint = BulkCheckpoint(checkpoint_path)
+        position = self.checkpoint.position if self.checkpoint else 0
+        self.writer = open_writer(args.format, output, position, prefix)
+        self.controller = OrchestratorController()
+
+        self.read = 0
+        self.skipped = 0
+        self.completed = 0
+        self.results = 0
+        self.in_flight = 0
+        self.started = time.monotonic()
+        self._pending: list[tuple[int, list]] = []
+        self._pending_results = 0
+        self._commit_lock = asyncio.Lock()
+        self._committed_at = self.started
+        self._reported = (self.started, 0)
+
+    async def _lines(self) -> AsyncIterator[tuple[int, bytes]]:
+        """(ordinal within the shard, line) of this process's lines, read off the loop."""
+        handle = sys.stdin.buffer if self.args.input == STDIO else open(self.args.input, "rb")
+        index, count = self.args.shard
+        line_number = 0
+        try:
+            while True:
+                lines = await asyncio.to_thread(handle.readlines, READ_CHUNK)
+                if not lines:
+                    break
+                for line in lines:
+                    if line_number % count == index:
+                        yield line_number // count, line
+                    line_number += 1
+        finally:
+            if handle is not sys.stdin.buffer:
+                handle.close()
+
+    async def _search(self, ordinal: int, line: bytes) -> None:
+        from src.domain.exceptions import ValidationException
+        from src.infrastructure.validators.query_stream import parse_query_line
+
+        try:
+            query = parse_query_line(line)
+        except ValidationException:
+            # Searched as-is so the line comes back as an error result
+            query = line.decode("utf-8", errors="replace").strip()
+        self.in_flight += 1
+        try:
+            results = await self.controller.search_query(query, direct=not self.args.validator)
+        finally:
+            self.in_flight -= 1
+        await self._add(ordinal, results)
+
+    async def _add(self, ordinal: int, results: list) -> None:
+        self._pending.append((ordinal, results))
+        self._pending_results += len(results)
+        self.completed += 1
+        self.results += len(results)
+        if self._pending_results >= self.args.commit_results:
+            await self.commit()
+
+    def _commit_batch(self, batch: list[tuple[int, list]]) -> None:
+        for _, results in batch:
+            self.writer.write(results)
+        position = self.writer.commit()
+        if self.checkpoint is not None:
+            self.checkpoint.commit(
+                [ordinal for ordinal, _ in batch],
+                sum(len(results) for _, results in batch),
+                position
+            )
+
+    async def commit(self) -> None:
+        """Write the completed queries and advance the checkpoint past them."""
+        async with self._commit_lock:
+            batch, self._pending, self._pending_results = self._pending, [], 0
+            self._committed_at = time.monotonic()
+            if batch:
+                await asyncio.to_thread(self._commit_batch, batch)
+
+    def report(self, final: bool = False) -> None:
+        now = time.monotonic()
+        elapsed = max(now - self.started, 1e-9)
+        since, completed_then = self._reported
+        recent = (self.completed - completed_then) / max(now - since, 1e-9)
+        self._reported = (now, self.completed)
+        print(
+            f"[{self.label}] {'done' if final else 'running'} {elapsed:.0f}s: "
+            f"{self.completed} queries ({self.completed / elapsed:.1f}/s, last {recent:.1f}/s), "
+            f"{self.results} results ({self.results / elapsed:.0f}/s), "
+            f"{self.in_flight} in flight, {self.skipped} already done",
+            file=sys.stderr,
+            flush=True
+        )
+
+    async def _tick(self) -> None:
+        while True:
+            await asyncio.sleep(1)
+            now = time.monotonic()
+            if now - self._committed_at >= self.args.commit_interval:
+                await self.commit()
+            if now - self._reported[0] >= self.args.report_interval:
+                self.report()
+
+    async def run(self) -> None:
+        from src.infrastructure.lifecycle import worker_lifecycle
+
+        if self.checkpoint is not None and self.checkpoint.position:
+            print(f"[{self.label}] resuming after {self.checkpoint.queries} queries", file=sys.stderr, flush=True)
+        slots = asyncio.Semaphore(self.args.concurrency)
+        tasks: set[asyncio.Task] = set()
+
+        async def bounded(ordinal: int, line: bytes) -> None:
+            try:
+                await self._search(ordinal, line)
+            finally:
+                slots.release()
+
+        async with worker_lifecycle():
+            ticker = asyncio.create_task(self._tick())
+            try:
+                async for ordinal, line in self._lines():
+                    self.read += 1
+                    if self.checkpoint is not None and self.checkpoint.is_done(ordinal):
+                        self.skipped += 1
+                        continue
+                    if not line.strip():
+                        await self._add(ordinal, [])
+                        continue
+                    await slots.acquire()
+                    task = asyncio.create_task(bounded(ordinal, line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                if tasks:
+                    await asyncio.gather(*tasks)
+            finally:
+                ticker.cancel()
+                for task in tasks:
+                    task.cancel()
+                # Whatever completed is kept; the rest is searched on resume
+                await self.commit()
+                self.writer.close()
+                self.report(final=True)
+
+
+def _run_processes(args: argparse.Namespace) -> int:
+    """Run the shards as child processes and wait for all of them."""
+    children = []
+    for index in range(args.processes):
+        argv = [
+            sys.executable, "-m", "src.cli", "bulk",
+            "--input", args.input,
+            "--output", args.output,
+            "--format", args.format.value,
+            "--shard", f"{index}/{args.processes}",
+            "--concurrency", str(args.concurrency),
+            "--commit-interval", str(args.commit_interval),
+            "--commit-results", str(args.commit_results),
+            "--report-interval", str(args.report_interval),
+            "--log-level", args.log_level,
+        ]
+        if args.validator:
+            argv.append("--validator")
+        if args.restart:
+            argv.append("--restart")
+        children.append(subprocess.Popen(argv))
+    try:
+        return max(child.wait() for child in children)
+    except KeyboardInterrupt:
+        # Children got the same SIGINT and commit before exiting
+        return max(child.wait() for child in children)
+
+
+def bulk(args: argparse.Namespace) -> int:
+    if args.processes > 1:
+        if STDIO in (args.input, args.output):
+            print("--processes needs --input and --output files", file=sys.stderr)
+            return 2
+        return _run_processes(args)
+
+    from src.core.logging import setup_logging
+
+    setup_logging(sys.stderr)
+    try:
+        asyncio.run(BulkRun(args).run())
+    except KeyboardInterrupt:
+        print("Interrupted; run the same command again to resume", file=sys.stderr)
+        return 130
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Holehe service command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bulk_parser = commands.add_parser("bulk", help="Search a file of emails/phones without the HTTP API")
+    bulk_parser.add_argument("--input", default=STDIO, help="Queries, one per line (default: stdin)")
+    bulk_parser.add_argument("--output", default=STDIO, help="Output file, or directory for parquet/arrow (default: stdout)")
+    bulk_parser.add_argument("--format", type=BulkFormat, choices=list(BulkFormat), default=BulkFormat.NDJSON, help="Output format")
+    bulk_parser.add_argument("--concurrency", type=int, default=32, help="Queries searched at once per process")
+    bulk_parser.add_argument("--processes", type=int, default=1, help="Worker processes, each searching a shard of the input")
+    bulk_parser.add_argument("--shard", type=_shard, default=(0, 1), help="Only search lines K, K+N, ... (K/N); set by --processes")
+    bulk_parser.add_argument("--validator", action="store_true", help="Validate through the validator service instead of locally")
+    bulk_parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start over")
+    bulk_parser.add_argument("--commit-interval", type=float, default=5.0, help="Seconds between output commits")
+    bulk_parser.add_argument("--commit-results", type=int, default=10000, help="Results buffered before an early commit")
+    bulk_parser.add_argument("--report-interval", type=float, default=10.0, help="Seconds between progress reports")
+    bulk_parser.add_argument("--log-level", default="WARNING", help="Service log level (logs go to stderr)")
+    args = parser.parse_args()
+
+    # Before anything reads the (cached) settings
+    os.environ["LOG_LEVEL"] = args.log_level
+    sys.exit(bulk(args))
+
+
+if __name__ == "__main__":
+    main()
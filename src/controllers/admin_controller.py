@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from fastapi.responses import PlainTextResponse, Response
+
+from src.core.constants import ProfileFormat
+from src.core.logging import get_logger
+from src.domain.models.response import AdminResponse, ResponseHeaders
+from src.infrastructure.modules.holehe_modules import (
+    get_active_holehe_modules, get_active_ignorant_modules
+)
+from src.infrastructure.execution.module_executor import get_module_executor
+from src.infrastructure.monitoring.blocking_detector import get_blocking_detector
+from src.infrastructure.monitoring.loop_monitor import get_loop_monitor
+from src.infrastructure.monitoring.profiler import get_profiler
+from src.infrastructure.scheduling.timeout_policy import get_timeout_policy
+
+logger = get_logger(__name__)
+
+from src.core.config import get_settings
+settings = get_settings()
+
+class AdminController:
+    """Controller for operational/admin diagnostics."""
+
+    def __init__(self):
+        self.service_name = f"{settings.APP_NAME} - sfera.admin"
+
+    def get_module_timeouts(self) -> AdminResponse:
+        """Get current per-module timeouts in Sfera format."""
+        email_policy = get_timeout_policy("email")
+        phone_policy = get_timeout_policy("phone")
+
+        # Active modules plus anything observed (e.g. explicitly requested inactive ones)
+        email_modules = sorted(set(get_active_holehe_modules()) | set(email_policy.tracker.modules()))
+        phone_modules = sorted(set(get_active_ignorant_modules()) | set(phone_policy.tracker.modules()))
+
+        return AdminResponse(
+            headers=ResponseHeaders(sender=self.service_name),
+            body={
+                "email": email_policy.snapshot(email_modules),
+                "phone": phone_policy.snapshot(phone_modules)
+            },
+            extra={
+                "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+                "enabled": settings.ADAPTIVE_TIMEOUTS_ENABLED,
+                "percentile": settings.ADAPTIVE_TIMEOUT_PERCENTILE,
+                "margin": settings.ADAPTIVE_TIMEOUT_MARGIN,
+                "floor_s": settings.ADAPTIVE_TIMEOUT_FLOOR,
+                "min_samples": settings.ADAPTIVE_TIMEOUT_MIN_SAMPLES
+            }
+        )
+
+    def get_blocking_report(self) -> AdminResponse:
+        """Get event loop blocking attributed to modules and phases in Sfera format."""
+        loop_monitor = get_loop_monitor()
+
+        return AdminResponse(
+            headers=ResponseHeaders(sender=self.service_name),
+            body=get_blocking_detector().snapshot(),
+            extra={
+                "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+                "enabled": settings.BLOCKING_DETECTOR_ENABLED,
+                "loop_lag_ms": round(loop_monitor.lag_ms, 1),
+                "peak_loop_lag_ms": round(loop_monitor.peak_lag * 1000, 1),
+                "execution": get_module_executor().snapshot()
+            }
+        )
+
+    async def profile_cpu(self, seconds: float, profile_format: ProfileFormat, tasks: bool) -> Response:
+        """Profile this worker for `seconds` and return the profile as a file."""
+        profiler = get_profiler()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+
+        if profile_format == ProfileFormat.PSTATS:
+            return Response(
+                content=await profiler.deterministic(seconds),
+                media_type="application/octet-stream",
+                headers={"Content-Disposition": f'attachment; filename="profile-{stamp}.pstats"'}
+            )
+        return PlainTextResponse(
+            content=await profiler.sample(seconds, tasks=tasks),
+            headers={"Content-Disposition": f'attachment; filename="profile-{stamp}.collapsed"'}
+        )
+
+    async def profile_memory(self, seconds: float, top: int, frames: int) -> AdminResponse:
+        """Get memory growth of this worker over `seconds` in Sfera format."""
+        return AdminResponse(
+            headers=ResponseHeaders(sender=self.service_name),
+            body=await get_profiler().memory(seconds, top=top, frames=frames),
+            extra={
+                "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+            }
+        )
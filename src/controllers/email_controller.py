@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from datetime import datetime, timezone
 from src.core.logging import get_logger
 from src.domain.models.search import EmailSearchRequest
@@ -67,6 +67,31 @@ class EmailController:
                 "timestamp":  datetime.now(timezone.utc).replace(microsecond=0).isoformat()            }
         )
     
+    def explain_smart_selection(
+        self,
+        payload: Optional[str] = None,
+        module_budget: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> ModuleListResponse:
+        """Explain smart module selection in Sfera format."""
+        explanation = self.service.explain_selection(payload, module_budget, time_budget)
+
+        return ModuleListResponse(
+            headers=ResponseHeaders(sender=self.service_name),
+            body={
+                "modules": explanation["selected"],
+                "count": len(explanation["selected"]),
+                "type": "email",
+                "segment": explanation["segment"],
+                "ranking": explanation["ranking"]
+            },
+            extra={
+                "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+                "module_budget": module_budget,
+                "time_budget": time_budget
+            }
+        )
+    
     async def search_as_standard_response(
         self,
         email: str,
@@ -91,7 +116,9 @@ class EmailController:
                     "code": module_result.code,
                     "message": module_result.message,
                     "found": len(module_result.records) > 0 and module_result.code == 200,
-                    "records": [record.dict() for record in module_result.records]
+                    "records": [record.dict() for record in module_result.records],
+                    "latency_ms": module_result.latency_ms,
+                    "stale": module_result.stale
                 },
                 extra={
                     "timestamp": module_result.timestamp,
@@ -117,7 +144,9 @@ class EmailController:
                 "code": module_result.code,
                 "message": module_result.message,
                 "records": [record.dict() for record in module_result.records],
-                "timestamp": module_result.timestamp
+                "timestamp": module_result.timestamp,
+                "latency_ms": module_result.latency_ms,
+                "stale": module_result.stale
             }
         
         return SearchResponse(
@@ -127,7 +156,9 @@ class EmailController:
                 "total_modules": aggregated_result.total_modules,
                 "successful": aggregated_result.successful,
                 "failed": aggregated_result.failed,
-                "results": results
+                "results": results,
+                "skipped": aggregated_result.skipped,
+                "stopped_early": aggregated_result.stopped_early
             },
             extra={
                 "timestamp": aggregated_result.timestamp,
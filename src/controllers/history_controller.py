@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from src.core.constants import DataType
+from src.core.logging import get_logger
+from src.domain.exceptions import HistoryDisabledException
+from src.domain.models.response import HistoryResponse, ResponseHeaders
+from src.domain.services.canonicalization_service import CanonicalizationService
+from src.infrastructure.persistence.result_history import get_result_history
+
+logger = get_logger(__name__)
+
+from src.core.config import get_settings
+settings = get_settings()
+
+class HistoryController:
+    """Controller for recorded module results."""
+
+    def __init__(self):
+        self.service_name = f"{settings.APP_NAME} - sfera.history"
+        self.canonicalizer = CanonicalizationService()
+
+    async def get_history(
+        self,
+        payload: str,
+        module: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 100
+    ) -> HistoryResponse:
+        """
+        Recorded results of an email or phone in Sfera format, newest first.
+
+        The payload is matched by canonical key, so any spelling of the same
+        address or number finds the same history.
+        """
+        if not settings.HISTORY_ENABLED:
+            raise HistoryDisabledException()
+
+        data_type = DataType.EMAIL if "@" in payload else DataType.PHONE
+        payload_key = self.canonicalizer.key_for(data_type, payload)
+        results = await get_result_history().history(
+            payload_key,
+            module=module,
+            since=since.timestamp() if since else None,
+            limit=limit
+        )
+
+        return HistoryResponse(
+            headers=ResponseHeaders(sender=self.service_name),
+            body={
+                "payload": payload,
+                "payload_key": payload_key,
+                "module": module,
+                "count": len(results),
+                "results": results
+            },
+            extra={
+                "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+                "data_type": data_type.value,
+                "retention_days": settings.HISTORY_RETENTION_DAYS
+            }
+        )
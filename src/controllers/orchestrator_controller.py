@@ -1,7 +1,8 @@
 import asyncio
-from typing import List
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+from fastapi.responses import StreamingResponse
 from src.core.config import get_settings
-from src.core.constants import DataType
+from src.core.constants import DataType, NDJSON_MEDIA_TYPE
 from src.core.logging import get_logger
 from src.domain.models.orchestrator import (
     OrchestratorRequest, 
@@ -10,13 +11,36 @@ from src.domain.models.orchestrator import (
     DirectSearchRequest
 )
 from src.domain.models.response import StandardResponse, ResponseHeaders
-from src.domain.models.search import EmailSearchRequest, PhoneSearchRequest
+from src.domain.models.search import EmailSearchRequest, PhoneSearchRequest, ParsedPhone
 from src.controllers.email_controller import EmailController
 from src.controllers.phone_controller import PhoneController
+from src.domain.services.batch_results import BatchResults
+from src.domain.services.canonicalization_service import CanonicalizationService
+from src.domain.services.result_budget import ResultBudget
+from src.infrastructure.persistence.result_spill import get_result_spill_store
+from src.infrastructure.response_builders.streaming_response_builder import (
+    DuplexStreamingResponse, stream_json_document, stream_ndjson
+)
 from src.infrastructure.validators.validator_client import ValidatorClient
 
 logger = get_logger(__name__)
 
+# Serialized results buffered between the searches and a slow client
+STREAM_QUEUE_RESULTS = 256
+
+# Results coalesced into one written chunk
+STREAM_BATCH_RESULTS = 64
+
+# Receives (query index, responses of that query)
+Emit = Callable[[int, list[StandardResponse]], Awaitable[None]]
+
+
+async def _iterate(queries: list[str]) -> AsyncIterator[str]:
+    """A request's query list as the async iterator _process_bounded takes."""
+    for query in queries:
+        yield query
+
+
 class OrchestratorController:
     """Enhanced orchestrator with Sfera-compliant responses."""
     
@@ -25,113 +49,195 @@ class OrchestratorController:
         self.phone_controller = PhoneController()
         self.settings = get_settings()
         self.service_name = f"{self.settings.APP_NAME} - sfera.orchestrator"
+        self.canonicalizer = CanonicalizationService()
         
         # Initialize validator with fallback support
         self.validator_client = ValidatorClient(
             self.settings.VALIDATOR_URL if self.settings.VALIDATOR_ENABLED else None
         )
     
-    async def process_with_validator(self, request: OrchestratorRequest) -> OrchestratorResponse:
-        """Process queries using validator service with Sfera-compliant response."""
+    async def process_with_validator(self, request: OrchestratorRequest, ndjson: bool = False) -> StreamingResponse:
+        """Process queries using validator service, streaming a Sfera-compliant response."""
         logger.info(f"Orchestrator processing {len(request.queries)} queries with validator")
         
-        # Validate all queries
-        validation_tasks = [
-            self._validate_with_fallback(query)
-            for query in request.queries
-        ]
-        validated_queries = await asyncio.gather(*validation_tasks, return_exceptions=True)
+        async def run(emit: Emit) -> int:
+            return await self._process_bounded(_iterate(request.queries), False, emit)
         
-        # Process validated queries
-        processing_tasks = []
-        for i, validated in enumerate(validated_queries):
-            if isinstance(validated, Exception):
-                logger.error(f"Validation failed for query {request.queries[i]}: {str(validated)}")
-                # Create error response for failed validation
-                processing_tasks.append(self._create_error_response(request.queries[i], str(validated)))
-                continue
-            processing_tasks.append(self._process_single_query(validated))
+        return self._stream_batch(run, "validator", ndjson, total_queries=len(request.queries))
+    
+    async def process_direct(self, request: DirectSearchRequest, ndjson: bool = False) -> StreamingResponse:
+        """Process queries using direct validation only, streaming a Sfera-compliant response."""
+        logger.info(f"Direct orchestrator processing {len(request.queries)} queries")
         
-        results_lists = await asyncio.gather(*processing_tasks, return_exceptions=True)
+        async def run(emit: Emit) -> int:
+            return await self._process_bounded(_iterate(request.queries), True, emit)
         
-        # Flatten results
-        all_results = []
-        for results in results_lists:
-            if isinstance(results, Exception):
-                logger.error(f"Processing failed: {str(results)}")
-                continue
-            all_results.extend(results)
+        return self._stream_batch(run, "direct", ndjson, total_queries=len(request.queries))
+    
+    async def process_stream(self, queries: AsyncIterator[str], direct: bool, ndjson: bool) -> StreamingResponse:
+        """
+        Process an uploaded stream of queries, streaming a Sfera-compliant response.
         
-        logger.info(f"Orchestrator completed: {len(all_results)} total results")
-        from datetime import datetime, timezone
-
-        return OrchestratorResponse(
-            headers=ResponseHeaders(sender=self.service_name),
-            body={
-                "total_queries": len(request.queries),
-                "processed_queries": len(all_results),
-                "successful_queries": len([r for r in all_results if r.body.get("status") == "ok"]),
-                "failed_queries": len([r for r in all_results if r.body.get("status") == "error"]),
-                "results": [result.dict() for result in all_results]
-            },
-            extra={
-                "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
-                "validation_source": "validator",
-                "service_version": self.settings.APP_VERSION
-            }
-        )
+        Lines are validated and searched as they are read (see
+        _process_bounded); while every slot is taken the upload is not read
+        any further, which holds back the client.
+        """
+        logger.info(f"Orchestrator processing a query stream ({'direct' if direct else 'validator'})")
+        
+        async def run(emit: Emit) -> int:
+            return await self._process_bounded(queries, direct, emit)
+        
+        return self._stream_batch(run, "direct" if direct else "validator", ndjson, reads_body=True)
     
-    async def process_direct(self, request: DirectSearchRequest) -> OrchestratorResponse:
-        """Process queries using direct validation only with Sfera-compliant response."""
-        logger.info(f"Direct orchestrator processing {len(request.queries)} queries")
+    async def search_query(self, query: str, direct: bool = True) -> list[StandardResponse]:
+        """
+        Validate and search one query; failures come back as an error response.
         
-        # Use direct validation only
-        validation_tasks = [
-            self.validator_client.validate_direct_only(query)
-            for query in request.queries
-        ]
-        validation_results = await asyncio.gather(*validation_tasks)
+        Args:
+            query: Raw email or phone
+            direct: Validate locally instead of through the validator service
+        """
+        try:
+            if direct:
+                validated = await self._validate_direct(query)
+            else:
+                validated = await self._validate_with_fallback(query)
+        except Exception as e:
+            logger.error(f"Validation failed for query {query}: {str(e)}")
+            return [self._create_error_response(query, str(e))]
+        return await self._process_single_query(validated)
+    
+    def _stream_batch(
+        self,
+        run: Callable[[Emit], Awaitable[int]],
+        validation_source: str,
+        ndjson: bool,
+        total_queries: Optional[int] = None,
+        reads_body: bool = False
+    ) -> StreamingResponse:
+        """
+        Stream the results of `run` (which passes each query's results to
+        emit and returns the number of queries) as they complete.
         
-        # Process queries
-        processing_tasks = []
-        for i, validation_result in enumerate(validation_results):
-            validated = ValidatedQuery(
-                original=request.queries[i],
-                clean=validation_result.get("clean_data", request.queries[i]),
-                data_type=DataType(validation_result.get("type", "unknown")),
-                extra_data=validation_result.get("extra", {})
-            )
-            processing_tasks.append(self._process_single_query(validated))
+        Results go inline in completion order within the per-request result
+        caps (see ResultBudget); counters follow the results. emit() blocks
+        on a bounded queue while the client is behind, and `run` keeps a
+        bounded number of queries in flight, so a slow client holds back the
+        searches instead of growing memory.
+        reads_body is set when `run` still reads the request body.
+        """
+        budget = ResultBudget(
+            max_results=self.settings.ORCHESTRATOR_MAX_RESULTS,
+            max_bytes=self.settings.ORCHESTRATOR_MAX_RESULT_BYTES,
+            overflow=self.settings.RESULT_OVERFLOW,
+            spill_store=get_result_spill_store()
+        )
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_RESULTS)
+        errors: list[str] = []
+        processed: list[int] = []
         
-        results_lists = await asyncio.gather(*processing_tasks, return_exceptions=True)
+        async def emit(index: int, results: list[StandardResponse]) -> None:
+            for payload in budget.admit(index, results):
+                await queue.put(payload)
         
-        # Flatten results
-        all_results = []
-        for results in results_lists:
-            if isinstance(results, Exception):
-                logger.error(f"Processing failed: {str(results)}")
-                continue
-            all_results.extend(results)
+        async def produce() -> None:
+            try:
+                processed.append(await run(emit))
+            except Exception as e:
+                logger.error(f"Orchestrator batch failed: {str(e)}")
+                errors.append(str(e))
+            await queue.put(None)
+        
+        async def drain() -> AsyncIterator[list[bytes]]:
+            producer = asyncio.create_task(produce())
+            try:
+                done = False
+                while not done:
+                    batch = [await queue.get()]
+                    # Coalesce whatever is already waiting into one chunk
+                    while not queue.empty() and len(batch) < STREAM_BATCH_RESULTS:
+                        batch.append(queue.get_nowait())
+                    if batch[-1] is None:
+                        batch.pop()
+                        done = True
+                    if batch:
+                        yield batch
+                        for payload in batch:
+                            budget.release(len(payload))
+            finally:
+                if not producer.done():
+                    # Client went away
+                    producer.cancel()
+                    budget.abort()
+        
+        def finish() -> tuple[dict, dict]:
+            overflow = budget.finish()
+            logger.info(
+                f"Orchestrator ({validation_source}) completed: {budget.total} total results, "
+                f"peak result memory {budget.peak_resident_bytes} bytes"
+            )
+            from datetime import datetime, timezone
+            
+            body_tail = {} if total_queries is not None else {"total_queries": sum(processed)}
+            body_tail.update({
+                "processed_queries": budget.total,
+                "successful_queries": budget.successful,
+                "failed_queries": budget.failed,
+                **overflow
+            })
+            if errors:
+                body_tail.update({"status": "error", "error": errors[0]})
+            extra = {
+                "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+                "validation_source": validation_source,
+                "service_version": self.settings.APP_VERSION,
+                "memory": budget.memory()
+            }
+            return body_tail, extra
         
-        logger.info(f"Direct orchestrator completed: {len(all_results)} total results")
+        encode = stream_ndjson if ndjson else stream_json_document
+        response_class = DuplexStreamingResponse if reads_body else StreamingResponse
+        return response_class(
+            encode(
+                ResponseHeaders(sender=self.service_name).dict(),
+                {"total_queries": total_queries} if total_queries is not None else {},
+                drain(),
+                finish
+            ),
+            media_type=NDJSON_MEDIA_TYPE if ndjson else "application/json"
+        )
+    
+    def get_continuation(self, token: str) -> OrchestratorResponse:
+        """Next page of results spilled by an orchestrator search."""
+        results, next_token = get_result_spill_store().read_page(
+            token,
+            max_results=self.settings.ORCHESTRATOR_MAX_RESULTS,
+            max_bytes=self.settings.ORCHESTRATOR_MAX_RESULT_BYTES
+        )
         from datetime import datetime, timezone
 
         return OrchestratorResponse(
             headers=ResponseHeaders(sender=self.service_name),
             body={
-                "total_queries": len(request.queries),
-                "processed_queries": len(all_results),
-                "successful_queries": len([r for r in all_results if r.body.get("status") == "ok"]),
-                "failed_queries": len([r for r in all_results if r.body.get("status") == "error"]),
-                "results": [result.dict() for result in all_results]
+                "results": results,
+                "continuation": next_token
             },
             extra={
                 "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
-                "validation_source": "direct",
                 "service_version": self.settings.APP_VERSION
             }
         )
     
+    async def _validate_direct(self, query: str) -> ValidatedQuery:
+        """Validate query with direct validation only."""
+        validation_result = await self.validator_client.validate_direct_only(query)
+        return ValidatedQuery(
+            original=query,
+            clean=validation_result.get("clean_data", query),
+            data_type=DataType(validation_result.get("type", "unknown")),
+            extra_data=validation_result.get("extra", {})
+        )
+    
     async def _validate_with_fallback(self, query: str) -> ValidatedQuery:
         """Validate query with guaranteed fallback."""
         
@@ -158,6 +264,110 @@ class OrchestratorController:
                 extra_data=validation_result.get("extra", {})
             )
     
+    async def _process_bounded(self, queries: AsyncIterator[str], direct: bool, emit: Emit) -> int:
+        """
+        Validate and search queries with at most ORCHESTRATOR_INGEST_CONCURRENCY in flight.
+        
+        The next query is only taken once a slot frees up, and a slot is
+        held until the query's results were passed to emit(query index,
+        results), so a slow client holds back the searches and memory does
+        not grow with the batch. A query whose canonical identity (e.g.
+        'Foo.Bar+tag@Gmail.com' and 'foobar@gmail.com' with provider rules)
+        is being searched already waits for that search, and one that was
+        searched earlier in the batch reuses its results (see BatchResults);
+        either way it gets a copy with its own query value. Failed
+        validations become error responses.
+        
+        Returns:
+            int: Number of queries processed
+        """
+        validate = self._validate_direct if direct else self._validate_with_fallback
+        slots = asyncio.Semaphore(self.settings.ORCHESTRATOR_INGEST_CONCURRENCY)
+        # canonical key -> (query searched, future of its results)
+        searching: dict[str, tuple[ValidatedQuery, asyncio.Future]] = {}
+        completed = BatchResults(self.settings.ORCHESTRATOR_DEDUP_MEMORY_BYTES, get_result_spill_store())
+        tasks: set[asyncio.Task] = set()
+        duplicates = 0
+        
+        async def process(query: str) -> list[StandardResponse]:
+            nonlocal duplicates
+            try:
+                validated = await validate(query)
+            except Exception as e:
+                logger.error(f"Validation failed for query {query}: {str(e)}")
+                return [self._create_error_response(query, str(e))]
+            
+            # Unknown types are never merged
+            key = self.canonicalizer.key_for(validated.data_type, validated.clean)
+            if key is not None and key in searching:
+                duplicates += 1
+                source, future = searching[key]
+                results = await asyncio.shield(future)
+                return [self._copy_for_query(result, source, validated) for result in results]
+            if key is not None and key in completed:
+                duplicates += 1
+                source, results = completed.get(key)
+                return [self._copy_for_query(result, source, validated) for result in results]
+            
+            future = asyncio.get_running_loop().create_future()
+            if key is not None:
+                searching[key] = (validated, future)
+            try:
+                results = await self._process_single_query(validated)
+                if key is not None:
+                    completed.put(key, validated, results)
+                future.set_result(results)
+                return results
+            finally:
+                if key is not None:
+                    del searching[key]
+                if not future.done():
+                    future.cancel()
+        
+        async def bounded(index: int, query: str) -> None:
+            try:
+                await emit(index, await process(query))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Processing failed: {str(e)}")
+            finally:
+                slots.release()
+        
+        count = 0
+        try:
+            async for query in queries:
+                # Backpressure: no further query is taken while every slot is busy
+                await slots.acquire()
+                task = asyncio.create_task(bounded(count, query))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                count += 1
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            completed.close()
+        
+        if duplicates:
+            logger.info(f"Deduplicated {duplicates} queries by canonical identity")
+        return count
+    
+    def _copy_for_query(
+        self,
+        result: StandardResponse,
+        source: ValidatedQuery,
+        target: ValidatedQuery
+    ) -> StandardResponse:
+        """Copy a response produced for one query onto a duplicate of it."""
+        query = target.original if result.body.get("query") == source.original else target.clean
+        return StandardResponse(
+            headers=result.headers,
+            body={**result.body, "query": query},
+            extra=dict(result.extra)
+        )
+    
     async def _process_single_query(self, validated: ValidatedQuery) -> list[StandardResponse]:
         """Process single query with proper error handling."""
         logger.info(f"Processing {validated.data_type} query: {validated.clean}")
@@ -171,7 +381,8 @@ class OrchestratorController:
             elif validated.data_type == DataType.PHONE:
                 return await self.phone_controller.search_as_standard_response(
                     phone=validated.clean,
-                    modules=["*"]
+                    modules=["*"],
+                    parsed_phone=ParsedPhone.from_extra(validated.extra_data)
                 )
             else:
                 logger.warning(f"Unsupported data type for query: {validated.original}")
@@ -1,7 +1,7 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from datetime import datetime, timezone
 from src.core.logging import get_logger
-from src.domain.models.search import PhoneSearchRequest
+from src.domain.models.search import PhoneSearchRequest, ParsedPhone
 from src.domain.models.response import (
     ModuleListResponse, SearchResponse, ResponseHeaders,
     AggregatedResponse, StandardResponse
@@ -67,17 +67,43 @@ class PhoneController:
                 "timestamp":  datetime.now(timezone.utc).replace(microsecond=0).isoformat()            }
         )
     
+    def explain_smart_selection(
+        self,
+        payload: Optional[str] = None,
+        module_budget: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> ModuleListResponse:
+        """Explain smart module selection in Sfera format."""
+        explanation = self.service.explain_selection(payload, module_budget, time_budget)
+
+        return ModuleListResponse(
+            headers=ResponseHeaders(sender=self.service_name),
+            body={
+                "modules": explanation["selected"],
+                "count": len(explanation["selected"]),
+                "type": "phone",
+                "segment": explanation["segment"],
+                "ranking": explanation["ranking"]
+            },
+            extra={
+                "timestamp": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+                "module_budget": module_budget,
+                "time_budget": time_budget
+            }
+        )
+    
     async def search_as_standard_response(
         self,
         phone: str,
-        modules: list[str]
+        modules: list[str],
+        parsed_phone: Optional[ParsedPhone] = None
     ) -> list[StandardResponse]:
         """
         Perform phone search and return in standard response format.
-        Used by orchestrator.
+        Used by orchestrator, which passes the number it already parsed.
         """
         request = PhoneSearchRequest(payload=phone, modules=modules)
-        aggregated_result = await self.service.search(request, only_found=False)
+        aggregated_result = await self.service.search(request, only_found=False, parsed_phone=parsed_phone)
 
         responses = []
         for module_name, module_result in aggregated_result.results.items():
@@ -90,7 +116,9 @@ class PhoneController:
                     "code": module_result.code,
                     "message": module_result.message,
                     "found": len(module_result.records) > 0 and module_result.code == 200,
-                    "records": [record.dict() for record in module_result.records]
+                    "records": [record.dict() for record in module_result.records],
+                    "latency_ms": module_result.latency_ms,
+                    "stale": module_result.stale
                 },
                 extra={
                     "timestamp": module_result.timestamp,
@@ -116,7 +144,9 @@ class PhoneController:
                 "code": module_result.code,
                 "message": module_result.message,
                 "records": [record.dict() for record in module_result.records],
-                "timestamp": module_result.timestamp
+                "timestamp": module_result.timestamp,
+                "latency_ms": module_result.latency_ms,
+                "stale": module_result.stale
             }
         
         return SearchResponse(
@@ -126,7 +156,9 @@ class PhoneController:
                 "total_modules": aggregated_result.total_modules,
                 "successful": aggregated_result.successful,
                 "failed": aggregated_result.failed,
-                "results": results
+                "results": results,
+                "skipped": aggregated_result.skipped,
+                "stopped_early": aggregated_result.stopped_early
             },
             extra={
                 "timestamp": aggregated_result.timestamp,
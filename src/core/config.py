@@ -5,6 +5,10 @@ from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.core.constants import (
+    ExecutionMode, NegativeIndexMode, ResultOverflow, SchedulingPolicy, ServerHttp, ServerLoop, TransportMode
+)
+
 import os
 
 def resolve_env_file() -> str:
@@ -35,13 +39,136 @@ class Settings(BaseSettings):
     
     # API
     API_V1_PREFIX: str = "/api/v2"
-    WORKERS: int = Field(default=2, description="Number of worker processes")
+    WORKERS: Optional[int] = Field(default=None, description="Number of worker processes (default: CPU count)")
+    
+    # Server Runtime (python -m src.server)
+    HOST: str = Field(default="0.0.0.0", description="Bind address")
+    PORT: int = Field(default=8000, description="Bind port")
+    SERVER_LOOP: ServerLoop = Field(default=ServerLoop.AUTO, description="Event loop: auto, uvloop or asyncio")
+    SERVER_HTTP: ServerHttp = Field(default=ServerHttp.AUTO, description="HTTP parser: auto, httptools or h11")
+    SERVER_BACKLOG: int = Field(default=4096, description="Listen backlog of pending connections")
+    SERVER_KEEPALIVE_TIMEOUT: int = Field(default=30, description="Seconds an idle keep-alive connection stays open")
+    SERVER_LIMIT_CONCURRENCY: Optional[int] = Field(default=None, description="Connections per worker before answering 503")
+    SERVER_LIMIT_MAX_REQUESTS: Optional[int] = Field(default=None, description="Requests after which a worker is recycled")
+    SERVER_GRACEFUL_SHUTDOWN: int = Field(default=30, description="Seconds to drain connections on shutdown")
     
     # HTTP Client
     HTTP_TIMEOUT: int = Field(default=50, description="HTTP request timeout in seconds")
     HTTP_VERIFY_SSL: bool = Field(default=True, description="Verify SSL certificates")
     MAX_CONCURRENT_REQUESTS: int = Field(default=50, description="Maximum concurrent module requests")
     
+    # HTTP Record/Replay
+    HTTP_TRANSPORT_MODE: TransportMode = Field(default=TransportMode.LIVE, description="Module traffic: live, record, replay or routed")
+    HTTP_CASSETTE_DIR: str = Field(default="cassettes", description="Directory holding per-module cassette files")
+    HTTP_REPLAY_RECORDED_LATENCY: bool = Field(default=False, description="Delay replayed responses by their recorded latency")
+    HTTP_REPLAY_LATENCY_MS: float = Field(default=0, description="Extra latency (ms) added to every replayed response")
+    HTTP_REPLAY_JITTER_MS: float = Field(default=0, description="Uniform random jitter (+/- ms) added to replayed responses")
+    HTTP_ROUTE_URL: str = Field(default="http://127.0.0.1:8900", description="Base URL receiving all module traffic in routed mode")
+    
+    # Admission Control
+    ADMISSION_ENABLED: bool = Field(default=True, description="Reject or degrade searches when the worker is saturated")
+    ADMISSION_MAX_PENDING_MODULES: int = Field(default=1000, description="In-flight plus queued modules above which searches are rejected")
+    ADMISSION_MAX_QUEUE_DEPTH: int = Field(default=500, description="Scheduler queue depth above which searches are rejected")
+    ADMISSION_MAX_LOOP_LAG_MS: int = Field(default=500, description="Event loop lag (ms) above which searches are rejected")
+    ADMISSION_DEGRADE_RATIO: float = Field(default=0.5, description="Fraction of any limit at which low-priority modules are shed")
+    ADMISSION_RETRY_AFTER: int = Field(default=2, description="Retry-After value (seconds) sent with 503 responses")
+    LOOP_LAG_INTERVAL_MS: int = Field(default=100, description="Event loop lag sampling interval in milliseconds")
+    
+    # Module Scheduling
+    MODULE_SCHEDULING_POLICY: SchedulingPolicy = Field(
+        default=SchedulingPolicy.SHORTEST_FIRST,
+        description="Module start order: none, shortest_first (streaming) or longest_first (makespan)"
+    )
+    LATENCY_EWMA_ALPHA: float = Field(default=0.2, description="Smoothing factor for per-module latency estimates")
+    LATENCY_WINDOW_SIZE: int = Field(default=200, description="Recent latencies (healthy runs and timeouts) kept per module for percentiles")
+    LATENCY_WINDOW_MAX_AGE: int = Field(default=3600, description="Seconds a latency sample counts toward percentiles")
+    
+    # Adaptive Module Timeouts
+    ADAPTIVE_TIMEOUTS_ENABLED: bool = Field(default=True, description="Derive per-module timeouts from observed latency")
+    ADAPTIVE_TIMEOUT_PERCENTILE: float = Field(default=0.99, description="Latency percentile the timeout is based on")
+    ADAPTIVE_TIMEOUT_MARGIN: float = Field(default=2.0, description="Multiplier applied to the latency percentile")
+    ADAPTIVE_TIMEOUT_FLOOR: float = Field(default=1.0, description="Minimum adaptive timeout in seconds")
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = Field(default=20, description="Unexpired samples required before adapting a timeout")
+    ADAPTIVE_TIMEOUT_WIDEN_AFTER: int = Field(default=3, description="Consecutive timeouts after which a module gets the caller's full deadline until it answers again")
+    
+    # Smart Module Selection
+    SMART_DEFAULT_MODULE_BUDGET: int = Field(default=20, description="Modules run by 'smart' selection when no budget is given")
+    SMART_PRIOR_HIT_RATE: float = Field(default=0.05, description="Assumed FOUND rate for modules without statistics")
+    SMART_PRIOR_WEIGHT: int = Field(default=20, description="Pseudo-observations backing the prior when smoothing rates")
+    SMART_SEGMENT_MIN_SAMPLES: int = Field(default=50, description="Runs needed before a domain/country segment rate is used")
+    SMART_MAX_SEGMENTS: int = Field(default=2000, description="Domain/country segments with hit-rate counters kept per module family (least recently seen evicted)")
+    SMART_EXPLORATION_RATE: float = Field(default=0.05, description="Chance to also run an unselected module to keep its statistics fresh")
+    
+    # Phone Parsing
+    PHONE_PARSE_CACHE_SIZE: int = Field(default=10000, description="Parsed phone numbers kept in the LRU cache")
+    
+    # Canonicalization
+    CANONICAL_PROVIDER_RULES: bool = Field(default=False, description="Apply domain aliases and provider local-part rules (gmail dots, +tags) to canonical email keys; merges results of addresses sites may treat as distinct")
+    
+    # Blocking Detection
+    BLOCKING_DETECTOR_ENABLED: bool = Field(default=True, description="Attribute event loop stalls to the module or phase running")
+    BLOCKING_THRESHOLD_MS: int = Field(default=100, description="Event loop stall (ms) reported as blocking")
+    BLOCKING_SAMPLE_INTERVAL_MS: int = Field(default=20, description="Heartbeat and watchdog sampling interval in milliseconds")
+    BLOCKING_MAX_EVENTS: int = Field(default=100, description="Recent blocking events kept for the debug endpoint")
+    
+    # Module Execution
+    MODULE_EXECUTION_MODES: dict[str, ExecutionMode] = Field(
+        default_factory=dict,
+        description='Per-module execution mode overrides, e.g. {"email/instagram": "thread"}'
+    )
+    AUTO_OFFLOAD_BLOCKING_EVENTS: int = Field(default=0, description="Blocking events after which an inline module moves to a worker thread (0 = off)")
+    OFFLOAD_THREAD_LOOPS: int = Field(default=2, description="Worker threads (each with its own event loop) for thread-mode modules")
+    OFFLOAD_PROCESS_WORKERS: Optional[int] = Field(default=None, description="Subprocesses for process-mode modules (default: CPU count)")
+    
+    # Executor Pool
+    EXECUTOR_POOL_ENABLED: bool = Field(default=False, description="Run modules in executor processes shared by all API processes")
+    EXECUTOR_WORKERS: Optional[int] = Field(default=None, description="Executor worker processes (default: CPU count)")
+    EXECUTOR_SOCKET_DIR: Optional[str] = Field(default=None, description="Private (0700, owned by this user) directory of executor Unix sockets (default: $XDG_RUNTIME_DIR/holehe-executors, else <DATA_DIR>/executors)")
+    EXECUTOR_MAX_IN_FLIGHT: int = Field(default=200, description="Concurrent module executions per executor worker")
+    EXECUTOR_SPAWN: bool = Field(default=True, description="Spawn missing executor workers from the API process")
+    EXECUTOR_IDLE_EXIT: int = Field(default=60, description="Seconds an executor worker lingers without API connections")
+    
+    # Result Limits
+    ORCHESTRATOR_MAX_RESULTS: int = Field(default=20000, description="Results kept in one orchestrator response (and continuation page)")
+    ORCHESTRATOR_MAX_RESULT_BYTES: int = Field(default=32 * 1024 * 1024, description="JSON bytes of results kept in one orchestrator response")
+    RESULT_OVERFLOW: ResultOverflow = Field(default=ResultOverflow.SPILL, description="Results past the caps: spill (continuation token) or truncate")
+    ORCHESTRATOR_INGEST_CONCURRENCY: int = Field(default=32, description="Queries of an orchestrator batch or streamed upload validated and searched at once")
+    ORCHESTRATOR_DEDUP_MEMORY_BYTES: int = Field(default=8 * 1024 * 1024, description="JSON bytes of completed results kept in memory per batch to answer duplicate queries (the rest go to a scratch file)")
+    ORCHESTRATOR_INGEST_MAX_LINE: int = Field(default=4096, description="Longest accepted line of a streamed upload in bytes")
+    RESULT_SPILL_TTL: int = Field(default=3600, description="Seconds spilled results stay available")
+    
+    # Admin Profiling
+    ADMIN_TOKEN: Optional[str] = Field(default=None, description="Bearer token for admin profiling endpoints (unset disables them)")
+    PROFILE_MAX_SECONDS: int = Field(default=60, description="Longest profiling window a request may ask for")
+    PROFILE_SAMPLE_INTERVAL_MS: int = Field(default=5, description="Stack sampling interval of the CPU profiler")
+    
+    # Result History
+    HISTORY_ENABLED: bool = Field(default=False, description="Record every executed module result in an SQLite history")
+    HISTORY_PATH: Optional[str] = Field(default=None, description="History database file (default: <DATA_DIR>/history.sqlite3)")
+    HISTORY_RETENTION_DAYS: int = Field(default=30, description="Days history rows are kept")
+    HISTORY_SERVE_MAX_AGE: int = Field(default=0, description="Serve a module's recorded result instead of running it when it is at most this many seconds old (0: never)")
+    HISTORY_FLUSH_INTERVAL: float = Field(default=1.0, description="Seconds between batched history inserts")
+    HISTORY_MAX_PENDING: int = Field(default=50000, description="Queued history rows before new ones are dropped")
+    
+    # Result Cache
+    RESULT_CACHE_ENABLED: bool = Field(default=False, description="Serve module results from an in-memory stale-while-revalidate cache")
+    RESULT_CACHE_SIZE: int = Field(default=100000, description="Cached (payload, module) results per module family")
+    RESULT_CACHE_SOFT_TTL: float = Field(default=300.0, description="Seconds a cached result is fresh; older ones are served stale and refreshed in the background")
+    RESULT_CACHE_HARD_TTL: float = Field(default=3600.0, description="Seconds after which a cached result is dropped")
+    RESULT_CACHE_MAX_REFRESHES: int = Field(default=1000, description="Background refreshes running or queued at once per module family")
+    
+    # Negative Index
+    NEGATIVE_INDEX_MODE: NegativeIndexMode = Field(default=NegativeIndexMode.OFF, description="Remember (module, payload) pairs that returned 204: off, observe (count only) or trust (skip those modules)")
+    NEGATIVE_INDEX_TTL: int = Field(default=7 * 86400, description="Seconds a 204 is remembered")
+    NEGATIVE_INDEX_BUCKETS: int = Field(default=7, description="Time buckets the TTL is split into (entries expire one bucket at a time)")
+    NEGATIVE_INDEX_CAPACITY: int = Field(default=5_000_000, description="Entries per bucket at the configured false positive rate")
+    NEGATIVE_INDEX_FP_RATE: float = Field(default=0.01, description="False positive rate of a full bucket (modules wrongly skipped in trust mode)")
+    NEGATIVE_INDEX_SNAPSHOT_INTERVAL: int = Field(default=300, description="Seconds between negative index snapshots to DATA_DIR")
+    
+    # Local State
+    DATA_DIR: str = Field(default="data", description="Directory for persisted worker state")
+    STATE_PERSIST_INTERVAL: int = Field(default=60, description="Seconds between state snapshots to DATA_DIR")
+    
     # Validator Service (Optional)
     VALIDATOR_URL: Optional[str] = Field(default=None, description="URL for validator service")
     VALIDATOR_ENABLED: bool = Field(default=False, description="Enable validator integration")
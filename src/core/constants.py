@@ -33,11 +33,100 @@ HTTP_STATUS_BAD_REQUEST = 400
 HTTP_STATUS_NOT_FOUND = 404
 HTTP_STATUS_INTERNAL_ERROR = 500
 HTTP_STATUS_SERVICE_UNAVAILABLE = 503
+HTTP_STATUS_GATEWAY_TIMEOUT = 504
+
+# Media type of newline-delimited JSON streams
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
 # Module Constants
 MODULE_ALL = "*"
+MODULE_SMART = "smart"  # hit-rate driven subset of active modules
 DEFAULT_MODULE_TIMEOUT = 10  # seconds
 
+# Module priorities (higher runs first, lowest is shed first under load)
+MODULE_PRIORITY_LOW = 0
+MODULE_PRIORITY_NORMAL = 1
+MODULE_PRIORITY_HIGH = 2
+# Background cache refreshes yield to every live search
+MODULE_PRIORITY_REFRESH = -1
+
+
+class AdmissionState(str, Enum):
+    """Load states reported by the admission controller."""
+    NORMAL = "normal"
+    DEGRADED = "degraded"
+    OVERLOADED = "overloaded"
+
+
+class SearchMode(str, Enum):
+    """How long a search waits for its modules."""
+    ALL = "all"  # wait for every module
+    ANY = "any"  # stop at the first module that finds the payload
+
+
+class SchedulingPolicy(str, Enum):
+    """Start order for module fan-out."""
+    NONE = "none"
+    SHORTEST_FIRST = "shortest_first"
+    LONGEST_FIRST = "longest_first"
+
+
+class ExecutionMode(str, Enum):
+    """Where a module's coroutine runs."""
+    INLINE = "inline"  # on the worker's event loop
+    THREAD = "thread"  # on a dedicated worker thread loop
+    PROCESS = "process"  # in a subprocess pool
+    POOL = "pool"  # in a shared executor worker process (EXECUTOR_POOL_ENABLED)
+
+
+class ServerLoop(str, Enum):
+    """Event loop implementation of the server workers."""
+    AUTO = "auto"  # uvloop when installed, else asyncio
+    UVLOOP = "uvloop"
+    ASYNCIO = "asyncio"
+
+
+class ServerHttp(str, Enum):
+    """HTTP/1.1 parser of the server workers."""
+    AUTO = "auto"  # httptools when installed, else h11
+    HTTPTOOLS = "httptools"
+    H11 = "h11"
+
+
+class ProfileFormat(str, Enum):
+    """Output of the CPU profiling endpoint."""
+    COLLAPSED = "collapsed"  # sampled collapsed stacks (flamegraph.pl, speedscope)
+    PSTATS = "pstats"  # cProfile stats (pstats.Stats, snakeviz)
+
+
+class ResultOverflow(str, Enum):
+    """What happens to orchestrator results beyond the per-request caps."""
+    SPILL = "spill"  # written to disk, served through a continuation token
+    TRUNCATE = "truncate"  # dropped, the response reports how many
+
+
+class BulkFormat(str, Enum):
+    """Output of the bulk CLI."""
+    NDJSON = "ndjson"  # one Sfera result document per line
+    CSV = "csv"  # one row per (query, module)
+    PARQUET = "parquet"  # dataset directory of Parquet part files, typed columns, one row per (query, module)
+    ARROW = "arrow"  # same dataset as Arrow IPC files (memory-mappable, fastest to load)
+
+
+class NegativeIndexMode(str, Enum):
+    """How recently seen NOT_FOUND results are used."""
+    OFF = "off"  # not recorded
+    OBSERVE = "observe"  # recorded; hits only counted in stats
+    TRUST = "trust"  # modules known to return 204 for a payload are skipped
+
+
+class TransportMode(str, Enum):
+    """Where module HTTP traffic goes."""
+    LIVE = "live"  # real sites
+    RECORD = "record"  # real sites, interactions saved to cassettes
+    REPLAY = "replay"  # served from cassettes, no network
+    ROUTED = "routed"  # everything sent to HTTP_ROUTE_URL (simulated upstream farm)
+
 # Validation Messages
 MSG_FOUND = "Найден"
 MSG_NOT_FOUND = "Не найден"
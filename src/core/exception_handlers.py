@@ -52,9 +52,14 @@ async def sfera_domain_exception_handler(request: Request, exc: DomainException)
         }
     )
     
+    # Tell shed clients when to come back
+    retry_after = getattr(exc, "retry_after", None)
+    headers = {"Retry-After": str(retry_after)} if retry_after else None
+    
     return JSONResponse(
         status_code=exc.code,
-        content=error_response.dict()
+        content=error_response.dict(),
+        headers=headers
     )
 
 
@@ -2,7 +2,7 @@
 
 import logging
 import sys
-from typing import Optional
+from typing import Optional, TextIO
 from contextvars import ContextVar
 
 from src.core.config import get_settings
@@ -10,6 +10,9 @@ from src.core.config import get_settings
 # Context variable for request tracking
 request_context: ContextVar[Optional[str]] = ContextVar("request_context", default=None)
 
+# Context variable for the module being executed ("<family>/<module>", e.g. "email/instagram")
+module_context: ContextVar[Optional[str]] = ContextVar("module_context", default=None)
+
 
 class ContextualFilter(logging.Filter):
     """Add contextual information to log records."""
@@ -29,8 +32,13 @@ class ContextualFilter(logging.Filter):
         return True
 
 
-def setup_logging() -> None:
-    """Configure application logging."""
+def setup_logging(stream: TextIO = sys.stdout) -> None:
+    """
+    Configure application logging.
+    
+    Args:
+        stream: Console stream (stderr for tools that write results to stdout)
+    """
     settings = get_settings()
     
     # Create formatter
@@ -47,7 +55,7 @@ def setup_logging() -> None:
     root_logger.handlers.clear()
     
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = logging.StreamHandler(stream)
     console_handler.setFormatter(formatter)
     console_handler.addFilter(ContextualFilter())
     root_logger.addHandler(console_handler)
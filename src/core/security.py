@@ -0,0 +1,22 @@
+import hmac
+from typing import Optional
+
+from fastapi import Header
+
+from src.core.config import get_settings
+from src.domain.exceptions import AuthenticationException
+
+
+async def require_admin_token(authorization: Optional[str] = Header(None)) -> None:
+    """
+    FastAPI dependency guarding admin endpoints with `Authorization: Bearer <ADMIN_TOKEN>`.
+
+    Raises:
+        AuthenticationException: If ADMIN_TOKEN is unset or the token does not match
+    """
+    expected = get_settings().ADMIN_TOKEN
+    if not expected:
+        raise AuthenticationException("Admin endpoints are disabled: ADMIN_TOKEN is not set")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise AuthenticationException()
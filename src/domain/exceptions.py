@@ -70,4 +70,43 @@ class ExternalServiceException(DomainException):
         message = f"External service '{service_name}' failed"
         if reason:
             message += f": {reason}"
+        super().__init__(message, code=503)
+
+
+class AuthenticationException(DomainException):
+    """Raised when an admin endpoint is called without a valid token."""
+    
+    def __init__(self, message: str = "Invalid or missing admin token"):
+        super().__init__(message, code=401)
+
+
+class ProfilerBusyException(DomainException):
+    """Raised when a profile is requested while another one is running."""
+    
+    def __init__(self, message: str = "Another profile is already running"):
+        super().__init__(message, code=409)
+
+
+class ContinuationExpiredException(DomainException):
+    """Raised when a continuation token is malformed, unknown or expired."""
+    
+    def __init__(self, message: str = "Unknown or expired continuation token"):
+        super().__init__(message, code=410)
+
+
+class HistoryDisabledException(DomainException):
+    """Raised when result history is queried while HISTORY_ENABLED is off."""
+    
+    def __init__(self, message: str = "Result history is not enabled"):
+        super().__init__(message, code=404)
+
+
+class ServiceOverloadedException(DomainException):
+    """Raised when the service is saturated and sheds the request."""
+    
+    def __init__(self, retry_after: int, reason: Optional[str] = None):
+        message = "Service is over capacity, retry later"
+        if reason:
+            message += f": {reason}"
+        self.retry_after = retry_after
         super().__init__(message, code=503)
\ No newline at end of file
@@ -37,6 +37,8 @@ class ModuleResult(BaseModel):
     code: int = Field(..., description="Result code")
     message: str = Field(..., description="Result message")
     records: list[DataRecord] = Field(default_factory=list, description="Found records")
+    latency_ms: Optional[float] = Field(None, description="Module execution time in milliseconds")
+    stale: bool = Field(False, description="Served from cache past its soft TTL while a refresh runs")
     timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0).isoformat())
     
     class Config:
@@ -49,6 +51,8 @@ class AggregatedResponse(BaseModel):
     successful: int = Field(..., description="Number of successful modules")
     failed: int = Field(..., description="Number of failed modules")
     results: dict[str, ModuleResult] = Field(..., description="Results by module name")
+    skipped: dict[str, str] = Field(default_factory=dict, description="Modules not executed, with reason")
+    stopped_early: bool = Field(False, description="Search returned before every module finished")
     timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0).isoformat())
 
 
@@ -67,4 +71,12 @@ class OrchestratorResponse(StandardResponse):
 
 
 class HealthResponse(StandardResponse):
-    """Sfera-compliant health check response."""
\ No newline at end of file
+    """Sfera-compliant health check response."""
+
+
+class HistoryResponse(StandardResponse):
+    """Sfera-compliant result history response."""
+
+
+class AdminResponse(StandardResponse):
+    """Sfera-compliant admin/diagnostics response."""
\ No newline at end of file
@@ -1,13 +1,37 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 from pydantic import BaseModel, Field
 
+from src.core.constants import SearchMode, MODULE_ALL, MODULE_SMART
+
 
 class SearchRequest(BaseModel):
     """Base search request model."""
     payload: str = Field(..., description="Email or phone number to search")
     modules: list[str] = Field(default=["*"], description="List of modules to use (* for all active)")
     timeout: Optional[int] = Field(default=None, description="Maximum execution time in seconds")
+    mode: SearchMode = Field(default=SearchMode.ALL, description="'all' waits for every module, 'any' stops at the first hit")
+    stop_after_found: Optional[int] = Field(default=None, ge=1, description="Stop once this many modules found the payload")
+    module_budget: Optional[int] = Field(default=None, ge=1, description="Smart selection: maximum number of modules (upstream requests)")
+    time_budget: Optional[float] = Field(default=None, gt=0, description="Smart selection: maximum expected module time in seconds")
+    
+    def expands_active(self) -> bool:
+        """Whether modules are expanded from the active set ('*' or 'smart')."""
+        return MODULE_ALL in self.modules or MODULE_SMART in self.modules
+    
+    def wants_smart_selection(self) -> bool:
+        """Whether to run the hit-rate driven subset instead of every active module."""
+        if MODULE_SMART in self.modules:
+            return True
+        return MODULE_ALL in self.modules and (self.module_budget is not None or self.time_budget is not None)
+    
+    def found_target(self) -> Optional[int]:
+        """Number of hits after which the search stops early (None waits for all)."""
+        if self.stop_after_found is not None:
+            return self.stop_after_found
+        if self.mode == SearchMode.ANY:
+            return 1
+        return None
     
     class Config:
         json_schema_extra = {
@@ -39,4 +63,19 @@ class PhoneSearchRequest(SearchRequest):
                 "payload": "79319999999",
                 "modules": ["instagram", "snapchat"]
             }
-        }
\ No newline at end of file
+        }
+
+
+class ParsedPhone(BaseModel):
+    """Phone number parsed once per query and shared by validator and phone search."""
+    e164: str = Field(..., description="Number in E.164 format")
+    country_code: str = Field(..., description="Country calling code without '+'")
+    national_number: str = Field(..., description="National significant number")
+    region: Optional[str] = Field(None, description="ISO 3166-1 region code, e.g. RU")
+    valid: bool = Field(True, description="Whether the number is valid for its region")
+    
+    @classmethod
+    def from_extra(cls, extra: dict[str, Any]) -> Optional["ParsedPhone"]:
+        """Rebuild from validator extra data, or None if it was not produced by the direct validator."""
+        parsed = extra.get("parsed_phone")
+        return cls(**parsed) if isinstance(parsed, dict) else None
@@ -0,0 +1,75 @@
+import json
+from typing import IO, Hashable, Optional
+
+from src.domain.models.orchestrator import ValidatedQuery
+from src.domain.models.response import StandardResponse
+from src.infrastructure.persistence.result_spill import ResultSpillStore
+
+
+class BatchResults:
+    """
+    Results of the queries of one orchestrator batch, by canonical key.
+
+    Lets a later duplicate of a query that already completed reuse its
+    results instead of searching again. Entries are kept serialized: up to
+    max_bytes of them in memory, the rest in a scratch file in the spill
+    directory that is removed on close(), so a long streamed upload does
+    not grow memory with its distinct queries.
+    """
+
+    def __init__(self, max_bytes: int, spill_store: ResultSpillStore):
+        self.max_bytes = max_bytes
+        self.spill_store = spill_store
+        self.memory_bytes = 0
+        self.spilled = 0
+        self._memory: dict[Hashable, bytes] = {}
+        # key -> (offset, length) in the scratch file
+        self._offsets: dict[Hashable, tuple[int, int]] = {}
+        self._scratch: Optional[IO[bytes]] = None
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._memory or key in self._offsets
+
+    def put(self, key: Hashable, source: ValidatedQuery, results: list[StandardResponse]) -> None:
+        """Remember the results `source` got."""
+        payload = (
+            b'{"source":' + source.json().encode()
+            + b',"results":[' + b",".join(result.json().encode() for result in results) + b"]}"
+        )
+        if self.memory_bytes + len(payload) <= self.max_bytes:
+            self._memory[key] = payload
+            self.memory_bytes += len(payload)
+            return
+        if self._scratch is None:
+            self._scratch = self.spill_store.scratch()
+        offset = self._scratch.seek(0, 2)
+        self._scratch.write(payload)
+        self._offsets[key] = (offset, len(payload))
+        self.spilled += 1
+
+    def get(self, key: Hashable) -> Optional[tuple[ValidatedQuery, list[StandardResponse]]]:
+        """
+        Results remembered for a key.
+
+        Returns:
+            Optional[tuple[ValidatedQuery, list[StandardResponse]]]: (query that
+                was searched, its results), or None if the key did not complete yet
+        """
+        payload = self._memory.get(key)
+        if payload is None:
+            location = self._offsets.get(key)
+            if location is None:
+                return None
+            self._scratch.seek(location[0])
+            payload = self._scratch.read(location[1])
+        data = json.loads(payload)
+        return ValidatedQuery(**data["source"]), [StandardResponse(**result) for result in data["results"]]
+
+    def close(self) -> None:
+        """Drop everything, removing the scratch file."""
+        self._memory.clear()
+        self._offsets.clear()
+        self.memory_bytes = 0
+        if self._scratch is not None:
+            self._scratch.close()
+            self._scratch = None
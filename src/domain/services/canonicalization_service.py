@@ -0,0 +1,93 @@
+from typing import Optional
+
+from src.core.config import get_settings
+from src.core.constants import DataType
+from src.core.logging import get_logger
+from src.domain.exceptions import ValidationException
+from src.infrastructure.validators.phone_parser import parse_phone
+
+logger = get_logger(__name__)
+
+# Domains that are aliases of one mailbox namespace
+EMAIL_DOMAIN_ALIASES = {
+    "googlemail.com": "gmail.com",
+}
+
+# Provider local-part rules: (ignore dots, sub-address separator)
+EMAIL_PROVIDER_RULES = {
+    "gmail.com": (True, "+"),
+    "outlook.com": (False, "+"),
+    "hotmail.com": (False, "+"),
+    "live.com": (False, "+"),
+    "icloud.com": (False, "+"),
+    "me.com": (False, "+"),
+    "protonmail.com": (False, "+"),
+    "proton.me": (False, "+"),
+    "pm.me": (False, "+"),
+    "fastmail.com": (False, "+"),
+    "yandex.ru": (False, "+"),
+}
+
+
+class CanonicalizationService:
+    """
+    Builds normalized identity keys for payloads.
+
+    Keys are only used internally (dedup, single-flight, caching); modules
+    always receive the original payload.
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+
+    def canonical_email(self, email: str) -> str:
+        """
+        Canonical key for an email: trimmed, lower-case domain and, with
+        CANONICAL_PROVIDER_RULES, domain aliases and provider local-part
+        rules applied (e.g. 'Foo.Bar+tag@Gmail.com' -> 'foobar@gmail.com').
+
+        Provider rules are off by default: modules check whether the literal
+        address is registered, so a sub-address can have different results
+        than its mailbox.
+        """
+        email = email.strip()
+        if "@" not in email:
+            return email.lower()
+
+        local, domain = email.rsplit("@", 1)
+        domain = domain.lower().rstrip(".")
+        if not self.settings.CANONICAL_PROVIDER_RULES:
+            return f"{local}@{domain}"
+
+        domain = EMAIL_DOMAIN_ALIASES.get(domain, domain)
+        rule = EMAIL_PROVIDER_RULES.get(domain)
+        if rule is not None:
+            ignore_dots, separator = rule
+            local = local.lower().split(separator, 1)[0]
+            if ignore_dots:
+                local = local.replace(".", "")
+        return f"{local}@{domain}"
+
+    def canonical_phone(self, phone: str) -> str:
+        """Canonical key for a phone number: E.164 (cleaned input if unparseable)."""
+        try:
+            return parse_phone(phone).e164
+        except ValidationException:
+            return phone.strip()
+
+    def key_for(self, data_type: str, value: str) -> Optional[str]:
+        """
+        Canonical key for a validated payload.
+
+        Args:
+            data_type: Detected data type ("email", "phone" or "unknown")
+            value: Clean payload from the validator
+
+        Returns:
+            Optional[str]: Key, or None for types that are not deduplicated
+        """
+        if data_type == DataType.EMAIL:
+            return self.canonical_email(value)
+        if data_type == DataType.PHONE:
+            return self.canonical_phone(value)
+        return None
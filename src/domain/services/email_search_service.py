@@ -1,22 +1,40 @@
 import asyncio
+import time
 from typing import Optional
 from datetime import datetime, timezone
 
 from src.core.constants import (
-    ResponseStatus, MODULE_ALL, HTTP_STATUS_OK,
-    HTTP_STATUS_NO_CONTENT, HTTP_STATUS_INTERNAL_ERROR
+    ExecutionMode, ResponseStatus, MODULE_ALL, HTTP_STATUS_OK,
+    HTTP_STATUS_NO_CONTENT, HTTP_STATUS_INTERNAL_ERROR, HTTP_STATUS_GATEWAY_TIMEOUT,
+    MODULE_PRIORITY_NORMAL, MODULE_PRIORITY_REFRESH, MODULE_SMART
 )
-from src.core.logging import get_logger
+from src.core.config import get_settings
+from src.core.logging import get_logger, module_context
 from src.domain.exceptions import (
     ModuleNotFoundException, ModuleInactiveException,
-    NoDataFoundException, RateLimitException, ModuleExecutionException
+    NoDataFoundException, RateLimitException, TimeoutException, ModuleExecutionException
 )
 from src.domain.models.search import EmailSearchRequest
 from src.domain.models.response import ModuleResult, AggregatedResponse, DataRecord
 from src.domain.services.module_adapter_service import ModuleAdapterService
+from src.domain.services.canonicalization_service import CanonicalizationService
+from src.domain.services.module_selection_service import ModuleSelectionService
+from src.domain.services.result_collector import collect_results, is_found
 from src.infrastructure.modules.holehe_modules import (
     get_holehe_module, get_active_holehe_modules, get_all_holehe_modules
 )
+from src.infrastructure.modules.module_rules import filter_by_domain
+from src.infrastructure.admission.admission_controller import get_admission_controller
+from src.infrastructure.execution.module_executor import get_module_executor
+from src.infrastructure.monitoring.blocking_detector import blocking_label, run_labelled
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+from src.infrastructure.persistence.result_history import get_result_history
+from src.infrastructure.scheduling.latency_tracker import get_latency_tracker
+from src.infrastructure.scheduling.module_scheduler import get_module_scheduler
+from src.infrastructure.scheduling.result_cache import get_result_cache
+from src.infrastructure.scheduling.single_flight import SharedExecution, get_single_flight
+from src.infrastructure.scheduling.timeout_policy import get_timeout_policy
+from src.infrastructure.selection.negative_index import get_negative_index
 
 logger = get_logger(__name__)
 
@@ -25,13 +43,32 @@ class EmailSearchService:
     
     def __init__(self):
         self.adapter = ModuleAdapterService()
+        self.scheduler = get_module_scheduler()
+        self.admission = get_admission_controller()
+        self.latency = get_latency_tracker("email")
+        self.timeouts = get_timeout_policy("email")
+        self.selection = ModuleSelectionService("email")
+        self.canonicalizer = CanonicalizationService()
+        self.single_flight = get_single_flight("email")
+        self.executor = get_module_executor()
+        self.settings = get_settings()
+        self.stats = get_stats_registry()
+        self.history = get_result_history()
+        self.negatives = get_negative_index()
+        self.cache = get_result_cache("email")
     
     def _resolve_modules(self, requested_modules: list[str]) -> list[str]:
         """Resolve module list with legacy logic."""
-        if MODULE_ALL in requested_modules:
+        if MODULE_ALL in requested_modules or MODULE_SMART in requested_modules:
             return get_active_holehe_modules()
         return list(set(requested_modules))
     
+    def _segment(self, email: str) -> Optional[str]:
+        """Lower-case email domain (drives domain rules and hit-rate segments)."""
+        if "@" not in email:
+            return None
+        return email.rsplit("@", 1)[1].strip().lower() or None
+    
     def _validate_module(self, module_name: str, enforce_active: bool = True) -> None:
         """Validate module with legacy enforcement."""
         module_config = get_holehe_module(module_name)
@@ -43,11 +80,104 @@ class EmailSearchService:
         if enforce_active and not module_config.active:
             raise ModuleInactiveException(module_name)
     
+    def _module_priority(self, module_name: str) -> int:
+        """Get configured module priority (unknown modules count as normal)."""
+        module_config = get_holehe_module(module_name)
+        return module_config.priority if module_config else MODULE_PRIORITY_NORMAL
+    
+    async def _execute_scheduled(
+        self,
+        module_name: str,
+        email: str,
+        timeout: Optional[float],
+        execution: SharedExecution
+    ) -> ModuleResult:
+        """Execute a module once the scheduler grants it a slot and record its latency."""
+        # Per-module timeout from observed latency, capped by the caller's deadline
+        module_timeout = self.timeouts.timeout_for(module_name, timeout)
+        
+        async with self.scheduler.slot(request=execution.slot):
+            execution.start()
+            started_at = time.monotonic()
+            with blocking_label(f"email/{module_name}"), self.stats.track("modules.email"):
+                result = await self._execute_module(module_name, email, module_timeout)
+            elapsed = time.monotonic() - started_at
+        
+        healthy = result.code in (HTTP_STATUS_OK, HTTP_STATUS_NO_CONTENT)
+        # A timeout only says the latency was at least the timeout: record it censored there
+        timed_out = result.code == HTTP_STATUS_GATEWAY_TIMEOUT and module_timeout is not None
+        self.latency.record(module_name, module_timeout if timed_out else elapsed, healthy=healthy, timed_out=timed_out)
+        result.latency_ms = round(elapsed * 1000, 1)
+        return result
+    
+    async def _execute_shared(
+        self,
+        canonical_key: str,
+        module_name: str,
+        email: str,
+        timeout: Optional[float] = None,
+        started: Optional[set[str]] = None,
+        priority: Optional[int] = None
+    ) -> ModuleResult:
+        """
+        Execute a module, joining an in-flight execution for the same canonical payload.
+        
+        A joining caller raises the execution's priority to its own (e.g. a
+        live search joining a background refresh) and gets the module added
+        to its `started` set once the execution holds a slot.
+        """
+        key = (canonical_key, module_name)
+        execution = self.single_flight.context_of(key) or SharedExecution(module_name)
+        execution.join(self._module_priority(module_name) if priority is None else priority, started)
+        
+        async def execute() -> ModuleResult:
+            result = await self._execute_scheduled(module_name, email, timeout, execution)
+            if self.settings.HISTORY_ENABLED:
+                self.history.record("email", canonical_key, result)
+            if result.code == HTTP_STATUS_NO_CONTENT:
+                self.negatives.add(f"email/{module_name}", canonical_key)
+            if self.settings.RESULT_CACHE_ENABLED and result.code in (HTTP_STATUS_OK, HTTP_STATUS_NO_CONTENT):
+                self.cache.put((canonical_key, module_name), result)
+            return result
+        
+        result = await self.single_flight.do(key, execute, execution)
+        # Callers may annotate their result, so each one gets its own copy
+        return result.copy()
+    
+    def _cached_results(self, canonical_key: str, modules: list[str], email: str) -> dict[str, ModuleResult]:
+        """Cached results to serve instead of running the module; stale ones are refreshed in the background."""
+        if not self.settings.RESULT_CACHE_ENABLED:
+            return {}
+        cached = {}
+        for module in modules:
+            entry = self.cache.get((canonical_key, module))
+            if entry is None:
+                continue
+            cached[module], stale = entry
+            if stale:
+                self.cache.refresh(
+                    (canonical_key, module),
+                    lambda module=module: self._execute_shared(
+                        canonical_key, module, email, priority=MODULE_PRIORITY_REFRESH
+                    )
+                )
+        return cached
+    
+    async def _recorded_results(self, canonical_key: str, modules: list[str]) -> dict[str, ModuleResult]:
+        """Healthy history results recent enough to serve instead of running the module (HISTORY_SERVE_MAX_AGE)."""
+        if not (self.settings.HISTORY_ENABLED and self.settings.HISTORY_SERVE_MAX_AGE):
+            return {}
+        recorded = await self.history.latest(canonical_key, modules, self.settings.HISTORY_SERVE_MAX_AGE)
+        return {
+            module: result for module, result in recorded.items()
+            if result.code in (HTTP_STATUS_OK, HTTP_STATUS_NO_CONTENT)
+        }
+    
     async def _execute_module(
         self,
         module_name: str,
         email: str,
-        timeout: Optional[int] = None
+        timeout: Optional[float] = None
     ) -> ModuleResult:
         """
         Execute single module with legacy-compatible error handling.
@@ -64,9 +194,8 @@ class EmailSearchService:
             # Get client configuration (already filtered of proxy settings)
             client_config = module_config.client or {}
             
-            # Create client with DIRECT CONNECTION only
-            from src.infrastructure.http.client import ModuleCompatibleClient
-            client = ModuleCompatibleClient(
+            # Client settings for a DIRECT CONNECTION only
+            client_kwargs = dict(
                 request_class=client_config.get("request_class"),
                 impersonate=client_config.get("impersonate", "chrome99_android"),
                 timeout=timeout or 10,
@@ -77,7 +206,22 @@ class EmailSearchService:
             output = []
             logger.info(f"Executing module with DIRECT CONNECTION: {module_name} for {email}")
             
-            await module_func(email, client, output)  #   EXACT LEGACY PATTERN
+            # Module label for logs and per-module cassettes
+            label = f"email/{module_name}"
+            context_token = module_context.set(label)
+            try:
+                mode = self.executor.mode_for("email", module_name, module_config)
+                if mode == ExecutionMode.INLINE:
+                    from src.infrastructure.http.client import ModuleCompatibleClient
+                    client = ModuleCompatibleClient(**client_kwargs)
+                    await asyncio.wait_for(run_labelled(module_func(email, client, output), label), timeout or 10)  #   EXACT LEGACY PATTERN
+                else:
+                    # CPU-heavy module: runs on a worker thread loop or in a subprocess
+                    output = await self.executor.run(mode, "email", module_name, (email,), client_kwargs, timeout or 10)
+            except asyncio.TimeoutError:
+                raise TimeoutException(f"Module '{module_name}' timed out after {timeout or 10:.1f}s")
+            finally:
+                module_context.reset(context_token)
             
             # Adapt result using legacy business logic
             records = self.adapter.adapt_holehe_result(output)
@@ -112,6 +256,16 @@ class EmailSearchService:
                 records=[],
                 timestamp= datetime.now(timezone.utc).replace(microsecond=0).isoformat()            )
         
+        except TimeoutException as e:
+            logger.warning(f"Module timed out: {module_name} - {e.message}")
+            return ModuleResult(
+                module_name=module_name,
+                status=ResponseStatus.ERROR,
+                code=e.code,
+                message=e.message,
+                records=[],
+                timestamp= datetime.now(timezone.utc).replace(microsecond=0).isoformat()            )
+        
         except Exception as e:
             logger.error(f"Module execution failed: {module_name} - {str(e)}")
             # Legacy-compatible error response
@@ -132,48 +286,102 @@ class EmailSearchService:
         """
         Perform email search with legacy-compatible aggregation.
         """
-        logger.info(f"Starting email search: {request.payload}")
-        
-        # Resolve modules
-        modules = self._resolve_modules(request.modules)
-        logger.info(f"Executing {len(modules)} modules")
-        
-        # Execute all modules concurrently (legacy pattern)
-        tasks = [
-            self._execute_module(module, request.payload, request.timeout)
-            for module in modules
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-        
-        # Build results with legacy filtering
-        results_dict = {}
-        successful = 0
-        failed = 0
-        
-        for result in results:
-            # Legacy "only_found" filtering
-            if only_found and result.code == HTTP_STATUS_NO_CONTENT:
-                continue
+        with self.stats.track("searches.email"):
+            logger.info(f"Starting email search: {request.payload}")
+            segment = self._segment(request.payload)
+            canonical_key = self.canonicalizer.canonical_email(request.payload)
             
-            results_dict[result.module_name] = result
+            # Resolve modules
+            modules = self._resolve_modules(request.modules)
             
-            if result.status == ResponseStatus.OK and result.code != HTTP_STATUS_NO_CONTENT:
-                successful += 1
-            else:
-                failed += 1
-        
-        logger.info(
-            f"Search completed: {len(results_dict)} results "
-            f"({successful} successful, {failed} failed)"
+            # Provider-specific modules only apply to addresses on their own domains
+            modules, skipped = filter_by_domain(modules, segment, get_holehe_module)
+            if request.expands_active():
+                # Shed low-priority modules when the worker is degraded
+                modules, shed = self.admission.shed_modules(modules, self._module_priority)
+                skipped.update(shed)
+            if request.wants_smart_selection():
+                # Keep only the modules with the best expected hits per module-second
+                modules, unselected, _ = self.selection.select(
+                    modules, segment, request.module_budget, request.time_budget
+                )
+                skipped.update(unselected)
+            # Modules that recently reported this payload as not registered
+            modules, negative = self.negatives.split("email", canonical_key, modules)
+            skipped.update(negative)
+            modules = self.latency.order(modules, self.settings.MODULE_SCHEDULING_POLICY)
+            logger.info(f"Executing {len(modules)} modules")
+            
+            # Cached and recent recorded results stand in for running those modules
+            cached = self._cached_results(canonical_key, modules, request.payload)
+            recorded = await self._recorded_results(canonical_key, [module for module in modules if module not in cached])
+            recorded.update(cached)
+            found_target = request.found_target()
+            if found_target is not None:
+                found_target = max(0, found_target - sum(is_found(result) for result in recorded.values()))
+            
+            # Execute all modules concurrently, bounded by the scheduler
+            started = set()
+            tasks = {
+                module: asyncio.create_task(
+                    self._execute_shared(canonical_key, module, request.payload, request.timeout, started)
+                )
+                for module in modules
+                if module not in recorded
+            }
+            
+            # Wait for all modules, or only until enough of them found the payload
+            results, unfinished = await collect_results(tasks, found_target, started)
+            # Only modules that ran count toward hit rates, not cached or recorded results
+            for result in results:
+                self.selection.record(result.module_name, is_found(result), segment)
+            results.extend(recorded.values())
+            skipped.update(unfinished)
+            
+            # Build results with legacy filtering
+            results_dict = {}
+            successful = 0
+            failed = 0
+            
+            for result in results:
+                # Legacy "only_found" filtering
+                if only_found and result.code == HTTP_STATUS_NO_CONTENT:
+                    continue
+            
+                results_dict[result.module_name] = result
+            
+                if result.status == ResponseStatus.OK and result.code != HTTP_STATUS_NO_CONTENT:
+                    successful += 1
+                else:
+                    failed += 1
+            
+            logger.info(
+                f"Search completed: {len(results_dict)} results "
+                f"({successful} successful, {failed} failed)"
+            )
+            
+            return AggregatedResponse(  #   CHANGED to AggregatedResponse
+                total_modules=len(modules),
+                successful=successful,
+                failed=failed,
+                results=results_dict,
+                skipped=skipped,
+                stopped_early=bool(unfinished),
+                timestamp= datetime.now(timezone.utc).replace(microsecond=0).isoformat()        )
+    
+    def explain_selection(
+        self,
+        email: Optional[str] = None,
+        module_budget: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> dict:
+        """Explain which modules smart selection would run for an email."""
+        segment = self._segment(email) if email else None
+        candidates, _ = filter_by_domain(get_active_holehe_modules(), segment, get_holehe_module)
+        selected, _, ranking = self.selection.select(
+            candidates, segment, module_budget, time_budget, explore=False
         )
-        
-        return AggregatedResponse(  #   CHANGED to AggregatedResponse
-            total_modules=len(modules),
-            successful=successful,
-            failed=failed,
-            results=results_dict,
-            timestamp= datetime.now(timezone.utc).replace(microsecond=0).isoformat()        )
+        return {"segment": segment, "selected": selected, "ranking": ranking}
     
     def get_all_modules(self) -> list[str]:
         return get_all_holehe_modules()
@@ -0,0 +1,132 @@
+import random
+from typing import Any, Optional
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.infrastructure.scheduling.latency_tracker import get_latency_tracker
+from src.infrastructure.selection.hit_rate_tracker import GLOBAL_SEGMENT, get_hit_rate_tracker
+
+logger = get_logger(__name__)
+
+# Latency floor so never-observed or instant modules do not get infinite scores
+MIN_EXPECTED_LATENCY = 0.05  # seconds
+
+
+class ModuleSelectionService:
+    """
+    Hit-rate driven ("smart") module selection.
+
+    Modules are ranked by expected hits per module-second
+    (smoothed FOUND rate / expected latency) and picked greedily until the
+    module or time budget is spent.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.hit_rates = get_hit_rate_tracker(namespace)
+        self.latency = get_latency_tracker(namespace)
+        self.settings = get_settings()
+
+    def record(self, module_name: str, found: bool, segment: Optional[str] = None) -> None:
+        """Record the outcome of a module execution."""
+        self.hit_rates.record(module_name, found, segment)
+
+    def expected_hit_rate(self, module_name: str, segment: Optional[str] = None) -> tuple[float, str]:
+        """
+        Smoothed FOUND rate of a module.
+
+        The global rate is shrunk toward SMART_PRIOR_HIT_RATE; once a segment
+        has enough runs its rate is shrunk toward the global one.
+
+        Returns:
+            tuple[float, str]: (rate, basis: "prior", "global" or "segment")
+        """
+        weight = self.settings.SMART_PRIOR_WEIGHT
+        runs, found = self.hit_rates.counts(module_name)
+        rate = (found + self.settings.SMART_PRIOR_HIT_RATE * weight) / (runs + weight)
+        basis = "global" if runs else "prior"
+
+        if segment:
+            segment_runs, segment_found = self.hit_rates.counts(module_name, segment)
+            if segment_runs >= self.settings.SMART_SEGMENT_MIN_SAMPLES:
+                rate = (segment_found + rate * weight) / (segment_runs + weight)
+                basis = "segment"
+        return rate, basis
+
+    def rank(self, modules: list[str], segment: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Rank modules by expected hits per module-second.
+
+        Args:
+            modules: Candidate module names
+            segment: Email domain or phone country code
+
+        Returns:
+            list[dict[str, Any]]: Candidates with their figures, best first
+        """
+        ranking = []
+        for module_name in modules:
+            rate, basis = self.expected_hit_rate(module_name, segment)
+            latency = max(MIN_EXPECTED_LATENCY, self.latency.expected(module_name))
+            runs, _ = self.hit_rates.counts(module_name, segment or GLOBAL_SEGMENT)
+            ranking.append({
+                "module": module_name,
+                "hit_rate": round(rate, 4),
+                "expected_latency_s": round(latency, 3),
+                "score": round(rate / latency, 4),
+                "basis": basis,
+                "runs": runs,
+            })
+        ranking.sort(key=lambda entry: entry["score"], reverse=True)
+        return ranking
+
+    def select(
+        self,
+        modules: list[str],
+        segment: Optional[str] = None,
+        module_budget: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        explore: bool = True
+    ) -> tuple[list[str], dict[str, str], list[dict[str, Any]]]:
+        """
+        Pick the best subset of modules for the given budget.
+
+        Args:
+            modules: Candidate module names (active modules)
+            segment: Email domain or phone country code
+            module_budget: Maximum number of modules
+            time_budget: Maximum summed expected latency in seconds
+            explore: Randomly include some unselected modules (off for explanations)
+
+        Returns:
+            tuple: (selected modules, unselected module -> reason, ranking with decisions)
+        """
+        if module_budget is None and time_budget is None:
+            module_budget = self.settings.SMART_DEFAULT_MODULE_BUDGET
+
+        selected, unselected = [], {}
+        spent_time = 0.0
+        ranking = self.rank(modules, segment)
+        for entry in ranking:
+            module_name = entry["module"]
+            over_modules = module_budget is not None and len(selected) >= module_budget
+            over_time = time_budget is not None and spent_time + entry["expected_latency_s"] > time_budget
+
+            if not over_modules and not over_time:
+                entry["selected"] = "budget"
+            elif explore and random.random() < self.settings.SMART_EXPLORATION_RATE:
+                # Keep statistics of unselected modules from going stale
+                entry["selected"] = "exploration"
+            else:
+                entry["selected"] = None
+                unselected[module_name] = "not selected: smart budget"
+                continue
+
+            selected.append(module_name)
+            spent_time += entry["expected_latency_s"]
+
+        logger.info(
+            f"Smart selection ({self.namespace}, segment={segment}): "
+            f"{len(selected)}/{len(modules)} modules"
+        )
+        return selected, unselected, ranking
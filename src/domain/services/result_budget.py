@@ -0,0 +1,133 @@
+from typing import Any, Optional
+
+from src.core.constants import ResultOverflow
+from src.core.logging import get_logger
+from src.domain.models.response import StandardResponse
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+from src.infrastructure.persistence.result_spill import ResultSpillStore, SpillWriter
+
+logger = get_logger(__name__)
+
+
+class ResultBudget:
+    """
+    Per-request accounting of orchestrator result memory.
+
+    Results are measured by their JSON size as they complete. Up to
+    max_results / max_bytes of them go inline into the streamed response;
+    past the caps they are spilled to disk (served later through a
+    continuation token) or dropped, depending on the overflow policy.
+    Resident bytes are the inline results serialized but not yet written
+    to the client.
+    """
+
+    def __init__(
+        self,
+        max_results: int,
+        max_bytes: int,
+        overflow: ResultOverflow,
+        spill_store: ResultSpillStore
+    ):
+        self.max_results = max_results
+        self.max_bytes = max_bytes
+        self.overflow = overflow
+        self.spill_store = spill_store
+        self.stats = get_stats_registry()
+        self.total = 0
+        self.total_bytes = 0
+        self.successful = 0
+        self.failed = 0
+        self.inline = 0
+        self.inline_bytes = 0
+        self.dropped = 0
+        self.resident_bytes = 0
+        self.peak_resident_bytes = 0
+        self._spill: Optional[SpillWriter] = None
+
+    @property
+    def overflowed(self) -> bool:
+        return self._spill is not None or self.dropped > 0
+
+    def _fits(self, size: int) -> bool:
+        return self.inline < self.max_results and self.inline_bytes + size <= self.max_bytes
+
+    def admit(self, query_index: int, results: list[StandardResponse]) -> list[bytes]:
+        """
+        Account for the responses of one query.
+
+        Returns:
+            list[bytes]: Serialized results to write inline; call release()
+                once each one has been written
+        """
+        admitted = []
+        for position, result in enumerate(results):
+            payload = result.json().encode()
+            size = len(payload)
+            self.total += 1
+            self.total_bytes += size
+            status = result.body.get("status")
+            if status == "ok":
+                self.successful += 1
+            elif status == "error":
+                self.failed += 1
+
+            if self._fits(size):
+                admitted.append(payload)
+                self.inline += 1
+                self.inline_bytes += size
+                self.resident_bytes += size
+                self.peak_resident_bytes = max(self.peak_resident_bytes, self.resident_bytes)
+                self.stats.adjust("orchestrator.result_bytes", size)
+            elif self.overflow == ResultOverflow.SPILL:
+                if self._spill is None:
+                    self._spill = self.spill_store.create()
+                self._spill.write((query_index, position), payload)
+            else:
+                self.dropped += 1
+        return admitted
+
+    def release(self, size: int) -> None:
+        """An admitted result of `size` bytes has been written out."""
+        self.resident_bytes -= size
+        self.stats.adjust("orchestrator.result_bytes", -size)
+
+    def finish(self) -> dict[str, Any]:
+        """
+        Close the request's accounting.
+
+        Returns:
+            dict: Overflow fields for the response body (continuation token
+                and/or truncation), empty when everything went inline
+        """
+        overflow = {}
+        if self._spill is not None:
+            overflow["continuation"] = self._spill.close()
+            overflow["spilled_results"] = self._spill.count
+            self.stats.incr("orchestrator.spilled_results", self._spill.count)
+        if self.dropped:
+            overflow["truncated"] = True
+            overflow["omitted_results"] = self.dropped
+            self.stats.incr("orchestrator.dropped_results", self.dropped)
+        if self.overflowed:
+            logger.warning(
+                f"Result caps exceeded: {self.total} results / {self.total_bytes} bytes, "
+                f"inline {self.inline}, spilled {self._spill.count if self._spill else 0}, dropped {self.dropped}"
+            )
+        self.stats.peak("orchestrator.request_result_bytes", self.peak_resident_bytes)
+        return overflow
+
+    def abort(self) -> None:
+        """Release the accounting of a request that failed or was abandoned."""
+        self.stats.adjust("orchestrator.result_bytes", -self.resident_bytes)
+        self.resident_bytes = 0
+        if self._spill is not None:
+            self._spill.discard()
+            self._spill = None
+
+    def memory(self) -> dict[str, Any]:
+        """Memory figures of the request for the response metrics."""
+        return {
+            "result_bytes": self.total_bytes,
+            "peak_resident_bytes": self.peak_resident_bytes,
+            "spilled_bytes": self._spill.bytes if self._spill else 0,
+        }
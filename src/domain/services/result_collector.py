@@ -0,0 +1,70 @@
+import asyncio
+from typing import Optional
+
+from src.core.constants import HTTP_STATUS_OK
+from src.core.logging import get_logger
+from src.domain.models.response import ModuleResult
+
+logger = get_logger(__name__)
+
+
+def is_found(result: ModuleResult) -> bool:
+    """Whether a module result reports the payload as registered."""
+    return result.code == HTTP_STATUS_OK and len(result.records) > 0
+
+
+async def collect_results(
+    tasks: dict[str, asyncio.Task],
+    found_target: Optional[int] = None,
+    started: Optional[set[str]] = None
+) -> tuple[list[ModuleResult], dict[str, str]]:
+    """
+    Collect module results, optionally returning as soon as enough modules found the payload.
+
+    Args:
+        tasks: Module name -> running module task
+        found_target: Stop after this many hits (None waits for every module)
+        started: Names of modules that obtained an execution slot, used to
+            tell cancelled modules from ones that never ran
+
+    Returns:
+        tuple[list[ModuleResult], dict[str, str]]: (finished results, module -> reason it has no result)
+    """
+    if found_target is None:
+        return list(await asyncio.gather(*tasks.values())), {}
+
+    results = []
+    found = 0
+    pending = set(tasks.values())
+    try:
+        while pending and found < found_target:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                results.append(result)
+                if is_found(result):
+                    found += 1
+    except asyncio.CancelledError:
+        # Unlike gather, wait does not cancel its children
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    if not pending:
+        return results, {}
+
+    # Condition met: cancel whatever is still queued or running
+    unfinished = {}
+    for module_name, task in tasks.items():
+        if task not in pending:
+            continue
+        if task.done():
+            results.append(task.result())
+        else:
+            task.cancel()
+            ran = started is not None and module_name in started
+            unfinished[module_name] = "cancelled: early exit" if ran else "not run: early exit"
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    logger.info(f"Early exit after {found} hits: {len(unfinished)} modules cancelled or not run")
+    return results, unfinished
@@ -0,0 +1,143 @@
+from functools import lru_cache
+from typing import Callable
+
+from src.core.config import Settings, get_settings
+from src.core.constants import (
+    AdmissionState, MODULE_PRIORITY_LOW, MODULE_PRIORITY_NORMAL, MODULE_PRIORITY_HIGH
+)
+from src.core.logging import get_logger
+from src.domain.exceptions import ServiceOverloadedException
+from src.infrastructure.monitoring.loop_monitor import EventLoopLagMonitor, get_loop_monitor
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+from src.infrastructure.scheduling.module_scheduler import ModuleScheduler, get_module_scheduler
+
+logger = get_logger(__name__)
+
+
+class AdmissionController:
+    """
+    Admission control in front of the search endpoints.
+
+    Load is the highest ratio of pending modules, scheduler queue depth and
+    event loop lag to their configured limits. Past ADMISSION_DEGRADE_RATIO
+    low-priority modules are shed from '*' expansion; at the limit whole
+    requests are rejected with a 503.
+    """
+
+    def __init__(
+        self,
+        scheduler: ModuleScheduler,
+        monitor: EventLoopLagMonitor,
+        settings: Settings
+    ):
+        self.scheduler = scheduler
+        self.monitor = monitor
+        self.settings = settings
+        self.rejected = 0
+
+    def load(self) -> float:
+        """Current load as a fraction of the tightest limit."""
+        pending = self.scheduler.in_flight + self.scheduler.queue_depth
+        return max(
+            pending / max(1, self.settings.ADMISSION_MAX_PENDING_MODULES),
+            self.scheduler.queue_depth / max(1, self.settings.ADMISSION_MAX_QUEUE_DEPTH),
+            self.monitor.lag_ms / max(1, self.settings.ADMISSION_MAX_LOOP_LAG_MS),
+        )
+
+    def state(self) -> AdmissionState:
+        """Classify the current load."""
+        if not self.settings.ADMISSION_ENABLED:
+            return AdmissionState.NORMAL
+        load = self.load()
+        if load >= 1.0:
+            return AdmissionState.OVERLOADED
+        if load >= self.settings.ADMISSION_DEGRADE_RATIO:
+            return AdmissionState.DEGRADED
+        return AdmissionState.NORMAL
+
+    def min_priority(self) -> int:
+        """
+        Lowest module priority still expanded from '*'.
+
+        Shedding is graduated: the first half of the degraded band drops
+        low-priority modules, the second half keeps only high-priority ones.
+        """
+        if self.state() == AdmissionState.NORMAL:
+            return MODULE_PRIORITY_LOW
+        ratio = self.settings.ADMISSION_DEGRADE_RATIO
+        if self.load() < ratio + (1.0 - ratio) / 2:
+            return MODULE_PRIORITY_NORMAL
+        return MODULE_PRIORITY_HIGH
+
+    def check(self) -> None:
+        """
+        Admit or reject a new search.
+
+        Raises:
+            ServiceOverloadedException: If the worker is over capacity
+        """
+        if self.state() != AdmissionState.OVERLOADED:
+            return
+        self.rejected += 1
+        logger.warning(
+            f"Search rejected: in_flight={self.scheduler.in_flight}, "
+            f"queued={self.scheduler.queue_depth}, lag={self.monitor.lag_ms:.0f}ms"
+        )
+        raise ServiceOverloadedException(self.settings.ADMISSION_RETRY_AFTER)
+
+    def stats(self) -> dict:
+        """Admission state for the stats registry."""
+        return {
+            "enabled": self.settings.ADMISSION_ENABLED,
+            "state": self.state().value,
+            "load": round(self.load(), 3),
+            "min_priority": self.min_priority(),
+            "rejected": self.rejected,
+        }
+
+    def shed_modules(
+        self,
+        modules: list[str],
+        priority_of: Callable[[str], int]
+    ) -> tuple[list[str], dict[str, str]]:
+        """
+        Drop modules below the current minimum priority.
+
+        Args:
+            modules: Modules expanded from '*'
+            priority_of: Returns the configured priority of a module
+
+        Returns:
+            tuple[list[str], dict[str, str]]: (kept modules, shed module -> reason)
+        """
+        min_priority = self.min_priority()
+        if min_priority == MODULE_PRIORITY_LOW:
+            return modules, {}
+
+        kept, shed = [], {}
+        for module_name in modules:
+            if priority_of(module_name) >= min_priority:
+                kept.append(module_name)
+            else:
+                shed[module_name] = "shed: service degraded"
+        if shed:
+            logger.info(f"Degraded mode: shed {len(shed)} low-priority modules")
+        return kept, shed
+
+
+@lru_cache()
+def get_admission_controller() -> AdmissionController:
+    """
+    Get the worker-wide admission controller.
+
+    Returns:
+        AdmissionController: Controller bound to the module scheduler and loop monitor
+    """
+    controller = AdmissionController(get_module_scheduler(), get_loop_monitor(), get_settings())
+    get_stats_registry().register("admission", controller.stats)
+    return controller
+
+
+async def enforce_admission() -> None:
+    """FastAPI dependency rejecting searches while the worker is overloaded."""
+    get_admission_controller().check()
@@ -0,0 +1,297 @@
+import asyncio
+import fcntl
+import itertools
+import os
+import socket
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.infrastructure.execution.ipc import encode_frame, ensure_private_dir, read_frame
+
+logger = get_logger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Extra wait for a pooled module beyond its own timeout (IPC, queueing)
+POOL_TIMEOUT_GRACE = 1.0  # seconds
+
+# How long to wait for spawned workers to start listening
+CONNECT_TIMEOUT = 30.0  # seconds
+
+# Delay between reconnect attempts to a lost worker, doubling up to the max
+RECONNECT_BACKOFF_MIN = 0.5  # seconds
+RECONNECT_BACKOFF_MAX = 30.0  # seconds
+
+
+def _listening(socket_path: str) -> bool:
+    """Whether a worker accepts connections on the socket (stale socket files do not)."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(1)
+        try:
+            probe.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+
+class _WorkerConnection:
+    """Connection from this API process to one executor worker."""
+
+    def __init__(self, socket_path: str, on_disconnect: Callable[[], None]):
+        self.socket_path = socket_path
+        self.on_disconnect = on_disconnect
+        self.pending: dict[int, asyncio.Future] = {}
+        self.dispatched = 0
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+        self._reader_task = asyncio.create_task(self._read_replies())
+
+    async def _read_replies(self) -> None:
+        try:
+            while True:
+                request_id, ok, value = await read_frame(self._reader)
+                future = self.pending.get(request_id)
+                if future is None or future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            logger.error(f"Executor worker disconnected: {self.socket_path}")
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Executor worker {self.socket_path} disconnected"))
+            self.on_disconnect()
+
+    def send(self, message: tuple) -> None:
+        self._writer.write(encode_frame(message))
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+        if self._writer is not None:
+            self._writer.close()
+
+
+class ExecutorPool:
+    """
+    Dispatches module work units to executor worker processes over Unix sockets.
+
+    Workers (`executor_worker.py`) are shared by every API process on the
+    host: the first API process to start spawns the missing ones under a
+    file lock, the others just connect. Work goes to the least loaded
+    connected worker; lost workers are reconnected (and respawned) by a
+    background task with exponential backoff, so dispatching never waits
+    on them. Caches, limiters and statistics stay in the API processes.
+    """
+
+    def __init__(self, socket_dir: str, workers: int, max_in_flight: int, spawn: bool, idle_exit: float):
+        self.socket_dir = Path(socket_dir)
+        self.workers = workers
+        self.max_in_flight = max_in_flight
+        self.spawn = spawn
+        self.idle_exit = idle_exit
+        self.connections = [
+            _WorkerConnection(str(self.socket_dir / f"worker-{i}.sock"), self._wake_reconnect)
+            for i in range(workers)
+        ]
+        self._ids = itertools.count()
+        self._capacity = asyncio.Semaphore(workers * max_in_flight)
+        self._disconnected = asyncio.Event()
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    def _wake_reconnect(self) -> None:
+        self._disconnected.set()
+
+    def _spawn_missing(self) -> None:
+        """Spawn workers that are not listening (under a host-wide lock)."""
+        with open(self.socket_dir / "spawn.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            for connection in self.connections:
+                if _listening(connection.socket_path):
+                    continue
+                subprocess.Popen(
+                    [
+                        sys.executable, "-m", "src.infrastructure.execution.executor_worker",
+                        "--socket", connection.socket_path, "--idle-exit", str(self.idle_exit)
+                    ],
+                    cwd=PROJECT_ROOT,
+                    start_new_session=True
+                )
+                logger.info(f"Spawned executor worker for {connection.socket_path}")
+
+    async def _connect(self, connection: _WorkerConnection) -> None:
+        """Connect, waiting for a freshly spawned worker to start listening."""
+        deadline = asyncio.get_running_loop().time() + CONNECT_TIMEOUT
+        while True:
+            try:
+                await connection.connect()
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                if asyncio.get_running_loop().time() > deadline:
+                    raise
+                await asyncio.sleep(0.2)
+
+    async def _reconnect_lost(self) -> None:
+        """Reconnect lost workers (respawning them if allowed), backing off per worker."""
+        loop = asyncio.get_running_loop()
+        backoff = [RECONNECT_BACKOFF_MIN] * len(self.connections)
+        retry_at = [0.0] * len(self.connections)
+        while True:
+            self._disconnected.clear()
+            for i, connection in enumerate(self.connections):
+                if connection.connected:
+                    backoff[i], retry_at[i] = RECONNECT_BACKOFF_MIN, 0.0
+                    continue
+                if retry_at[i] > loop.time():
+                    continue
+                try:
+                    await connection.connect()
+                    logger.info(f"Executor worker reconnected: {connection.socket_path}")
+                    continue
+                except OSError as e:
+                    logger.error(f"Executor worker unavailable: {connection.socket_path} - {str(e)}")
+                if self.spawn:
+                    # Wait for the respawned worker rather than spawning another one on the next retry
+                    await asyncio.to_thread(self._spawn_missing)
+                    try:
+                        await self._connect(connection)
+                        logger.info(f"Executor worker respawned: {connection.socket_path}")
+                        continue
+                    except OSError:
+                        pass
+                retry_at[i] = loop.time() + backoff[i]
+                backoff[i] = min(backoff[i] * 2, RECONNECT_BACKOFF_MAX)
+            
+            lost = [retry_at[i] for i, connection in enumerate(self.connections) if not connection.connected]
+            try:
+                await asyncio.wait_for(
+                    self._disconnected.wait(),
+                    max(0.0, min(lost) - loop.time()) if lost else None
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def start(self) -> None:
+        """Spawn missing workers (if allowed), connect to all of them and watch for lost ones."""
+        ensure_private_dir(str(self.socket_dir))
+        if self.spawn:
+            await asyncio.to_thread(self._spawn_missing)
+        await asyncio.gather(*(self._connect(connection) for connection in self.connections))
+        if self._reconnect_task is None:
+            self._reconnect_task = asyncio.create_task(self._reconnect_lost())
+        logger.info(f"Executor pool connected: {self.workers} workers in {self.socket_dir}")
+
+    def _pick(self) -> _WorkerConnection:
+        """Least loaded connected worker."""
+        available = [connection for connection in self.connections if connection.connected]
+        if not available:
+            self._disconnected.set()
+            raise ConnectionError("No executor workers available")
+        return min(available, key=lambda connection: len(connection.pending))
+
+    async def run(
+        self,
+        family: str,
+        module_name: str,
+        args: tuple,
+        client_kwargs: dict[str, Any],
+        timeout: float
+    ) -> list[dict]:
+        """
+        Run a module in an executor worker and return its output list.
+
+        Raises:
+            asyncio.TimeoutError: If the module did not finish in time
+            ConnectionError: If no worker is reachable or the worker died
+        """
+        async with self._capacity:
+            connection = self._pick()
+            request_id = next(self._ids)
+            future = asyncio.get_running_loop().create_future()
+            connection.pending[request_id] = future
+            connection.dispatched += 1
+            try:
+                connection.send(("run", request_id, family, module_name, args, client_kwargs, timeout))
+                return await asyncio.wait_for(future, timeout + POOL_TIMEOUT_GRACE)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                if connection.connected:
+                    connection.send(("cancel", request_id))
+                raise
+            finally:
+                connection.pending.pop(request_id, None)
+
+    async def stop(self) -> None:
+        """Disconnect; shared workers exit on their own once idle."""
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+            self._reconnect_task = None
+        for connection in self.connections:
+            await connection.close()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Per-worker connection state and load."""
+        return {
+            "socket_dir": str(self.socket_dir),
+            "max_in_flight_per_worker": self.max_in_flight,
+            "workers": [
+                {
+                    "socket": connection.socket_path,
+                    "connected": connection.connected,
+                    "in_flight": len(connection.pending),
+                    "dispatched": connection.dispatched,
+                }
+                for connection in self.connections
+            ],
+        }
+
+
+def default_socket_dir(data_dir: str) -> str:
+    """Per-user socket directory: $XDG_RUNTIME_DIR/holehe-executors, else <DATA_DIR>/executors."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "holehe-executors")
+    return os.path.abspath(os.path.join(data_dir, "executors"))
+
+
+@lru_cache()
+def get_executor_pool() -> ExecutorPool:
+    """
+    Get the executor pool client of this API process.
+
+    Returns:
+        ExecutorPool: Pool configured from EXECUTOR_* settings
+    """
+    settings = get_settings()
+    return ExecutorPool(
+        socket_dir=settings.EXECUTOR_SOCKET_DIR or default_socket_dir(settings.DATA_DIR),
+        workers=settings.EXECUTOR_WORKERS or os.cpu_count() or 1,
+        max_in_flight=settings.EXECUTOR_MAX_IN_FLIGHT,
+        spawn=settings.EXECUTOR_SPAWN,
+        idle_exit=settings.EXECUTOR_IDLE_EXIT
+    )
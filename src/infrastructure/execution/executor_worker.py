@@ -0,0 +1,108 @@
+"""
+Module executor process.
+
+Serves module work units to API processes over a Unix socket and runs them
+concurrently on its own event loop:
+
+    python -m src.infrastructure.execution.executor_worker --socket $XDG_RUNTIME_DIR/holehe-executors/worker-0.sock
+
+Messages (see ipc.py):
+    ("run", id, family, module_name, args, client_kwargs, timeout) -> (id, True, output) | (id, False, error)
+    ("cancel", id)
+"""
+import argparse
+import asyncio
+import os
+import time
+from typing import Optional
+
+from src.core.logging import get_logger, setup_logging
+from src.infrastructure.execution.ipc import encode_frame, ensure_private_dir, picklable_error, read_frame
+from src.infrastructure.execution.module_executor import run_module
+
+logger = get_logger(__name__)
+
+
+class ExecutorWorker:
+    """Runs module work units for any number of connected API processes."""
+
+    def __init__(self, socket_path: str, idle_exit: float):
+        self.socket_path = socket_path
+        self.idle_exit = idle_exit
+        self.connections = 0
+        self.in_flight = 0
+        self._idle_since: Optional[float] = time.monotonic()
+
+    async def _execute(self, message: tuple, writer: asyncio.StreamWriter, lock: asyncio.Lock) -> None:
+        _, request_id, family, module_name, args, client_kwargs, timeout = message
+        self.in_flight += 1
+        try:
+            reply = (request_id, True, await run_module(family, module_name, args, client_kwargs, timeout))
+        except asyncio.CancelledError:
+            # Cancelled by the API process, which no longer waits for a reply
+            return
+        except Exception as e:
+            reply = (request_id, False, picklable_error(e))
+        finally:
+            self.in_flight -= 1
+
+        async with lock:
+            if not writer.is_closing():
+                writer.write(encode_frame(reply))
+                await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one API process connection."""
+        self.connections += 1
+        self._idle_since = None
+        lock = asyncio.Lock()
+        tasks: dict[int, asyncio.Task] = {}
+        try:
+            while True:
+                message = await read_frame(reader)
+                if message[0] == "run":
+                    request_id = message[1]
+                    task = asyncio.create_task(self._execute(message, writer, lock))
+                    tasks[request_id] = task
+                    task.add_done_callback(lambda _, request_id=request_id: tasks.pop(request_id, None))
+                elif message[0] == "cancel":
+                    task = tasks.get(message[1])
+                    if task is not None:
+                        task.cancel()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for task in list(tasks.values()):
+                task.cancel()
+            writer.close()
+            self.connections -= 1
+            if self.connections == 0:
+                self._idle_since = time.monotonic()
+
+    async def serve(self) -> None:
+        ensure_private_dir(os.path.dirname(os.path.abspath(self.socket_path)))
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server = await asyncio.start_unix_server(self.handle, path=self.socket_path)
+        logger.info(f"Executor worker {os.getpid()} listening on {self.socket_path}")
+        async with server:
+            # Exit once no API process has been connected for idle_exit seconds
+            while self._idle_since is None or time.monotonic() - self._idle_since < self.idle_exit:
+                await asyncio.sleep(1)
+        logger.info(f"Executor worker {os.getpid()} idle for {self.idle_exit:.0f}s, exiting")
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Module executor worker")
+    parser.add_argument("--socket", required=True, help="Unix socket path to listen on")
+    parser.add_argument("--idle-exit", type=float, default=60, help="Exit after this many seconds without clients")
+    args = parser.parse_args()
+
+    setup_logging()
+    asyncio.run(ExecutorWorker(args.socket, args.idle_exit).serve())
+
+
+if __name__ == "__main__":
+    main()
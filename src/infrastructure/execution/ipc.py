@@ -0,0 +1,59 @@
+import asyncio
+import os
+import pickle
+import stat
+import struct
+from typing import Any
+
+# Frame: 4-byte big-endian length followed by a pickled message
+_HEADER = struct.Struct(">I")
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Any:
+    """
+    Read one message.
+
+    Raises:
+        asyncio.IncompleteReadError: If the peer closed the connection
+    """
+    header = await reader.readexactly(_HEADER.size)
+    (length,) = _HEADER.unpack(header)
+    return pickle.loads(await reader.readexactly(length))
+
+
+def encode_frame(message: Any) -> bytes:
+    """Serialize one message (local IPC between trusted processes only)."""
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    return _HEADER.pack(len(payload)) + payload
+
+
+def picklable_error(error: BaseException) -> BaseException:
+    """The error itself if it survives pickling, otherwise a RuntimeError with its message."""
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def ensure_private_dir(path: str) -> None:
+    """
+    Create the socket directory, or check an existing one, as private to this user.
+
+    Messages are pickles, so whoever can plant a socket in the directory can
+    run code in the processes that connect to it.
+
+    Raises:
+        PermissionError: If the directory is a symlink, belongs to another
+            user or is accessible to group or others
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"Executor socket directory {path} is not a directory")
+    if info.st_uid != os.getuid():
+        raise PermissionError(f"Executor socket directory {path} is owned by uid {info.st_uid}, not {os.getuid()}")
+    if stat.S_IMODE(info.st_mode) & 0o077:
+        raise PermissionError(
+            f"Executor socket directory {path} has mode {stat.S_IMODE(info.st_mode):o}, expected 700"
+        )
@@ -0,0 +1,237 @@
+import asyncio
+import itertools
+import multiprocessing
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.core.config import get_settings
+from src.core.constants import ExecutionMode
+from src.core.logging import get_logger, module_context
+from src.infrastructure.execution.executor_pool import get_executor_pool
+from src.infrastructure.modules.holehe_modules import ModuleConfig, get_holehe_module, get_ignorant_module
+from src.infrastructure.monitoring.blocking_detector import get_blocking_detector
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+
+logger = get_logger(__name__)
+
+# Extra wait for a process-mode module beyond its own timeout (pickling, queueing)
+PROCESS_TIMEOUT_GRACE = 1.0  # seconds
+
+
+def _module_config(family: str, module_name: str) -> ModuleConfig:
+    lookup = get_holehe_module if family == "email" else get_ignorant_module
+    return lookup(module_name)
+
+
+async def run_module(
+    family: str,
+    module_name: str,
+    args: tuple,
+    client_kwargs: dict[str, Any],
+    timeout: float
+) -> list[dict]:
+    """Run a module coroutine with its own client on the current loop; returns its output."""
+    from src.infrastructure.http.client import ModuleCompatibleClient
+
+    context_token = module_context.set(f"{family}/{module_name}")
+    try:
+        client = ModuleCompatibleClient(**client_kwargs)
+        output = []
+        await asyncio.wait_for(_module_config(family, module_name).func(*args, client, output), timeout)
+        return output
+    finally:
+        module_context.reset(context_token)
+
+
+# Event loop of a process-mode worker, kept across calls
+_process_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run_module_in_process(
+    family: str,
+    module_name: str,
+    args: tuple,
+    client_kwargs: dict[str, Any],
+    timeout: float
+) -> list[dict]:
+    """Process pool entry point."""
+    global _process_loop
+    if _process_loop is None:
+        _process_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_process_loop)
+    return _process_loop.run_until_complete(run_module(family, module_name, args, client_kwargs, timeout))
+
+
+class _LoopThread:
+    """A thread running its own event loop."""
+
+    def __init__(self, name: str):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+
+
+class ModuleExecutor:
+    """
+    Runs modules off the worker's event loop.
+
+    Thread-mode modules run on dedicated worker thread loops, process-mode
+    modules in a subprocess pool and pool-mode modules in the shared
+    executor workers (executor_pool.py); each execution builds its own client
+    there and only the module output comes back. Inline modules never go
+    through the executor.
+    """
+
+    def __init__(self, thread_loops: int, process_workers: int):
+        self.thread_loops = thread_loops
+        self.process_workers = process_workers
+        self.settings = get_settings()
+        self.runs: Counter = Counter()
+        self._threads: list[_LoopThread] = []
+        self._next_thread = itertools.count()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._auto_offloaded: set[str] = set()
+        self._lock = threading.Lock()
+
+    def mode_for(self, family: str, module_name: str, module_config: ModuleConfig) -> ExecutionMode:
+        """
+        Execution mode of a module: settings override, then the executor pool
+        (when enabled), then registry, then automatic offload of modules that
+        keep blocking the event loop.
+        """
+        label = f"{family}/{module_name}"
+        override = self.settings.MODULE_EXECUTION_MODES.get(label)
+        if override is not None:
+            return override
+        if self.settings.EXECUTOR_POOL_ENABLED:
+            return ExecutionMode.POOL
+        if module_config.execution != ExecutionMode.INLINE:
+            return module_config.execution
+
+        threshold = self.settings.AUTO_OFFLOAD_BLOCKING_EVENTS
+        if threshold and label not in self._auto_offloaded:
+            blocking = get_blocking_detector().stats.get(label)
+            if blocking and blocking["count"] >= threshold:
+                self._auto_offloaded.add(label)
+                logger.warning(f"Moving {label} to a worker thread after {blocking['count']} blocking events")
+        return ExecutionMode.THREAD if label in self._auto_offloaded else ExecutionMode.INLINE
+
+    def _thread_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if not self._threads:
+                self._threads = [_LoopThread(f"module-loop-{i}") for i in range(self.thread_loops)]
+                logger.info(f"Started {self.thread_loops} module worker thread loops")
+        return self._threads[next(self._next_thread) % len(self._threads)].loop
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: forking a process that runs threads is unsafe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"Started module process pool: workers={self.process_workers}")
+        return self._pool
+
+    async def run(
+        self,
+        mode: ExecutionMode,
+        family: str,
+        module_name: str,
+        args: tuple,
+        client_kwargs: dict[str, Any],
+        timeout: float
+    ) -> list[dict]:
+        """
+        Run a module off-loop and return its output list.
+
+        Args:
+            mode: THREAD, PROCESS or POOL
+            family: "email" or "phone"
+            module_name: Registry name of the module
+            args: Module arguments before (client, output)
+            client_kwargs: ModuleCompatibleClient arguments
+            timeout: Module timeout in seconds
+
+        Raises:
+            asyncio.TimeoutError: If the module did not finish in time
+        """
+        self.runs[(f"{family}/{module_name}", mode.value)] += 1
+        if mode == ExecutionMode.POOL:
+            return await get_executor_pool().run(family, module_name, args, client_kwargs, timeout)
+        if mode == ExecutionMode.THREAD:
+            future = asyncio.run_coroutine_threadsafe(
+                run_module(family, module_name, args, client_kwargs, timeout),
+                self._thread_loop()
+            )
+            return await asyncio.wrap_future(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._process_pool(), _run_module_in_process,
+            family, module_name, args, client_kwargs, timeout
+        )
+        return await asyncio.wait_for(future, timeout + PROCESS_TIMEOUT_GRACE)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Off-loop executions per module and mode."""
+        return {
+            "thread_loops": len(self._threads),
+            "process_workers": self.process_workers if self._pool is not None else 0,
+            "auto_offloaded": sorted(self._auto_offloaded),
+            "pool": get_executor_pool().snapshot() if self.settings.EXECUTOR_POOL_ENABLED else None,
+            "runs": [
+                {"module": label, "mode": mode, "count": count}
+                for (label, mode), count in self.runs.most_common()
+            ],
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Off-loop capacity for the stats registry."""
+        pool = get_executor_pool().snapshot() if self.settings.EXECUTOR_POOL_ENABLED else None
+        return {
+            "thread_loops": len(self._threads),
+            "process_workers": self.process_workers if self._pool is not None else 0,
+            "auto_offloaded": len(self._auto_offloaded),
+            "pool_workers_connected": sum(w["connected"] for w in pool["workers"]) if pool else None,
+            "pool_in_flight": sum(w["in_flight"] for w in pool["workers"]) if pool else None,
+        }
+
+    def shutdown(self) -> None:
+        """Stop worker thread loops and the process pool."""
+        for thread in self._threads:
+            thread.stop()
+        self._threads = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+@lru_cache()
+def get_module_executor() -> ModuleExecutor:
+    """
+    Get the worker-wide off-loop module executor.
+
+    Returns:
+        ModuleExecutor: Executor sized from OFFLOAD_* settings
+    """
+    settings = get_settings()
+    executor = ModuleExecutor(
+        thread_loops=settings.OFFLOAD_THREAD_LOOPS,
+        process_workers=settings.OFFLOAD_PROCESS_WORKERS or os.cpu_count() or 1
+    )
+    get_stats_registry().register("execution", executor.stats)
+    return executor
@@ -5,6 +5,8 @@ import random
 
 from src.core.logging import get_logger
 from src.core.config import get_settings
+from src.infrastructure.http.replay_transport import build_transport
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
 settings = get_settings()
 logger = get_logger(__name__)
 
@@ -34,6 +36,8 @@ class ConfigurableHTTPClient:
         self.impersonate = impersonate
         self.custom_headers = headers or {}
         self.extra_kwargs = kwargs
+        # Connection profile in the stats registry, e.g. "h2_chrome99_android"
+        self.profile = f"{'h2' if http2 else 'h1'}_{impersonate or 'default'}"
         
         # Build default headers based on impersonation
         self.default_headers = self._build_headers()
@@ -109,27 +113,39 @@ class ConfigurableHTTPClient:
         #   ENSURE NO PROXY IS USED
         client_kwargs["proxies"] = None
         
+        # Record/replay transport (HTTP_TRANSPORT_MODE), None means live traffic
+        transport = build_transport(self.verify_ssl, self.http2)
+        if transport is not None:
+            # The transport owns the protocol choice (and replay needs no h2)
+            client_kwargs["transport"] = transport
+            client_kwargs.pop("http2")
+        
+        # Clients are not pooled: every request holds its own connection while in flight
+        stats = get_stats_registry()
         async with httpx.AsyncClient(**client_kwargs) as client:
             try:
                 logger.debug(f"DIRECT CONNECTION: {method} {url}")
                 
-                response = await client.request(
-                    method=method.upper(),
-                    url=url,
-                    headers=merged_headers,
-                    data=data,
-                    json=json,
-                    params=params,
-                    **kwargs
-                )
+                with stats.track(f"http.{self.profile}"):
+                    response = await client.request(
+                        method=method.upper(),
+                        url=url,
+                        headers=merged_headers,
+                        data=data,
+                        json=json,
+                        params=params,
+                        **kwargs
+                    )
                 
                 logger.debug(f"Response: {method} {url} -> {response.status_code}")
                 return response
                 
             except httpx.TimeoutException:
+                stats.incr(f"http_errors.{self.profile}")
                 logger.error(f"Request timeout: {method} {url}")
                 raise
             except httpx.HTTPError as e:
+                stats.incr(f"http_errors.{self.profile}")
                 logger.error(f"HTTP error: {method} {url} - {str(e)}")
                 raise
     
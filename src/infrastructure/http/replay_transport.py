@@ -0,0 +1,259 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+
+from src.core.config import get_settings
+from src.core.constants import TransportMode
+from src.core.logging import get_logger, module_context
+from src.infrastructure.http.routing_transport import RoutingTransport
+
+logger = get_logger(__name__)
+
+# Bump when the cassette layout changes; older cassettes are ignored
+CASSETTE_VERSION = 1
+
+# Cassette label for traffic made outside a module execution
+UNSCOPED_LABEL = "_unscoped"
+
+# Headers describing the wire encoding; bodies are stored decoded
+WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def _route(url: str) -> str:
+    """URL without query string or fragment (payloads usually live there)."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+
+def _body_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class CassetteStore:
+    """
+    Per-module cassette files: `<HTTP_CASSETTE_DIR>/<family>/<module>.json`.
+
+    Replay first looks for an exact match (method, URL, body hash) and
+    otherwise cycles through the interactions recorded for the same method
+    and route, so a cassette recorded with one payload replays for any other.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._cassettes: dict[str, list[dict[str, Any]]] = {}
+        self._cursors: dict[tuple[str, str, str], int] = {}
+
+    def path(self, label: str) -> Path:
+        return self.directory / f"{label}.json"
+
+    def interactions(self, label: str) -> list[dict[str, Any]]:
+        """Interactions of a cassette (loaded from disk on first use)."""
+        if label not in self._cassettes:
+            self._cassettes[label] = self._load(label)
+        return self._cassettes[label]
+
+    def _load(self, label: str) -> list[dict[str, Any]]:
+        path = self.path(label)
+        if not path.exists():
+            return []
+        try:
+            with open(path, encoding="utf-8") as file:
+                cassette = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load cassette {path}: {str(e)}")
+            return []
+
+        if cassette.get("version") != CASSETTE_VERSION:
+            logger.warning(
+                f"Ignoring cassette {path}: version {cassette.get('version')}, expected {CASSETTE_VERSION}"
+            )
+            return []
+        return cassette.get("interactions", [])
+
+    def append(self, label: str, interaction: dict[str, Any]) -> None:
+        """Add an interaction and rewrite the cassette file."""
+        interactions = self.interactions(label)
+        interactions.append(interaction)
+
+        path = self.path(label)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        cassette = {
+            "version": CASSETTE_VERSION,
+            "module": label,
+            "recorded_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            "interactions": interactions,
+        }
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(cassette, file, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+
+    def find(self, label: str, method: str, url: str, content: bytes) -> Optional[dict[str, Any]]:
+        """
+        Find the recorded interaction for a request.
+
+        Args:
+            label: Cassette label ("<family>/<module>")
+            method: HTTP method
+            url: Full request URL
+            content: Request body
+
+        Returns:
+            Optional[dict[str, Any]]: Interaction, or None if nothing was recorded for the route
+        """
+        interactions = self.interactions(label)
+        body_hash = _body_hash(content)
+        for interaction in interactions:
+            request = interaction["request"]
+            if request["method"] == method and request["url"] == url and request["body_sha256"] == body_hash:
+                return interaction
+
+        route = _route(url)
+        candidates = [
+            interaction for interaction in interactions
+            if interaction["request"]["method"] == method and _route(interaction["request"]["url"]) == route
+        ]
+        if not candidates:
+            return None
+        cursor_key = (label, method, route)
+        cursor = self._cursors.get(cursor_key, 0)
+        self._cursors[cursor_key] = cursor + 1
+        return candidates[cursor % len(candidates)]
+
+
+def _current_label() -> str:
+    return module_context.get() or UNSCOPED_LABEL
+
+
+def _encode_body(content: bytes) -> tuple[str, str]:
+    try:
+        return content.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+def _decode_body(body: str, encoding: str) -> bytes:
+    return base64.b64decode(body) if encoding == "base64" else body.encode("utf-8")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Sends requests to the real sites and saves every exchange to the module's cassette."""
+
+    def __init__(self, store: CassetteStore, transport: httpx.AsyncBaseTransport):
+        self.store = store
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed = time.monotonic() - started_at
+
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in WIRE_HEADERS]
+        body, encoding = _encode_body(content)
+        request_content = await request.aread()
+        self.store.append(_current_label(), {
+            "request": {
+                "method": request.method,
+                "url": str(request.url),
+                "body_sha256": _body_hash(request_content),
+            },
+            "response": {
+                "status": response.status_code,
+                "headers": headers,
+                "body": body,
+                "encoding": encoding,
+            },
+            "elapsed_ms": round(elapsed * 1000, 1),
+        })
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves responses from cassettes without touching the network."""
+
+    def __init__(self, store: CassetteStore):
+        self.store = store
+        self.settings = get_settings()
+
+    def _delay(self, interaction: dict[str, Any]) -> float:
+        """Injected latency in seconds (recorded latency, fixed extra and jitter)."""
+        delay_ms = self.settings.HTTP_REPLAY_LATENCY_MS
+        if self.settings.HTTP_REPLAY_RECORDED_LATENCY:
+            delay_ms += interaction.get("elapsed_ms", 0)
+        jitter_ms = self.settings.HTTP_REPLAY_JITTER_MS
+        if jitter_ms:
+            delay_ms += random.uniform(-jitter_ms, jitter_ms)
+        return max(0.0, delay_ms / 1000)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        label = _current_label()
+        content = await request.aread()
+        interaction = self.store.find(label, request.method, str(request.url), content)
+        if interaction is None:
+            raise httpx.ConnectError(
+                f"No recorded interaction in cassette '{label}' for {request.method} {request.url}",
+                request=request
+            )
+
+        delay = self._delay(interaction)
+        if delay:
+            await asyncio.sleep(delay)
+
+        recorded = interaction["response"]
+        return httpx.Response(
+            recorded["status"],
+            headers=recorded["headers"],
+            content=_decode_body(recorded["body"], recorded["encoding"]),
+            request=request
+        )
+
+
+@lru_cache()
+def get_cassette_store() -> CassetteStore:
+    """
+    Get the cassette store singleton.
+
+    Returns:
+        CassetteStore: Store rooted at HTTP_CASSETTE_DIR
+    """
+    return CassetteStore(get_settings().HTTP_CASSETTE_DIR)
+
+
+def build_transport(verify: bool, http2: bool) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    Transport for the configured HTTP_TRANSPORT_MODE.
+
+    Args:
+        verify: Verify SSL certificates (live traffic only)
+        http2: Enable HTTP/2 (live traffic only)
+
+    Returns:
+        Optional[httpx.AsyncBaseTransport]: Transport, or None for httpx's default (live mode)
+    """
+    settings = get_settings()
+    mode = settings.HTTP_TRANSPORT_MODE
+    if mode == TransportMode.RECORD:
+        return RecordingTransport(get_cassette_store(), httpx.AsyncHTTPTransport(verify=verify, http2=http2))
+    if mode == TransportMode.REPLAY:
+        return ReplayTransport(get_cassette_store())
+    if mode == TransportMode.ROUTED:
+        return RoutingTransport(settings.HTTP_ROUTE_URL, httpx.AsyncHTTPTransport())
+    return None
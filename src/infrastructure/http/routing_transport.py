@@ -0,0 +1,35 @@
+import httpx
+
+from src.core.logging import module_context
+
+# Headers telling the upstream farm who the request was meant for
+UPSTREAM_HOST_HEADER = "x-upstream-host"
+UPSTREAM_MODULE_HEADER = "x-upstream-module"
+
+
+class RoutingTransport(httpx.AsyncBaseTransport):
+    """
+    Sends every request to one base URL (the simulated upstream farm).
+
+    The original host and the executing module are passed along in
+    headers so the farm can apply the module's profile.
+    """
+
+    def __init__(self, route_url: str, transport: httpx.AsyncBaseTransport):
+        self.route_url = httpx.URL(route_url)
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.headers[UPSTREAM_HOST_HEADER] = request.url.host
+        label = module_context.get()
+        if label:
+            request.headers[UPSTREAM_MODULE_HEADER] = label
+        request.url = request.url.copy_with(
+            scheme=self.route_url.scheme,
+            host=self.route_url.host,
+            port=self.route_url.port
+        )
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,66 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from src.core.config import get_settings
+from src.infrastructure.execution.executor_pool import get_executor_pool
+from src.infrastructure.execution.module_executor import get_module_executor
+from src.infrastructure.monitoring.blocking_detector import get_blocking_detector
+from src.infrastructure.monitoring.loop_monitor import get_loop_monitor
+from src.infrastructure.persistence.result_history import get_result_history
+from src.infrastructure.persistence.state_store import get_state_store
+from src.infrastructure.scheduling.result_cache import get_result_cache
+from src.infrastructure.selection.negative_index import get_negative_index
+
+
+@asynccontextmanager
+async def worker_lifecycle() -> AsyncIterator[None]:
+    """
+    Start and stop the background machinery searches rely on.
+
+    Shared by the API lifespan and the bulk CLI, so both search with the
+    same monitoring, admission inputs, executors and persisted state.
+    """
+    settings = get_settings()
+    
+    # Event loop lag feeds admission control
+    loop_monitor = get_loop_monitor()
+    loop_monitor.start()
+    
+    # Attribute event loop stalls to the module or phase that caused them
+    blocking_detector = get_blocking_detector()
+    if settings.BLOCKING_DETECTOR_ENABLED:
+        blocking_detector.start()
+    
+    # Shared executor processes for module work (optional architecture)
+    if settings.EXECUTOR_POOL_ENABLED:
+        await get_executor_pool().start()
+    
+    # Restore persisted worker state (latency windows, ...) and snapshot periodically
+    state_store = get_state_store()
+    state_store.start()
+    
+    # Append-only log of module results
+    if settings.HISTORY_ENABLED:
+        await get_result_history().start()
+    
+    # Recently seen NOT_FOUND results, shared with other processes through DATA_DIR
+    negative_index = get_negative_index()
+    if negative_index.enabled:
+        negative_index.start()
+    
+    try:
+        yield
+    finally:
+        if settings.RESULT_CACHE_ENABLED:
+            for namespace in ("email", "phone"):
+                await get_result_cache(namespace).stop()
+        if negative_index.enabled:
+            await negative_index.stop()
+        if settings.HISTORY_ENABLED:
+            await get_result_history().stop()
+        await state_store.stop()
+        get_module_executor().shutdown()
+        if settings.EXECUTOR_POOL_ENABLED:
+            await get_executor_pool().stop()
+        await blocking_detector.stop()
+        await loop_monitor.stop()
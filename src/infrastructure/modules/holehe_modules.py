@@ -1,6 +1,8 @@
 from typing import Any, Optional
 from pydantic import BaseModel
 
+from src.core.constants import ExecutionMode, MODULE_PRIORITY_NORMAL
+
 # Import the module mappings from the script files
 from src.infrastructure.modules.holehe_modules_script import module_mapping as holehe_module_mapping
 from src.infrastructure.modules.ignorant_modules_script import module_mapping as ignorant_module_mapping
@@ -13,6 +15,10 @@ class ModuleConfig(BaseModel):
     description: str
     method: Optional[str] = None
     client: Optional[dict] = None
+    priority: int = MODULE_PRIORITY_NORMAL
+    domains: Optional[list[str]] = None  # email domains the module applies to (None = domain-agnostic)
+    regions: Optional[list[str]] = None  # phone regions (ISO codes) the module applies to (None = all)
+    execution: ExecutionMode = ExecutionMode.INLINE  # inline, thread or process
     
     class Config:
         arbitrary_types_allowed = True
@@ -46,7 +52,10 @@ for module_name, config in holehe_module_mapping.items():
         active=config["active"],
         description=config["description"],
         method=config.get("method"),
-        client=_filter_proxy_settings(config.get("client"))  #   FILTER PROXY SETTINGS
+        client=_filter_proxy_settings(config.get("client")),  #   FILTER PROXY SETTINGS
+        priority=config.get("priority", MODULE_PRIORITY_NORMAL),
+        domains=config.get("domains"),
+        execution=config.get("execution", ExecutionMode.INLINE)
     )
 
 
@@ -59,7 +68,10 @@ for module_name, config in ignorant_module_mapping.items():
         active=config["active"],
         description=config["description"],
         method=config.get("method"),
-        client=_filter_proxy_settings(config.get("client"))  #   FILTER PROXY SETTINGS
+        client=_filter_proxy_settings(config.get("client")),  #   FILTER PROXY SETTINGS
+        priority=config.get("priority", MODULE_PRIORITY_NORMAL),
+        regions=[region.upper() for region in config["regions"]] if config.get("regions") else None,
+        execution=config.get("execution", ExecutionMode.INLINE)
     )
 
 
@@ -122,6 +122,7 @@ from holehe.modules.software.office365 import office365
 from holehe.modules.sport.bodybuilding import bodybuilding
 from holehe.modules.transport.blablacar import blablacar
 from pydash import get
+from src.core.constants import MODULE_PRIORITY_LOW, MODULE_PRIORITY_HIGH
 from src.infrastructure.modules.requests_logic import (
     RequestBaseParamsAsync,
     RequestBaseParamsCFFIAsync,
@@ -139,6 +140,7 @@ module_mapping = {
     "adobe": {
         "func": adobe,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "adobe.com",
         "method": "password recovery",
         "client": {
@@ -151,6 +153,7 @@ module_mapping = {
     "amazon": {
         "func": amazon,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "amazon.com",
         "method": "login",
     },
@@ -175,6 +178,7 @@ module_mapping = {
     "armurerieauxerre": {
         "func": armurerieauxerre,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "armurerie-auxerre.com",
         "method": "register",
     },
@@ -193,6 +197,7 @@ module_mapping = {
     "babeshows": {
         "func": babeshows,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "babeshows.co.uk",
         "method": "register",
     },
@@ -205,12 +210,14 @@ module_mapping = {
     "biosmods": {
         "func": biosmods,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "bios-mods.com",
         "method": "register",
     },
     "biotechnologyforums": {
         "func": biotechnologyforums,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "biotechnologyforums.com",
         "method": "register",
     },
@@ -235,6 +242,7 @@ module_mapping = {
     "blip": {
         "func": blip,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "blip.fm",
         "method": "register",
         "client": {"request_class": RequestBaseParamsAsync, "use_proxy": True},
@@ -242,12 +250,14 @@ module_mapping = {
     "blitzortung": {
         "func": blitzortung,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "forum.blitzortung.org",
         "method": "register",
     },
     "bluegrassrivals": {
         "func": bluegrassrivals,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "bluegrassrivals.com",
         "method": "register",
     },
@@ -266,6 +276,7 @@ module_mapping = {
     "cambridgemt": {
         "func": cambridgemt,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "discussion.cambridge-mt.com",
         "method": "register",
     },
@@ -278,12 +289,14 @@ module_mapping = {
     "chinaphonearena": {
         "func": chinaphonearena,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "chinaphonearena.com",
         "method": "register",
     },
     "clashfarmer": {
         "func": clashfarmer,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "clashfarmer.com",
         "method": "register",
         "client": {"request_class": RequestBaseParamsAsync, "use_proxy": True},
@@ -298,6 +311,7 @@ module_mapping = {
     "codeigniter": {
         "func": codeigniter,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "forum.codeigniter.com",
         "method": "register",
     },
@@ -347,6 +361,7 @@ module_mapping = {
     "demonforums": {
         "func": demonforums,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "demonforums.net",
         "method": "register",
         "client": {"request_class": RequestBaseParamsAsync, "use_proxy": True},
@@ -366,6 +381,7 @@ module_mapping = {
     "discord": {
         "func": discord,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "discord.com",
         "method": "register",
     },
@@ -450,6 +466,7 @@ module_mapping = {
     "freiberg": {
         "func": freiberg,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "drachenhort.user.stunet.tu-freiberg.de",
         "method": "register",
     },
@@ -511,6 +528,7 @@ module_mapping = {
     "koditv": {
         "func": koditv,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "forum.kodi.tv",
         "method": "register",
     },
@@ -524,6 +542,7 @@ module_mapping = {
     "laposte": {
         "func": laposte,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "laposte.fr",
         "method": "register",
     },
@@ -542,12 +561,15 @@ module_mapping = {
     "mail_ru": {
         "func": mail_ru,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "mail.ru",
+        "domains": ["mail.ru", "inbox.ru", "list.ru", "bk.ru", "internet.ru", "mail.ua"],
         "method": "password recovery",
     },
     "mybb": {
         "func": mybb,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "community.mybb.com",
         "method": "register",
     },
@@ -566,18 +588,21 @@ module_mapping = {
     "naturabuy": {
         "func": naturabuy,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "naturabuy.fr",
         "method": "register",
     },
     "ndemiccreations": {
         "func": ndemiccreations,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "forum.ndemiccreations.com",
         "method": "register",
     },
     "nextpvr": {
         "func": nextpvr,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "forums.nextpvr.com",
         "method": "register",
     },
@@ -608,6 +633,7 @@ module_mapping = {
     "odnoklassniki": {
         "func": odnoklassniki,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "ok.ru",
         "method": "password recovery",
     },
@@ -638,6 +664,7 @@ module_mapping = {
     "pinterest": {
         "func": pinterest,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "pinterest.com",
         "method": "register",
     },
@@ -662,6 +689,7 @@ module_mapping = {
     "protonmail": {
         "func": protonmail,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "protonmail.ch",
         "method": "other",
         "client": {
@@ -686,7 +714,9 @@ module_mapping = {
     "rambler": {
         "func": rambler,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "rambler.ru",
+        "domains": ["rambler.ru", "rambler.ua", "lenta.ru", "autorambler.ru", "myrambler.ru", "ro.ru"],
         "method": "register",
     },
     "redtube": {
@@ -723,6 +753,7 @@ module_mapping = {
     "seoclerks": {
         "func": seoclerks,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "seoclerks.com",
         "method": "register",
     },
@@ -760,12 +791,14 @@ module_mapping = {
     "sporcle": {
         "func": sporcle,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "sporcle.com",
         "method": "register",
     },
     "spotify": {
         "func": spotify,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "spotify.com",
         "method": "register",
     },
@@ -802,12 +835,14 @@ module_mapping = {
     "thecardboard": {
         "func": thecardboard,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "thecardboard.org",
         "method": "register",
     },
     "therianguide": {
         "func": therianguide,
         "active": True,
+        "priority": MODULE_PRIORITY_LOW,
         "description": "forums.therian-guide.com",
         "method": "register",
     },
@@ -832,6 +867,7 @@ module_mapping = {
     "twitter": {
         "func": twitter,
         "active": True,
+        "priority": MODULE_PRIORITY_HIGH,
         "description": "twitter.com",
         "method": "register",
         "client": {
@@ -918,6 +954,7 @@ module_mapping = {
         "func": yahoo,
         "active": False,
         "description": "yahoo.com",
+        "domains": ["yahoo.*", "ymail.com", "rocketmail.com"],
         "method": "login",
     },
     "zoho": {
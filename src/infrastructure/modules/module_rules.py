@@ -0,0 +1,92 @@
+from fnmatch import fnmatchcase
+from typing import Callable, Optional
+
+from src.infrastructure.modules.holehe_modules import ModuleConfig
+
+
+def domain_matches(domain: str, patterns: list[str]) -> bool:
+    """
+    Check an email domain against module domain patterns.
+
+    Args:
+        domain: Lower-case email domain, e.g. "bk.ru"
+        patterns: Exact domains or shell-style patterns, e.g. "yahoo.*"
+
+    Returns:
+        bool: True if any pattern matches
+    """
+    return any(fnmatchcase(domain, pattern) for pattern in patterns)
+
+
+def applies_to_domain(module_config: Optional[ModuleConfig], domain: Optional[str]) -> bool:
+    """
+    Whether a module can say anything about an address on the given domain.
+
+    Unknown modules and domain-agnostic modules (no `domains` rule) always
+    apply, so validation errors are still reported by the executor.
+    """
+    if module_config is None or not module_config.domains or not domain:
+        return True
+    return domain_matches(domain, module_config.domains)
+
+
+def filter_by_domain(
+    modules: list[str],
+    domain: Optional[str],
+    get_config: Callable[[str], Optional[ModuleConfig]]
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Drop modules whose domain rules exclude the address.
+
+    Args:
+        modules: Resolved module names
+        domain: Lower-case email domain
+        get_config: Module registry lookup
+
+    Returns:
+        tuple[list[str], dict[str, str]]: (applicable modules, skipped module -> reason)
+    """
+    applicable, skipped = [], {}
+    for module_name in modules:
+        if applies_to_domain(get_config(module_name), domain):
+            applicable.append(module_name)
+        else:
+            skipped[module_name] = f"skipped: not applicable to domain {domain}"
+    return applicable, skipped
+
+
+def applies_to_region(module_config: Optional[ModuleConfig], region: Optional[str]) -> bool:
+    """
+    Whether a phone module covers numbers from the given region.
+
+    Modules without a `regions` rule are region-agnostic; numbers whose
+    region cannot be determined are sent to every module.
+    """
+    if module_config is None or not module_config.regions or not region:
+        return True
+    return region.upper() in module_config.regions
+
+
+def filter_by_region(
+    modules: list[str],
+    region: Optional[str],
+    get_config: Callable[[str], Optional[ModuleConfig]]
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Drop modules whose region rules exclude the phone number.
+
+    Args:
+        modules: Resolved module names
+        region: ISO 3166-1 region code of the number, e.g. "RU"
+        get_config: Module registry lookup
+
+    Returns:
+        tuple[list[str], dict[str, str]]: (applicable modules, skipped module -> reason)
+    """
+    applicable, skipped = [], {}
+    for module_name in modules:
+        if applies_to_region(get_config(module_name), region):
+            applicable.append(module_name)
+        else:
+            skipped[module_name] = f"skipped: not applicable to region {region}"
+    return applicable, skipped
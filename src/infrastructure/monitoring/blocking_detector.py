@@ -0,0 +1,212 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Awaitable, Iterator, Optional, TypeVar
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Innermost frames kept from a sampled stack
+STACK_DEPTH = 6
+
+# task -> stack of labels ("email/instagram", "validation", ...)
+_task_labels: dict[asyncio.Task, list[str]] = {}
+
+
+@contextmanager
+def blocking_label(label: str) -> Iterator[None]:
+    """
+    Attribute event loop blocking in the current task to `label`.
+
+    Labels nest; the innermost one wins.
+    """
+    task = asyncio.current_task()
+    if task is None:
+        yield
+        return
+    labels = _task_labels.setdefault(task, [])
+    labels.append(label)
+    try:
+        yield
+    finally:
+        labels.pop()
+        if not labels:
+            _task_labels.pop(task, None)
+
+
+async def run_labelled(awaitable: Awaitable[T], label: str) -> T:
+    """Await `awaitable` with blocking attributed to `label` (for work wrapped in new tasks)."""
+    with blocking_label(label):
+        return await awaitable
+
+
+def _label_of(task: Optional[asyncio.Task]) -> str:
+    if task is None:
+        return "loop callbacks"
+    labels = _task_labels.get(task)
+    if labels:
+        return labels[-1]
+    coro = task.get_coro()
+    return f"unlabelled: {getattr(coro, '__qualname__', type(coro).__name__)}"
+
+
+def _format_frame(frame: traceback.FrameSummary) -> str:
+    parts = frame.filename.split(os.sep)
+    return f"{'/'.join(parts[-2:])}:{frame.lineno} in {frame.name}"
+
+
+class BlockingDetector:
+    """
+    Finds what blocks the event loop.
+
+    A heartbeat on the loop measures how late it wakes up. While the loop is
+    stalled, a watchdog thread samples the task the loop is running (mapped to
+    a module or phase label) and its stack; once the loop resumes, a stall
+    longer than the threshold is attributed to the most sampled label.
+    """
+
+    def __init__(self, threshold: float, interval: float, max_events: int):
+        self.threshold = threshold
+        self.interval = interval
+        self.stats: dict[str, dict[str, Any]] = {}
+        self.events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._beat = time.monotonic()
+        self._samples: list[tuple[str, list[str]]] = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _sample(self) -> tuple[str, list[str]]:
+        """Label and innermost stack frames of what the loop thread is running."""
+        current_tasks = getattr(asyncio.tasks, "_current_tasks", {})
+        label = _label_of(current_tasks.get(self._loop))
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = [_format_frame(f) for f in traceback.extract_stack(frame)[-STACK_DEPTH:]] if frame else []
+        return label, stack
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            if time.monotonic() - self._beat - self.interval < self.threshold:
+                continue
+            sample = self._sample()
+            with self._lock:
+                self._samples.append(sample)
+
+    def _record(self, blocked: float) -> None:
+        with self._lock:
+            samples, self._samples = self._samples, []
+
+        if samples:
+            label = Counter(label for label, _ in samples).most_common(1)[0][0]
+            stack = next(stack for sample_label, stack in samples if sample_label == label)
+        else:
+            # Stall ended before the watchdog got to look
+            label, stack = "unattributed", []
+
+        blocked_ms = round(blocked * 1000, 1)
+        timestamp = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+        stats = self.stats.setdefault(label, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] = round(stats["total_ms"] + blocked_ms, 1)
+        stats["max_ms"] = max(stats["max_ms"], blocked_ms)
+        stats["last_at"] = timestamp
+        stats["last_stack"] = stack
+        self.events.append({"label": label, "blocked_ms": blocked_ms, "at": timestamp, "stack": stack})
+        logger.warning(f"Event loop blocked for {blocked_ms:.0f}ms by {label}")
+
+    async def _heartbeat(self) -> None:
+        while True:
+            started = time.monotonic()
+            self._beat = started
+            await asyncio.sleep(self.interval)
+            blocked = time.monotonic() - started - self.interval
+            if blocked >= self.threshold:
+                self._record(blocked)
+            else:
+                with self._lock:
+                    self._samples.clear()
+
+    def start(self) -> None:
+        """Start the heartbeat on the running loop and the watchdog thread."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="blocking-detector", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Blocking detector started: threshold={self.threshold * 1000:.0f}ms, "
+            f"interval={self.interval * 1000:.0f}ms"
+        )
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the watchdog thread."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def totals(self) -> dict[str, Any]:
+        """Blocking totals for the stats registry."""
+        return {
+            "running": self.running,
+            "events": sum(stats["count"] for stats in self.stats.values()),
+            "blocked_ms": round(sum(stats["total_ms"] for stats in self.stats.values()), 1),
+        }
+
+    def snapshot(self) -> dict[str, Any]:
+        """Per-label totals (worst offenders first) and recent blocking events."""
+        offenders = sorted(self.stats.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        return {
+            "running": self.running,
+            "threshold_ms": self.threshold * 1000,
+            "offenders": [{"label": label, **stats} for label, stats in offenders],
+            "recent": list(self.events),
+        }
+
+
+@lru_cache()
+def get_blocking_detector() -> BlockingDetector:
+    """
+    Get the worker-wide blocking detector.
+
+    Returns:
+        BlockingDetector: Detector configured from BLOCKING_* settings
+    """
+    settings = get_settings()
+    detector = BlockingDetector(
+        threshold=settings.BLOCKING_THRESHOLD_MS / 1000,
+        interval=settings.BLOCKING_SAMPLE_INTERVAL_MS / 1000,
+        max_events=settings.BLOCKING_MAX_EVENTS
+    )
+    get_stats_registry().register("event_loop.blocking", detector.totals)
+    return detector
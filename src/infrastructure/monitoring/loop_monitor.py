@@ -0,0 +1,78 @@
+import asyncio
+from functools import lru_cache
+from typing import Optional
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+
+logger = get_logger(__name__)
+
+
+class EventLoopLagMonitor:
+    """
+    Measures event loop lag by timing how late a periodic sleep wakes up.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.lag: float = 0.0
+        self.peak_lag: float = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def lag_ms(self) -> float:
+        """Most recent lag sample in milliseconds."""
+        return self.lag * 1000
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag = max(0.0, loop.time() - started - self.interval)
+            self.peak_lag = max(self.peak_lag, self.lag)
+
+    def stats(self) -> dict:
+        """Lag figures for the stats registry."""
+        return {
+            "running": self.running,
+            "lag_ms": round(self.lag_ms, 1),
+            "peak_lag_ms": round(self.peak_lag * 1000, 1),
+        }
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Event loop lag monitor started: interval={self.interval * 1000:.0f}ms")
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+@lru_cache()
+def get_loop_monitor() -> EventLoopLagMonitor:
+    """
+    Get the worker-wide event loop lag monitor.
+
+    Returns:
+        EventLoopLagMonitor: Monitor sampling every LOOP_LAG_INTERVAL_MS
+    """
+    settings = get_settings()
+    monitor = EventLoopLagMonitor(settings.LOOP_LAG_INTERVAL_MS / 1000)
+    get_stats_registry().register("event_loop", monitor.stats)
+    return monitor
@@ -0,0 +1,228 @@
+import asyncio
+import cProfile
+import marshal
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from functools import lru_cache
+from types import FrameType
+from typing import Any, Optional
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.domain.exceptions import ProfilerBusyException
+
+logger = get_logger(__name__)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    parts = code.co_filename.split(os.sep)
+    return f"{code.co_name} ({'/'.join(parts[-2:])}:{code.co_firstlineno})"
+
+
+def _collapse(frames: list[FrameType]) -> str:
+    """Frames (outermost first) as one collapsed-stack line prefix."""
+    return ";".join(_frame_label(frame) for frame in frames)
+
+
+def _await_stack(coro: Any) -> list[FrameType]:
+    """Frames of a suspended coroutine and everything it awaits (outermost first)."""
+    frames = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return frames
+
+
+def _thread_stack(frame: Optional[FrameType]) -> list[FrameType]:
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+class Profiler:
+    """
+    On-demand, time-boxed profiling of the worker.
+
+    Nothing is installed until a profile is requested: the sampler thread,
+    task sampling, cProfile and tracemalloc only run for the requested
+    window, one profile at a time.
+    """
+
+    def __init__(self, max_seconds: float, interval: float):
+        self.max_seconds = max_seconds
+        self.interval = interval
+        self._lock = asyncio.Lock()
+
+    def _window(self, seconds: float) -> float:
+        return max(0.1, min(seconds, self.max_seconds))
+
+    async def _exclusive(self) -> None:
+        if self._lock.locked():
+            raise ProfilerBusyException()
+        await self._lock.acquire()
+
+    def _sample_thread(self, thread_id: int, stop: threading.Event, samples: Counter) -> None:
+        """Sample the stack of the loop thread until stopped."""
+        while not stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                samples[_collapse(_thread_stack(frame))] += 1
+
+    async def _sample_tasks(self, samples: Counter) -> None:
+        """Sample the await stacks of every task on the loop."""
+        current = asyncio.current_task()
+        while True:
+            await asyncio.sleep(self.interval)
+            for task in asyncio.all_tasks():
+                if task is current:
+                    continue
+                stack = _await_stack(task.get_coro())
+                if stack:
+                    samples[f"[task];{_collapse(stack)}"] += 1
+
+    async def sample(self, seconds: float, tasks: bool = False) -> str:
+        """
+        Sampling CPU profile of the event loop thread.
+
+        Args:
+            seconds: Profiling window (capped by PROFILE_MAX_SECONDS)
+            tasks: Also sample the await stacks of all asyncio tasks
+
+        Returns:
+            str: Collapsed stacks ("frame;frame;frame count" per line),
+                ready for flamegraph.pl or speedscope
+
+        Raises:
+            ProfilerBusyException: If another profile is running
+        """
+        await self._exclusive()
+        try:
+            seconds = self._window(seconds)
+            samples: Counter = Counter()
+            stop = threading.Event()
+            sampler = threading.Thread(
+                target=self._sample_thread,
+                args=(threading.get_ident(), stop, samples),
+                name="profiler",
+                daemon=True
+            )
+            task_sampler = asyncio.create_task(self._sample_tasks(samples)) if tasks else None
+            logger.warning(f"Sampling profile started: {seconds:.1f}s, tasks={tasks}")
+            sampler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                stop.set()
+                if task_sampler is not None:
+                    task_sampler.cancel()
+                await asyncio.to_thread(sampler.join)
+            return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+        finally:
+            self._lock.release()
+
+    async def deterministic(self, seconds: float) -> bytes:
+        """
+        cProfile of the event loop thread.
+
+        Args:
+            seconds: Profiling window (capped by PROFILE_MAX_SECONDS)
+
+        Returns:
+            bytes: Marshalled stats, readable with pstats.Stats(path)
+
+        Raises:
+            ProfilerBusyException: If another profile is running
+        """
+        await self._exclusive()
+        try:
+            seconds = self._window(seconds)
+            profile = cProfile.Profile()
+            logger.warning(f"cProfile started: {seconds:.1f}s")
+            profile.enable()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profile.disable()
+            profile.create_stats()
+            return marshal.dumps(profile.stats)
+        finally:
+            self._lock.release()
+
+    async def memory(self, seconds: float, top: int = 30, frames: int = 1) -> dict[str, Any]:
+        """
+        Memory growth over a window: diff of two tracemalloc snapshots.
+
+        Args:
+            seconds: Window between the snapshots (capped by PROFILE_MAX_SECONDS)
+            top: Number of largest differences returned
+            frames: Traceback depth recorded per allocation
+
+        Returns:
+            dict: Allocation differences grouped by traceback, largest growth first
+
+        Raises:
+            ProfilerBusyException: If another profile is running
+        """
+        await self._exclusive()
+        try:
+            seconds = self._window(seconds)
+            started_here = not tracemalloc.is_tracing()
+            if started_here:
+                tracemalloc.start(max(1, frames))
+            logger.warning(f"tracemalloc diff started: {seconds:.1f}s")
+            try:
+                before = tracemalloc.take_snapshot()
+                started = time.monotonic()
+                await asyncio.sleep(seconds)
+                after = tracemalloc.take_snapshot()
+                traced, peak = tracemalloc.get_traced_memory()
+            finally:
+                if started_here:
+                    tracemalloc.stop()
+
+            # Allocations made by tracemalloc itself are noise
+            noise = (tracemalloc.Filter(False, tracemalloc.__file__),)
+            differences = after.filter_traces(noise).compare_to(before.filter_traces(noise), "traceback")
+            return {
+                "window_s": round(time.monotonic() - started, 1),
+                "traced_mb": round(traced / 1024 / 1024, 2),
+                "peak_mb": round(peak / 1024 / 1024, 2),
+                "growth_kb": round(sum(stat.size_diff for stat in differences) / 1024, 1),
+                "top": [
+                    {
+                        "size_diff_kb": round(stat.size_diff / 1024, 1),
+                        "size_kb": round(stat.size / 1024, 1),
+                        "count_diff": stat.count_diff,
+                        "traceback": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+                    }
+                    for stat in differences[:top]
+                ],
+            }
+        finally:
+            self._lock.release()
+
+
+@lru_cache()
+def get_profiler() -> Profiler:
+    """
+    Get the worker-wide on-demand profiler.
+
+    Returns:
+        Profiler: Profiler configured from PROFILE_* settings
+    """
+    settings = get_settings()
+    return Profiler(
+        max_seconds=settings.PROFILE_MAX_SECONDS,
+        interval=settings.PROFILE_SAMPLE_INTERVAL_MS / 1000
+    )
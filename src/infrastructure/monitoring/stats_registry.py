@@ -0,0 +1,133 @@
+import os
+import resource
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Iterator
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _nest(flat: dict[str, Any]) -> dict[str, Any]:
+    """{"searches.email": 1} -> {"searches": {"email": 1}}"""
+    nested: dict[str, Any] = {}
+    for name, value in flat.items():
+        node = nested
+        *parents, leaf = name.split(".")
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        if isinstance(value, dict) and isinstance(node.get(leaf), dict):
+            node[leaf].update(value)
+        else:
+            node[leaf] = value
+    return nested
+
+
+def cache_stats(info: Any) -> dict[str, Any]:
+    """Size and hit rate of an lru_cache from its cache_info()."""
+    lookups = info.hits + info.misses
+    return {
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 3) if lookups else None,
+    }
+
+
+def process_stats() -> dict[str, Any]:
+    """RSS memory, open file descriptors and threads of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            rss_bytes = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Peak instead of current RSS where /proc is unavailable
+        rss_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    try:
+        open_fds = len(os.listdir("/proc/self/fd"))
+    except OSError:
+        open_fds = None
+    return {
+        "pid": os.getpid(),
+        "rss_mb": round(rss_bytes / 1024 / 1024, 1),
+        "open_fds": open_fds,
+        "fd_limit": resource.getrlimit(resource.RLIMIT_NOFILE)[0],
+        "threads": threading.active_count(),
+    }
+
+
+class StatsRegistry:
+    """
+    Live runtime state of the worker for /status.
+
+    Hot paths only touch counters and in-flight gauges (plain dict updates
+    on the loop thread). Subsystems that already keep their own state
+    register a provider instead, which is only called when a snapshot is
+    taken. Dotted names nest in the snapshot ("searches.email").
+    """
+
+    def __init__(self):
+        self.counters: Counter = Counter()
+        self.gauges: Counter = Counter()
+        self.peaks: Counter = Counter()
+        self.started_at = time.time()
+        self._providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def incr(self, name: str, value: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[name] += value
+
+    def adjust(self, name: str, delta: int) -> None:
+        """Move a gauge (e.g. bytes currently held) up or down."""
+        self.gauges[name] += delta
+
+    def peak(self, name: str, value: float) -> None:
+        """Keep the highest value observed (e.g. per-request peak memory)."""
+        if value > self.peaks[name]:
+            self.peaks[name] = value
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """Count the block as in flight under `name` (and in the `name` total)."""
+        self.gauges[name] += 1
+        self.counters[name] += 1
+        try:
+            yield
+        finally:
+            self.gauges[name] -= 1
+
+    def register(self, section: str, provider: Callable[[], dict[str, Any]]) -> None:
+        """Report provider() under `section` in every snapshot."""
+        self._providers[section] = provider
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current gauges, totals, peaks, provider sections and process state."""
+        sections = {}
+        for section, provider in self._providers.items():
+            try:
+                sections[section] = provider()
+            except Exception as e:
+                logger.error(f"Stats provider failed: {section} - {str(e)}")
+                sections[section] = {"error": str(e)}
+        return {
+            "in_flight": _nest(dict(self.gauges)),
+            "totals": _nest(dict(self.counters)),
+            "peaks": _nest(dict(self.peaks)),
+            **_nest(sections),
+            "process": {**process_stats(), "uptime_s": round(time.time() - self.started_at)},
+        }
+
+
+@lru_cache()
+def get_stats_registry() -> StatsRegistry:
+    """
+    Get the worker-wide stats registry.
+
+    Returns:
+        StatsRegistry: Registry shared by all subsystems of the worker
+    """
+    return StatsRegistry()
@@ -0,0 +1,251 @@
+import csv
+import io
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Optional
+
+from src.core.constants import BulkFormat
+from src.domain.models.response import StandardResponse
+
+# One row per (query, module) in CSV output
+BULK_FIELDS = ["query", "data_type", "module", "status", "code", "found", "latency_ms", "message", "records", "timestamp"]
+
+# Part file extension of the columnar formats
+COLUMNAR_EXTENSIONS = {BulkFormat.PARQUET: "parquet", BulkFormat.ARROW: "arrow"}
+
+# Rows converted into one record batch (a Parquet row group)
+COLUMNAR_BATCH_ROWS = 8192
+
+
+def flatten_result(result: StandardResponse) -> dict[str, Any]:
+    """A module result (or query error) as one flat row; records stay a JSON string."""
+    body = result.body
+    return {
+        "query": body.get("query"),
+        "data_type": result.extra.get("data_type"),
+        "module": body.get("module"),
+        "status": body.get("status"),
+        "code": body.get("code"),
+        "found": body.get("found"),
+        "latency_ms": body.get("latency_ms"),
+        "message": body.get("message") or body.get("error"),
+        "records": json.dumps(body.get("records") or [], ensure_ascii=False),
+        "timestamp": result.extra.get("timestamp"),
+    }
+
+
+class BulkWriter(ABC):
+    """
+    Incremental bulk output.
+
+    Results are buffered by write() and made durable by commit(), which
+    returns the position a checkpoint records. Reopening at that position
+    discards anything written after it, so a resumed run never duplicates
+    rows of a run that died between a write and its checkpoint.
+    """
+
+    @abstractmethod
+    def write(self, results: list[StandardResponse]) -> None:
+        """Buffer results until the next commit."""
+
+    @abstractmethod
+    def commit(self) -> int:
+        """Make buffered results durable and return the position to checkpoint."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the output."""
+
+
+class _FileWriter(BulkWriter):
+    """Appends encoded results to a file (position: byte size) or to stdout."""
+
+    def __init__(self, path: Optional[str], position: int = 0):
+        self.path = path
+        self._pending: list[bytes] = []
+        self._handle: BinaryIO
+        if path is None:
+            self._handle = os.fdopen(os.dup(1), "wb")
+            self._fresh = True
+        else:
+            self._handle = open(path, "r+b" if position and os.path.exists(path) else "wb")
+            self._handle.truncate(position)
+            self._handle.seek(position)
+            self._fresh = position == 0
+
+    @abstractmethod
+    def _encode(self, results: list[StandardResponse]) -> bytes:
+        """Encoded results appended on the next commit."""
+
+    def write(self, results: list[StandardResponse]) -> None:
+        if results:
+            self._pending.append(self._encode(results))
+
+    def commit(self) -> int:
+        self._handle.write(b"".join(self._pending))
+        self._pending = []
+        self._handle.flush()
+        if self.path is None:
+            return 0
+        os.fsync(self._handle.fileno())
+        return self._handle.tell()
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class NdjsonWriter(_FileWriter):
+    """One Sfera result document per line (same payload as the orchestrator's results)."""
+
+    def _encode(self, results: list[StandardResponse]) -> bytes:
+        return b"".join(result.json().encode() + b"\n" for result in results)
+
+
+class CsvWriter(_FileWriter):
+    """One row per (query, module) with BULK_FIELDS columns."""
+
+    def _encode(self, results: list[StandardResponse]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=BULK_FIELDS)
+        if self._fresh:
+            writer.writeheader()
+            self._fresh = False
+        writer.writerows(flatten_result(result) for result in results)
+        return buffer.getvalue().encode()
+
+
+class ColumnarWriter(BulkWriter):
+    """
+    Dataset directory of Parquet or Arrow IPC part files with typed columns
+    (columnar_export.RESULT_SCHEMA). Results are converted to record
+    batches of COLUMNAR_BATCH_ROWS as they arrive; every commit closes one part file
+    (position: number of parts). The directory reads as one dataset with
+    pyarrow.dataset, pandas or polars.
+    """
+
+    def __init__(self, output_format: BulkFormat, directory: str, position: int = 0, prefix: str = "part"):
+        try:
+            from src.infrastructure.persistence import columnar_export
+        except ImportError:
+            raise RuntimeError(f"{output_format.value} output needs pyarrow (pip install pyarrow)")
+        self._export = columnar_export
+        self.output_format = output_format
+        self.extension = COLUMNAR_EXTENSIONS[output_format]
+        self.directory = directory
+        self.prefix = prefix
+        self.parts = position
+        self._batches: list = []
+        self._rows: list[StandardResponse] = []
+        os.makedirs(directory, exist_ok=True)
+
+        # Parts written after the last checkpoint are incomplete work
+        pattern = re.compile(rf"^{re.escape(prefix)}-(\d+)\.{self.extension}$")
+        for name in os.listdir(directory):
+            match = pattern.match(name)
+            if match and int(match.group(1)) >= position:
+                os.remove(os.path.join(directory, name))
+
+    def _convert(self) -> None:
+        if self._rows:
+            self._batches.append(self._export.to_record_batch(self._rows))
+            self._rows = []
+
+    def write(self, results: list[StandardResponse]) -> None:
+        self._rows.extend(results)
+        if len(self._rows) >= COLUMNAR_BATCH_ROWS:
+            self._convert()
+
+    def commit(self) -> int:
+        self._convert()
+        if self._batches:
+            path = os.path.join(self.directory, f"{self.prefix}-{self.parts:05d}.{self.extension}")
+            self._export.write_part(f"{path}.tmp", self._batches, self.output_format == BulkFormat.PARQUET)
+            os.replace(f"{path}.tmp", path)
+            self.parts += 1
+            self._batches = []
+        return self.parts
+
+    def close(self) -> None:
+        self._batches = []
+        self._rows = []
+
+
+def open_writer(output_format: BulkFormat, path: Optional[str], position: int = 0, prefix: str = "part") -> BulkWriter:
+    """
+    Writer for a bulk output.
+
+    Args:
+        output_format: NDJSON, CSV, PARQUET or ARROW
+        path: Output file (dataset directory for the columnar formats); None for stdout
+        position: Committed position to continue from (0 for a fresh output)
+        prefix: Part file prefix of a columnar dataset (one per shard)
+    """
+    if output_format in COLUMNAR_EXTENSIONS:
+        if path is None:
+            raise ValueError(f"{output_format.value} output needs an output directory")
+        return ColumnarWriter(output_format, path, position, prefix)
+    writer_class = CsvWriter if output_format == BulkFormat.CSV else NdjsonWriter
+    return writer_class(path, position)
+
+
+class BulkCheckpoint:
+    """
+    Progress of a bulk run, saved atomically after every commit.
+
+    Queries complete out of order, so progress is a watermark (every
+    ordinal below it is done) plus the completed ordinals above it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.watermark = 0
+        self.done: set[int] = set()
+        self.position = 0
+        self.queries = 0
+        self.results = 0
+
+    @classmethod
+    def load(cls, path: str) -> "BulkCheckpoint":
+        """Checkpoint at `path`; a fresh one when the file does not exist."""
+        checkpoint = cls(path)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+            checkpoint.watermark = data["watermark"]
+            checkpoint.done = set(data["done"])
+            checkpoint.position = data["position"]
+            checkpoint.queries = data["queries"]
+            checkpoint.results = data["results"]
+        return checkpoint
+
+    def is_done(self, ordinal: int) -> bool:
+        return ordinal < self.watermark or ordinal in self.done
+
+    def commit(self, ordinals: list[int], results: int, position: int) -> None:
+        """Record queries whose results were committed at `position` and save."""
+        self.done.update(ordinals)
+        while self.watermark in self.done:
+            self.done.discard(self.watermark)
+            self.watermark += 1
+        self.queries += len(ordinals)
+        self.results += results
+        self.position = position
+        self.save()
+
+    def save(self) -> None:
+        data = {
+            "watermark": self.watermark,
+            "done": sorted(self.done),
+            "position": self.position,
+            "queries": self.queries,
+            "results": self.results,
+        }
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        os.replace(f"{self.path}.tmp", self.path)
+
+    def discard(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
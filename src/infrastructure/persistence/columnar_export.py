@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Any, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.domain.models.response import StandardResponse
+
+# Low-cardinality strings are dictionary encoded (module names, statuses, codes)
+_LABEL = pa.dictionary(pa.int16(), pa.string())
+
+RECORD_TYPE = pa.struct([
+    ("result", pa.string()),
+    ("result_code", pa.string()),
+    ("phone_number", pa.string()),
+    ("email_recovery", pa.string()),
+])
+
+# One row per (query, module); query-level errors have no module
+RESULT_SCHEMA = pa.schema([
+    ("query", pa.string()),
+    ("data_type", _LABEL),
+    ("module", _LABEL),
+    ("status", _LABEL),
+    ("code", pa.int16()),
+    ("found", pa.bool_()),
+    ("latency_ms", pa.float32()),
+    ("result_code", _LABEL),
+    ("record_count", pa.int16()),
+    ("records", pa.list_(RECORD_TYPE)),
+    ("message", pa.string()),
+    ("timestamp", pa.timestamp("s", tz="UTC")),
+])
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def to_record_batch(results: list[StandardResponse]) -> pa.RecordBatch:
+    """
+    Results as one record batch of RESULT_SCHEMA, built column by column.
+
+    result_code is the code of the module's first record (modules report
+    one record per query); every record stays available in `records`.
+    """
+    columns: dict[str, list[Any]] = {field.name: [] for field in RESULT_SCHEMA}
+    for result in results:
+        body = result.body
+        records = body.get("records") or []
+        columns["query"].append(body.get("query"))
+        columns["data_type"].append(result.extra.get("data_type"))
+        columns["module"].append(body.get("module"))
+        columns["status"].append(body.get("status"))
+        columns["code"].append(body.get("code"))
+        columns["found"].append(body.get("found"))
+        columns["latency_ms"].append(body.get("latency_ms"))
+        columns["result_code"].append(records[0].get("result_code") if records else None)
+        columns["record_count"].append(len(records))
+        columns["records"].append(records)
+        columns["message"].append(body.get("message") or body.get("error"))
+        columns["timestamp"].append(_timestamp(result.extra.get("timestamp")))
+
+    arrays = []
+    for field in RESULT_SCHEMA:
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(columns[field.name], pa.string()).dictionary_encode().cast(field.type))
+        else:
+            arrays.append(pa.array(columns[field.name], field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=RESULT_SCHEMA)
+
+
+def write_part(path: str, batches: list[pa.RecordBatch], parquet: bool) -> None:
+    """
+    Write record batches as one part file: Parquet (zstd, one row group per
+    batch) or an Arrow IPC file (zstd-compressed buffers, no decoding to load).
+    """
+    if parquet:
+        with pq.ParquetWriter(path, RESULT_SCHEMA, compression="zstd") as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+        return
+    # An IPC file holds one dictionary per column, shared by all its batches
+    table = pa.Table.from_batches(batches, RESULT_SCHEMA).unify_dictionaries()
+    options = pa.ipc.IpcWriteOptions(compression="zstd")
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, RESULT_SCHEMA, options=options) as writer:
+        writer.write_table(table)
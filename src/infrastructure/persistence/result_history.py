@@ -0,0 +1,280 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.domain.models.response import ModuleResult
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS module_results (
+    id INTEGER PRIMARY KEY,
+    observed_at REAL NOT NULL,
+    family TEXT NOT NULL,
+    payload_key TEXT NOT NULL,
+    module TEXT NOT NULL,
+    status TEXT NOT NULL,
+    code INTEGER NOT NULL,
+    message TEXT,
+    latency_ms REAL,
+    records TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS module_results_payload ON module_results (payload_key, module, observed_at);
+CREATE INDEX IF NOT EXISTS module_results_observed ON module_results (observed_at);
+"""
+
+COLUMNS = "observed_at, family, payload_key, module, status, code, message, latency_ms, records"
+
+# Rows deleted per retention statement (keeps write locks short)
+PURGE_BATCH = 10000
+
+# Seconds between retention passes
+PURGE_INTERVAL = 3600
+
+
+def _iso(observed_at: float) -> str:
+    return datetime.fromtimestamp(observed_at, timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _module_result(row: sqlite3.Row) -> ModuleResult:
+    return ModuleResult(
+        module_name=row["module"],
+        status=row["status"],
+        code=row["code"],
+        message=row["message"] or "",
+        records=json.loads(row["records"]),
+        latency_ms=row["latency_ms"],
+        timestamp=_iso(row["observed_at"])
+    )
+
+
+class ResultHistory:
+    """
+    Append-only SQLite log of executed module results.
+
+    record() only queues a row; a background task inserts the queue in
+    batches. All database work runs on one dedicated thread, so the event
+    loop never waits on disk and the connection is never shared between
+    threads. WAL mode lets the API processes of a host append to the same
+    file. Rows older than the retention are deleted hourly.
+    """
+
+    def __init__(self, path: str, retention_days: int, flush_interval: float, max_pending: int):
+        self.path = path
+        self.retention = retention_days * 86400
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.written = 0
+        self.dropped = 0
+        self.purged = 0
+        self._pending: list[tuple] = []
+        self._db: Optional[sqlite3.Connection] = None
+        self._thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history")
+        self._task: Optional[asyncio.Task] = None
+
+    def _connect(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+
+    async def _call(self, func, *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._thread, func, *args)
+
+    def record(self, family: str, payload_key: str, result: ModuleResult) -> None:
+        """Queue one executed module result (dropped if the writer falls behind)."""
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._pending.append((
+            time.time(), family, payload_key, result.module_name, result.status, result.code,
+            result.message, result.latency_ms, json.dumps([record.dict() for record in result.records])
+        ))
+
+    def _insert(self, rows: list[tuple]) -> None:
+        with self._db:
+            self._db.executemany(f"INSERT INTO module_results ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    async def flush(self) -> None:
+        """Insert the queued rows."""
+        rows, self._pending = self._pending, []
+        if not rows:
+            return
+        try:
+            await self._call(self._insert, rows)
+            self.written += len(rows)
+        except sqlite3.Error as e:
+            self.dropped += len(rows)
+            logger.error(f"Failed to write {len(rows)} history rows: {str(e)}")
+
+    def _purge(self, cutoff: float) -> int:
+        deleted = 0
+        while True:
+            with self._db:
+                cursor = self._db.execute(
+                    "DELETE FROM module_results WHERE id IN "
+                    "(SELECT id FROM module_results WHERE observed_at < ? LIMIT ?)",
+                    (cutoff, PURGE_BATCH)
+                )
+            deleted += cursor.rowcount
+            if cursor.rowcount < PURGE_BATCH:
+                return deleted
+
+    async def purge(self) -> None:
+        """Delete rows older than the retention."""
+        try:
+            deleted = await self._call(self._purge, time.time() - self.retention)
+        except sqlite3.Error as e:
+            logger.error(f"History retention failed: {str(e)}")
+            return
+        self.purged += deleted
+        if deleted:
+            logger.info(f"History retention removed {deleted} rows")
+
+    async def _run(self) -> None:
+        purged_at = 0.0
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            if time.monotonic() - purged_at >= PURGE_INTERVAL:
+                purged_at = time.monotonic()
+                await self.purge()
+
+    async def start(self) -> None:
+        """Open the database and start the background writer."""
+        if self._db is None:
+            await self._call(self._connect)
+            logger.info(f"Result history at {self.path} (retention {self.retention // 86400} days)")
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the writer, insert what is still queued and close the database."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._db is not None:
+            await self.flush()
+            await self._call(self._db.close)
+            self._db = None
+
+    def _select(self, sql: str, params: tuple) -> list[sqlite3.Row]:
+        return self._db.execute(sql, params).fetchall()
+
+    async def history(
+        self,
+        payload_key: str,
+        module: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        Recorded results of a payload, newest first.
+
+        Args:
+            payload_key: Canonical payload key
+            module: Only this module
+            since: Only results observed at or after this Unix time
+            limit: Maximum rows returned
+        """
+        if self._db is None:
+            return []
+        sql = f"SELECT {COLUMNS} FROM module_results WHERE payload_key = ?"
+        params: list[Any] = [payload_key]
+        if module is not None:
+            sql += " AND module = ?"
+            params.append(module)
+        if since is not None:
+            sql += " AND observed_at >= ?"
+            params.append(since)
+        sql += " ORDER BY observed_at DESC LIMIT ?"
+        params.append(limit)
+
+        rows = await self._call(self._select, sql, tuple(params))
+        return [
+            {
+                "observed_at": _iso(row["observed_at"]),
+                "module": row["module"],
+                "status": row["status"],
+                "code": row["code"],
+                "message": row["message"],
+                "found": row["code"] == 200 and row["records"] != "[]",
+                "latency_ms": row["latency_ms"],
+                "records": json.loads(row["records"]),
+            }
+            for row in rows
+        ]
+
+    async def latest(self, payload_key: str, modules: list[str], max_age: float) -> dict[str, ModuleResult]:
+        """
+        Most recent recorded result per module, if observed within max_age seconds.
+
+        Returns:
+            dict[str, ModuleResult]: Results by module (modules without a recent one are absent)
+        """
+        if self._db is None or not modules:
+            return {}
+        placeholders = ", ".join("?" * len(modules))
+        # Bare columns next to MAX() come from the row holding the maximum (SQLite)
+        sql = (
+            f"SELECT {COLUMNS}, MAX(observed_at) FROM module_results "
+            f"WHERE payload_key = ? AND module IN ({placeholders}) AND observed_at >= ? GROUP BY module"
+        )
+        try:
+            rows = await self._call(self._select, sql, (payload_key, *modules, time.time() - max_age))
+        except sqlite3.Error as e:
+            logger.error(f"History lookup failed: {str(e)}")
+            return {}
+        return {row["module"]: _module_result(row) for row in rows}
+
+    def stats(self) -> dict[str, Any]:
+        """Writer state for the stats registry."""
+        size = 0
+        for path in (self.path, f"{self.path}-wal"):
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return {
+            "pending": len(self._pending),
+            "written": self.written,
+            "dropped": self.dropped,
+            "purged": self.purged,
+            "db_bytes": size,
+        }
+
+
+@lru_cache()
+def get_result_history() -> ResultHistory:
+    """
+    Get the worker-wide result history.
+
+    Returns:
+        ResultHistory: History at HISTORY_PATH (default <DATA_DIR>/history.sqlite3)
+    """
+    settings = get_settings()
+    history = ResultHistory(
+        path=settings.HISTORY_PATH or os.path.join(settings.DATA_DIR, "history.sqlite3"),
+        retention_days=settings.HISTORY_RETENTION_DAYS,
+        flush_interval=settings.HISTORY_FLUSH_INTERVAL,
+        max_pending=settings.HISTORY_MAX_PENDING
+    )
+    get_stats_registry().register("history", history.stats)
+    return history
@@ -0,0 +1,146 @@
+import json
+import os
+import re
+import tempfile
+import time
+import uuid
+from functools import lru_cache
+from typing import IO, Any, Optional
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.domain.exceptions import ContinuationExpiredException
+
+logger = get_logger(__name__)
+
+# "<spill id>-<position>"
+TOKEN_PATTERN = re.compile(r"^([0-9a-f]{32})-(\d+)$")
+
+
+class SpillWriter:
+    """
+    Results of one request that did not fit into its response.
+
+    Results are appended as they arrive; the index written on close orders
+    them by (query, position) so continuation pages follow query order.
+    """
+
+    def __init__(self, directory: str):
+        self.spill_id = uuid.uuid4().hex
+        self.path = os.path.join(directory, f"{self.spill_id}.ndjson")
+        self.count = 0
+        self.bytes = 0
+        self._index: list[tuple[tuple[int, int], int, int]] = []
+        self._handle = open(self.path, "wb")
+
+    def write(self, order: tuple[int, int], payload: bytes) -> None:
+        """Append one serialized result."""
+        self._index.append((order, self._handle.tell(), len(payload)))
+        self._handle.write(payload + b"\n")
+        self.count += 1
+        self.bytes += len(payload)
+
+    def close(self) -> str:
+        """
+        Finish the spill file.
+
+        Returns:
+            str: Continuation token of the first spilled result
+        """
+        self._handle.close()
+        self._index.sort()
+        with open(f"{self.path}.index", "w", encoding="utf-8") as handle:
+            json.dump([[offset, length] for _, offset, length in self._index], handle)
+        return f"{self.spill_id}-0"
+
+    def discard(self) -> None:
+        """Drop the spill file (request failed before it was handed out)."""
+        self._handle.close()
+        for path in (self.path, f"{self.path}.index"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class ResultSpillStore:
+    """
+    Spilled orchestrator results, served page by page through continuation tokens.
+
+    Files live in <DATA_DIR>/spill and expire after RESULT_SPILL_TTL seconds.
+    """
+
+    def __init__(self, directory: str, ttl: int):
+        self.directory = directory
+        self.ttl = ttl
+
+    def create(self) -> SpillWriter:
+        """Start a spill file, purging expired ones first."""
+        os.makedirs(self.directory, exist_ok=True)
+        self.purge_expired()
+        return SpillWriter(self.directory)
+
+    def scratch(self) -> IO[bytes]:
+        """Anonymous read/write file in the spill directory, removed when closed."""
+        os.makedirs(self.directory, exist_ok=True)
+        return tempfile.TemporaryFile(dir=self.directory)
+
+    def purge_expired(self) -> None:
+        """Remove spill files older than the TTL."""
+        cutoff = time.time() - self.ttl
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def read_page(self, token: str, max_results: int, max_bytes: int) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """
+        Read the results starting at a continuation token.
+
+        Args:
+            token: Continuation token from a previous response
+            max_results: Results per page
+            max_bytes: JSON bytes per page (at least one result is returned)
+
+        Returns:
+            tuple[list[dict], Optional[str]]: (results, token of the next page or None)
+
+        Raises:
+            ContinuationExpiredException: If the token is malformed, unknown or expired
+        """
+        match = TOKEN_PATTERN.match(token)
+        if match is None:
+            raise ContinuationExpiredException()
+        spill_id, position = match.group(1), int(match.group(2))
+        path = os.path.join(self.directory, f"{spill_id}.ndjson")
+        try:
+            with open(f"{path}.index", encoding="utf-8") as handle:
+                index = json.load(handle)
+            results, size = [], 0
+            with open(path, "rb") as handle:
+                while position < len(index) and len(results) < max_results:
+                    offset, length = index[position]
+                    if results and size + length > max_bytes:
+                        break
+                    handle.seek(offset)
+                    results.append(json.loads(handle.read(length)))
+                    size += length
+                    position += 1
+        except (OSError, ValueError):
+            raise ContinuationExpiredException()
+
+        next_token = f"{spill_id}-{position}" if position < len(index) else None
+        return results, next_token
+
+
+@lru_cache()
+def get_result_spill_store() -> ResultSpillStore:
+    """
+    Get the worker-wide result spill store.
+
+    Returns:
+        ResultSpillStore: Store in <DATA_DIR>/spill
+    """
+    settings = get_settings()
+    return ResultSpillStore(os.path.join(settings.DATA_DIR, "spill"), settings.RESULT_SPILL_TTL)
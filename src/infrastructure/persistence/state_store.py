@@ -0,0 +1,115 @@
+import asyncio
+import json
+import os
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class StateStore:
+    """
+    Persists small pieces of worker state as JSON files in DATA_DIR.
+
+    Components register a dump/restore pair; state is restored on startup,
+    snapshotted periodically and saved once more on shutdown.
+    """
+
+    def __init__(self, data_dir: str, interval: int):
+        self.data_dir = data_dir
+        self.interval = interval
+        self._components: dict[str, tuple[Callable[[], Any], Callable[[Any], None]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.data_dir, f"{name}.json")
+
+    def register(
+        self,
+        name: str,
+        dump: Callable[[], Any],
+        restore: Callable[[Any], None]
+    ) -> None:
+        """
+        Register a persistent component.
+
+        Args:
+            name: File name (without extension) in DATA_DIR
+            dump: Returns JSON-serializable state
+            restore: Loads previously dumped state
+        """
+        self._components[name] = (dump, restore)
+
+    def load(self, name: str) -> Optional[Any]:
+        """Read a state file, returning None if it is missing or unreadable."""
+        try:
+            with open(self._path(name), encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable state file {name}: {str(e)}")
+            return None
+
+    def save(self, name: str, data: Any) -> None:
+        """Atomically write a state file."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        path = self._path(name)
+        # Per-process name: every worker snapshots into the same DATA_DIR
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        os.replace(tmp_path, path)
+
+    def restore_all(self) -> None:
+        """Restore every registered component from disk."""
+        for name, (_, restore) in self._components.items():
+            data = self.load(name)
+            if data is not None:
+                restore(data)
+                logger.info(f"Restored state: {name}")
+
+    def save_all(self) -> None:
+        """Snapshot every registered component to disk."""
+        for name, (dump, _) in self._components.items():
+            try:
+                self.save(name, dump())
+            except Exception as e:
+                logger.error(f"Failed to persist state {name}: {str(e)}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.save_all()
+
+    def start(self) -> None:
+        """Restore state and start periodic snapshots."""
+        self.restore_all()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic snapshots and save a final one."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.save_all()
+
+
+@lru_cache()
+def get_state_store() -> StateStore:
+    """
+    Get the worker-wide state store.
+
+    Returns:
+        StateStore: Store writing to DATA_DIR
+    """
+    settings = get_settings()
+    return StateStore(settings.DATA_DIR, settings.STATE_PERSIST_INTERVAL)
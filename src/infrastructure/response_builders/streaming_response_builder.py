@@ -0,0 +1,74 @@
+import json
+from typing import Any, AsyncIterator, Callable
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+# (body fields known only at the end, extra)
+Trailer = tuple[dict[str, Any], dict[str, Any]]
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    Streaming response written while the request body is still being read.
+
+    StreamingResponse listens for the disconnect by consuming receive(),
+    which would swallow the body chunks of a streamed upload. Here the body
+    reader is the only consumer and sees the disconnect itself
+    (ClientDisconnect), which ends the content iterator.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def stream_json_document(
+    headers: dict[str, Any],
+    body_head: dict[str, Any],
+    results: AsyncIterator[list[bytes]],
+    finish: Callable[[], Trailer]
+) -> AsyncIterator[bytes]:
+    """
+    Write a Sfera document ({"headers", "body", "extra"}) incrementally.
+
+    The body opens with `body_head`, then "results" streams batches of
+    serialized results, then the body fields and extra returned by finish()
+    close the document. The shape is the same as a buffered response.
+    """
+    yield (
+        b'{"headers":' + _dumps(headers) + b',"body":{'
+        + b"".join(_dumps(key) + b":" + _dumps(value) + b"," for key, value in body_head.items())
+        + b'"results":['
+    )
+    separator = b""
+    async for batch in results:
+        yield separator + b",".join(batch)
+        separator = b","
+    body_tail, extra = finish()
+    yield (
+        b"]" + b"".join(b"," + _dumps(key) + b":" + _dumps(value) for key, value in body_tail.items())
+        + b'},"extra":' + _dumps(extra) + b"}"
+    )
+
+
+async def stream_ndjson(
+    headers: dict[str, Any],
+    body_head: dict[str, Any],
+    results: AsyncIterator[list[bytes]],
+    finish: Callable[[], Trailer]
+) -> AsyncIterator[bytes]:
+    """
+    Write the same content as NDJSON records: a header record, one record
+    per result and a trailing summary record.
+    """
+    yield _dumps({"type": "header", "headers": headers, "body": body_head}) + b"\n"
+    async for batch in results:
+        yield b"".join(b'{"type":"result","result":' + payload + b"}\n" for payload in batch)
+    body_tail, extra = finish()
+    yield _dumps({"type": "summary", "body": body_tail, "extra": extra}) + b"\n"
@@ -0,0 +1,187 @@
+import math
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.core.config import get_settings
+from src.core.constants import SchedulingPolicy
+from src.core.logging import get_logger
+from src.infrastructure.persistence.state_store import get_state_store
+
+logger = get_logger(__name__)
+
+
+class LatencyTracker:
+    """
+    Rolling per-module latency estimates.
+
+    Keeps an exponentially weighted moving average of every execution (used
+    for ordering) and a window of recent healthy executions and timeouts
+    (used for percentiles). A timeout is a censored sample: the latency
+    was at least the timeout, so it is recorded at that value and a site
+    that slowed down past its timeout pushes the percentile up instead of
+    leaving the window frozen. Samples older than `max_age` seconds no
+    longer count, so a window persisted long ago does not pin timeouts.
+    """
+
+    def __init__(self, alpha: float, window_size: int, max_age: float):
+        self.alpha = alpha
+        self.window_size = window_size
+        self.max_age = max_age
+        self._estimates: dict[str, float] = {}
+        self._samples: dict[str, int] = {}
+        # module -> (observed at, latency) in observation order
+        self._windows: dict[str, deque] = {}
+        self._timeout_streaks: dict[str, int] = {}
+
+    def record(self, module_name: str, latency: float, healthy: bool = True, timed_out: bool = False) -> None:
+        """
+        Fold an observed execution time into the module estimate.
+
+        Args:
+            module_name: Name of the module
+            latency: Observed execution time in seconds (the timeout for timed out runs)
+            healthy: Whether the site answered normally
+            timed_out: Whether the run hit its timeout (a censored sample);
+                other errors do not feed the percentile window
+        """
+        if healthy or timed_out:
+            window = self._windows.get(module_name)
+            if window is None:
+                window = self._windows[module_name] = deque(maxlen=self.window_size)
+            window.append((time.time(), latency))
+        if timed_out:
+            self._timeout_streaks[module_name] = self._timeout_streaks.get(module_name, 0) + 1
+        elif healthy:
+            self._timeout_streaks.pop(module_name, None)
+
+        previous = self._estimates.get(module_name)
+        if previous is None:
+            self._estimates[module_name] = latency
+        else:
+            self._estimates[module_name] = previous + self.alpha * (latency - previous)
+        self._samples[module_name] = self._samples.get(module_name, 0) + 1
+
+    def estimate(self, module_name: str) -> Optional[float]:
+        """Expected latency in seconds, or None if the module was never observed."""
+        return self._estimates.get(module_name)
+
+    def expected(self, module_name: str) -> float:
+        """Expected latency in seconds, falling back to the mean of known estimates."""
+        estimate = self._estimates.get(module_name)
+        return estimate if estimate is not None else self._prior()
+
+    def _window(self, module_name: str) -> list[float]:
+        """Latencies of the window, dropping samples older than max_age."""
+        window = self._windows.get(module_name)
+        if not window:
+            return []
+        cutoff = time.time() - self.max_age
+        while window and window[0][0] < cutoff:
+            window.popleft()
+        return [latency for _, latency in window]
+
+    def timeout_streak(self, module_name: str) -> int:
+        """Consecutive timeouts since the module last answered normally."""
+        return self._timeout_streaks.get(module_name, 0)
+
+    def percentile(self, module_name: str, quantile: float) -> Optional[float]:
+        """
+        Latency percentile over the recent window (healthy runs and timeouts).
+
+        Args:
+            module_name: Name of the module
+            quantile: Quantile in (0, 1], e.g. 0.99
+
+        Returns:
+            Optional[float]: Latency in seconds, or None without samples
+        """
+        window = self._window(module_name)
+        if not window:
+            return None
+        ordered = sorted(window)
+        index = min(len(ordered) - 1, max(0, math.ceil(quantile * len(ordered)) - 1))
+        return ordered[index]
+
+    def healthy_samples(self, module_name: str) -> int:
+        """Number of unexpired samples in the window."""
+        return len(self._window(module_name))
+
+    def modules(self) -> list[str]:
+        """Modules with at least one observation."""
+        return list(self._estimates.keys())
+
+    def _prior(self) -> float:
+        """Estimate used for modules without observations (mean of known estimates)."""
+        if not self._estimates:
+            return 0.0
+        return sum(self._estimates.values()) / len(self._estimates)
+
+    def order(self, modules: list[str], policy: SchedulingPolicy) -> list[str]:
+        """
+        Order modules for start-up according to the scheduling policy.
+
+        Args:
+            modules: Resolved module names
+            policy: shortest_first favours time-to-first-result,
+                longest_first minimises makespan under a concurrency cap
+
+        Returns:
+            list[str]: Modules in start order
+        """
+        if policy == SchedulingPolicy.NONE:
+            return modules
+        prior = self._prior()
+        return sorted(
+            modules,
+            key=lambda name: self._estimates.get(name, prior),
+            reverse=policy == SchedulingPolicy.LONGEST_FIRST
+        )
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Current estimates in milliseconds with sample counts."""
+        return {
+            name: {"ewma_ms": round(value * 1000, 1), "samples": self._samples[name]}
+            for name, value in self._estimates.items()
+        }
+
+    def dump(self) -> dict[str, Any]:
+        """Serializable state for persistence."""
+        return {
+            name: {
+                "ewma": value,
+                "samples": self._samples.get(name, 0),
+                "window": [list(sample) for sample in self._windows.get(name, ())],
+            }
+            for name, value in self._estimates.items()
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load state produced by dump()."""
+        for name, state in data.items():
+            self._estimates[name] = state["ewma"]
+            self._samples[name] = state.get("samples", 0)
+            # Windows saved before samples were timestamped age from now
+            restored_at = time.time()
+            self._windows[name] = deque(
+                (tuple(sample) if isinstance(sample, list) else (restored_at, sample) for sample in state.get("window", [])),
+                maxlen=self.window_size
+            )
+
+
+@lru_cache()
+def get_latency_tracker(namespace: str) -> LatencyTracker:
+    """
+    Get the latency tracker for a module family.
+
+    Args:
+        namespace: Module family ("email" or "phone"); names overlap between families
+
+    Returns:
+        LatencyTracker: Tracker shared by the worker
+    """
+    settings = get_settings()
+    tracker = LatencyTracker(settings.LATENCY_EWMA_ALPHA, settings.LATENCY_WINDOW_SIZE, settings.LATENCY_WINDOW_MAX_AGE)
+    get_state_store().register(f"latency_{namespace}", tracker.dump, tracker.restore)
+    return tracker
@@ -0,0 +1,134 @@
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+
+from src.core.config import get_settings
+from src.core.constants import MODULE_PRIORITY_NORMAL
+from src.core.logging import get_logger
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+
+logger = get_logger(__name__)
+
+
+class SlotRequest:
+    """A slot request whose priority can still be raised while it waits."""
+
+    def __init__(self, priority: int = MODULE_PRIORITY_NORMAL):
+        self.priority = priority
+        self._scheduler: Optional["ModuleScheduler"] = None
+        self._future: Optional[asyncio.Future] = None
+
+    def promote(self, priority: int) -> None:
+        """Raise the priority (never lowers it), re-queueing the request if it waits."""
+        if priority <= self.priority:
+            return
+        self.priority = priority
+        if self._future is not None and not self._future.done():
+            self._scheduler._enqueue(priority, self._future)
+
+
+class ModuleScheduler:
+    """
+    Bounded, priority-aware slot scheduler for module executions.
+
+    At most `max_concurrent` modules run at once; the rest wait in a
+    priority queue (higher priority first, FIFO within a priority).
+    """
+
+    def __init__(self, max_concurrent: int):
+        self.max_concurrent = max(1, max_concurrent)
+        self._in_flight = 0
+        self._queued = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of modules currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of modules waiting for a slot."""
+        return self._queued
+
+    def _enqueue(self, priority: int, future: asyncio.Future) -> None:
+        # A promoted request is pushed again; its older entry is skipped once the future is done
+        heapq.heappush(self._waiters, (-priority, next(self._sequence), future))
+
+    async def acquire(self, priority: int = MODULE_PRIORITY_NORMAL, request: Optional[SlotRequest] = None) -> None:
+        """
+        Wait for an execution slot.
+
+        Args:
+            priority: Module priority, higher values are served first
+            request: Request whose (promotable) priority is used instead of `priority`
+        """
+        if self._in_flight < self.max_concurrent and not self._queued:
+            self._in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        if request is not None:
+            priority = request.priority
+            request._scheduler, request._future = self, future
+        self._enqueue(priority, future)
+        self._queued += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before cancellation
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        finally:
+            self._queued -= 1
+
+    def release(self) -> None:
+        """Release a slot, handing it to the highest priority waiter."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Slot is transferred, in-flight count stays the same
+                future.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def stats(self) -> dict[str, int]:
+        """Slot usage for the stats registry."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self._in_flight,
+            "queue_depth": self._queued,
+        }
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: int = MODULE_PRIORITY_NORMAL,
+        request: Optional[SlotRequest] = None
+    ) -> AsyncIterator[None]:
+        """Hold an execution slot for the duration of the block."""
+        await self.acquire(priority, request)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+@lru_cache()
+def get_module_scheduler() -> ModuleScheduler:
+    """
+    Get the worker-wide module scheduler.
+
+    Returns:
+        ModuleScheduler: Scheduler bounded by MAX_CONCURRENT_REQUESTS
+    """
+    settings = get_settings()
+    logger.info(f"Module scheduler initialized: max_concurrent={settings.MAX_CONCURRENT_REQUESTS}")
+    scheduler = ModuleScheduler(settings.MAX_CONCURRENT_REQUESTS)
+    get_stats_registry().register("scheduler", scheduler.stats)
+    return scheduler
@@ -0,0 +1,136 @@
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.domain.models.response import ModuleResult
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+
+logger = get_logger(__name__)
+
+
+class ResultCache:
+    """
+    Stale-while-revalidate LRU cache of module results.
+
+    Entries younger than the soft TTL are fresh. Between the soft and the
+    hard TTL an entry is still served, marked stale, and the caller starts
+    a background refresh; at most one refresh per key runs at a time and at
+    most `max_refreshes` overall (beyond that the stale entry is served
+    until a refresh slot frees up or it expires). Past the hard TTL the
+    entry is dropped.
+    """
+
+    def __init__(self, max_size: int, soft_ttl: float, hard_ttl: float, max_refreshes: int):
+        self.max_size = max_size
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = max(hard_ttl, soft_ttl)
+        self.max_refreshes = max_refreshes
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self._entries: OrderedDict[Hashable, tuple[float, ModuleResult]] = OrderedDict()
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+
+    def get(self, key: Hashable) -> Optional[tuple[ModuleResult, bool]]:
+        """
+        Cached result of a key.
+
+        Returns:
+            Optional[tuple[ModuleResult, bool]]: (copy of the result, stale), or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        age = time.monotonic() - entry[0]
+        if age >= self.hard_ttl:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        stale = age >= self.soft_ttl
+        if stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        return entry[1].copy(update={"stale": stale}), stale
+
+    def put(self, key: Hashable, result: ModuleResult) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic(), result.copy())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Run factory() in the background unless a refresh of key is already running.
+
+        The factory is expected to execute the module and put() its result.
+
+        Returns:
+            bool: Whether a refresh was started
+        """
+        if key in self._refreshing or len(self._refreshing) >= self.max_refreshes:
+            return False
+        task = asyncio.create_task(factory())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda done: self._refreshed(key, done))
+        self.refreshes += 1
+        return True
+
+    def _refreshed(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._refreshing.get(key) is task:
+            del self._refreshing[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.refresh_failures += 1
+            logger.warning(f"Cache refresh of {key} failed: {str(task.exception())}")
+
+    async def stop(self) -> None:
+        """Cancel running refreshes."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Size, hit rates and refreshes for the stats registry."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 3) if lookups else None,
+            "refreshing": len(self._refreshing),
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+        }
+
+
+@lru_cache()
+def get_result_cache(namespace: str) -> ResultCache:
+    """
+    Get the module result cache of a module family.
+
+    Args:
+        namespace: Module family ("email" or "phone")
+
+    Returns:
+        ResultCache: Cache shared by the worker
+    """
+    settings = get_settings()
+    cache = ResultCache(
+        max_size=settings.RESULT_CACHE_SIZE,
+        soft_ttl=settings.RESULT_CACHE_SOFT_TTL,
+        hard_ttl=settings.RESULT_CACHE_HARD_TTL,
+        max_refreshes=settings.RESULT_CACHE_MAX_REFRESHES
+    )
+    get_stats_registry().register(f"caches.results_{namespace}", cache.stats)
+    return cache
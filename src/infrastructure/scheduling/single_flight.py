@@ -0,0 +1,125 @@
+import asyncio
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+from src.core.logging import get_logger
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+from src.infrastructure.scheduling.module_scheduler import SlotRequest
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SharedExecution:
+    """
+    Caller-visible state of one shared module execution.
+
+    Every caller joins it with its own priority and `started` set: the
+    slot request is promoted to the highest priority among the callers,
+    and each caller's set gets the module once the execution holds a slot.
+    """
+
+    def __init__(self, module_name: str):
+        self.module_name = module_name
+        self.slot: Optional[SlotRequest] = None
+        self.started = False
+        self._started_sets: list[set[str]] = []
+
+    def join(self, priority: int, started: Optional[set[str]] = None) -> None:
+        if self.slot is None:
+            self.slot = SlotRequest(priority)
+        else:
+            self.slot.promote(priority)
+        if started is not None:
+            if self.started:
+                started.add(self.module_name)
+            else:
+                self._started_sets.append(started)
+
+    def start(self) -> None:
+        """Mark the execution as holding a slot."""
+        self.started = True
+        for started in self._started_sets:
+            started.add(self.module_name)
+        self._started_sets = []
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution.
+
+    Callers share the first caller's task; the task is only cancelled when
+    every caller waiting on it has been cancelled.
+    """
+
+    def __init__(self):
+        # key -> [task, number of callers waiting on it, context]
+        self._calls: dict[Hashable, list] = {}
+        self.shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently executing."""
+        return len(self._calls)
+
+    def context_of(self, key: Hashable) -> Any:
+        """Context stored by the call in flight for key (None if there is none)."""
+        entry = self._calls.get(key)
+        return entry[2] if entry is not None else None
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]], context: Any = None) -> T:
+        """
+        Run factory() for key, or join the execution already in flight.
+
+        Args:
+            key: Identity of the call
+            factory: Creates the awaitable when no call is in flight
+            context: State shared with later callers through context_of()
+                (kept only when this call starts the execution)
+
+        Returns:
+            T: Result of the shared execution
+        """
+        entry = self._calls.get(key)
+        if entry is None:
+            entry = self._calls[key] = [asyncio.ensure_future(factory()), 0, context]
+            entry[0].add_done_callback(lambda _: self._forget(key, entry))
+        else:
+            self.shared += 1
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Only the last interested caller may cancel the shared execution
+            if entry[1] == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            entry[1] -= 1
+
+    def stats(self) -> dict[str, int]:
+        """In-flight keys and joined calls for the stats registry."""
+        return {"in_flight": self.in_flight, "shared": self.shared}
+
+    def _forget(self, key: Hashable, entry: list) -> None:
+        if self._calls.get(key) is entry:
+            del self._calls[key]
+
+
+@lru_cache()
+def get_single_flight(namespace: str) -> SingleFlight:
+    """
+    Get the single-flight group for a module family.
+
+    Args:
+        namespace: Module family ("email" or "phone")
+
+    Returns:
+        SingleFlight: Group shared by the worker
+    """
+    single_flight = SingleFlight()
+    get_stats_registry().register(f"single_flight.{namespace}", single_flight.stats)
+    return single_flight
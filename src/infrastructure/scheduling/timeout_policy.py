@@ -0,0 +1,82 @@
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.core.config import Settings, get_settings
+from src.core.constants import DEFAULT_MODULE_TIMEOUT
+from src.infrastructure.scheduling.latency_tracker import LatencyTracker, get_latency_tracker
+
+
+class AdaptiveTimeoutPolicy:
+    """
+    Per-module timeouts derived from recent healthy latency.
+
+    timeout = percentile(latency) x margin, clamped between the configured
+    floor and the caller's deadline. Modules with too few samples, or with
+    ADAPTIVE_TIMEOUT_WIDEN_AFTER consecutive timeouts, use the caller's
+    deadline, so a site that slowed down gets a full-length run that can
+    produce a real sample again.
+    """
+
+    def __init__(self, tracker: LatencyTracker, settings: Settings):
+        self.tracker = tracker
+        self.settings = settings
+
+    def adaptive_timeout(self, module_name: str) -> Optional[float]:
+        """Unclamped adaptive timeout in seconds, or None without enough samples."""
+        if not self.settings.ADAPTIVE_TIMEOUTS_ENABLED:
+            return None
+        if self.tracker.healthy_samples(module_name) < self.settings.ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return None
+        latency = self.tracker.percentile(module_name, self.settings.ADAPTIVE_TIMEOUT_PERCENTILE)
+        return max(self.settings.ADAPTIVE_TIMEOUT_FLOOR, latency * self.settings.ADAPTIVE_TIMEOUT_MARGIN)
+
+    def timeout_for(self, module_name: str, deadline: Optional[float] = None) -> float:
+        """
+        Effective timeout for a module execution.
+
+        Args:
+            module_name: Name of the module
+            deadline: Caller's timeout in seconds (DEFAULT_MODULE_TIMEOUT if unset)
+
+        Returns:
+            float: Timeout in seconds
+        """
+        deadline = deadline or DEFAULT_MODULE_TIMEOUT
+        adaptive = self.adaptive_timeout(module_name)
+        if adaptive is None or self._widened(module_name):
+            return deadline
+        return min(adaptive, deadline)
+
+    def _widened(self, module_name: str) -> bool:
+        return self.tracker.timeout_streak(module_name) >= self.settings.ADAPTIVE_TIMEOUT_WIDEN_AFTER
+
+    def snapshot(self, modules: list[str]) -> dict[str, dict[str, Any]]:
+        """Current timeouts with the latency figures behind them."""
+        snapshot = {}
+        for module_name in modules:
+            adaptive = self.adaptive_timeout(module_name)
+            p50 = self.tracker.percentile(module_name, 0.5)
+            percentile = self.tracker.percentile(module_name, self.settings.ADAPTIVE_TIMEOUT_PERCENTILE)
+            snapshot[module_name] = {
+                "timeout_s": round(self.timeout_for(module_name), 3),
+                "source": "default" if adaptive is None else "widened" if self._widened(module_name) else "adaptive",
+                "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "percentile_ms": round(percentile * 1000, 1) if percentile is not None else None,
+                "samples": self.tracker.healthy_samples(module_name),
+                "timeout_streak": self.tracker.timeout_streak(module_name),
+            }
+        return snapshot
+
+
+@lru_cache()
+def get_timeout_policy(namespace: str) -> AdaptiveTimeoutPolicy:
+    """
+    Get the adaptive timeout policy for a module family.
+
+    Args:
+        namespace: Module family ("email" or "phone")
+
+    Returns:
+        AdaptiveTimeoutPolicy: Policy backed by the family's latency tracker
+    """
+    return AdaptiveTimeoutPolicy(get_latency_tracker(namespace), get_settings())
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.infrastructure.persistence.state_store import get_state_store
+
+logger = get_logger(__name__)
+
+# Segment holding every observation regardless of domain / country
+GLOBAL_SEGMENT = "*"
+
+
+class HitRateTracker:
+    """
+    Per-module FOUND counters, globally and per segment
+    (email domain or phone country code).
+
+    Segments are unbounded input (every typo or throwaway domain is one),
+    so at most `max_segments` are kept, least recently recorded evicted
+    first, and only segments with `persist_min_runs` runs of some module
+    are persisted; smaller ones are not used for selection anyway.
+    """
+
+    def __init__(self, max_segments: int, persist_min_runs: int):
+        self.max_segments = max_segments
+        self.persist_min_runs = persist_min_runs
+        # segment -> module -> [runs, found], least recently recorded first
+        self._counters: OrderedDict[str, dict[str, list[int]]] = OrderedDict({GLOBAL_SEGMENT: {}})
+
+    def _segment(self, key: str) -> dict[str, list[int]]:
+        counters = self._counters.get(key)
+        if counters is None:
+            counters = self._counters[key] = {}
+        if key != GLOBAL_SEGMENT:
+            self._counters.move_to_end(key)
+            # The global segment is never evicted (it is one of the max_segments + 1)
+            while len(self._counters) > self.max_segments + 1:
+                oldest = next(segment for segment in self._counters if segment != GLOBAL_SEGMENT)
+                del self._counters[oldest]
+        return counters
+
+    def record(self, module_name: str, found: bool, segment: Optional[str] = None) -> None:
+        """
+        Count one module execution.
+
+        Args:
+            module_name: Name of the module
+            found: Whether the module found the payload
+            segment: Optional segment key, e.g. "gmail.com" or "7"
+        """
+        segments = (GLOBAL_SEGMENT, segment) if segment else (GLOBAL_SEGMENT,)
+        for key in segments:
+            counter = self._segment(key).setdefault(module_name, [0, 0])
+            counter[0] += 1
+            if found:
+                counter[1] += 1
+
+    def counts(self, module_name: str, segment: str = GLOBAL_SEGMENT) -> tuple[int, int]:
+        """
+        Get (runs, found) for a module in a segment.
+        """
+        runs, found = self._counters.get(segment, {}).get(module_name, (0, 0))
+        return runs, found
+
+    def dump(self) -> dict[str, Any]:
+        """Serializable state for persistence (global plus segments with enough runs)."""
+        return {
+            segment: modules for segment, modules in self._counters.items()
+            if segment == GLOBAL_SEGMENT
+            or max((runs for runs, _ in modules.values()), default=0) >= self.persist_min_runs
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load state produced by dump()."""
+        for segment, modules in data.items():
+            target = self._segment(segment)
+            for module_name, (runs, found) in modules.items():
+                target[module_name] = [runs, found]
+
+
+@lru_cache()
+def get_hit_rate_tracker(namespace: str) -> HitRateTracker:
+    """
+    Get the hit-rate tracker for a module family.
+
+    Args:
+        namespace: Module family ("email" or "phone")
+
+    Returns:
+        HitRateTracker: Tracker persisted to DATA_DIR
+    """
+    settings = get_settings()
+    tracker = HitRateTracker(
+        max_segments=settings.SMART_MAX_SEGMENTS,
+        persist_min_runs=settings.SMART_SEGMENT_MIN_SAMPLES
+    )
+    get_state_store().register(f"hit_rates_{namespace}", tracker.dump, tracker.restore)
+    return tracker
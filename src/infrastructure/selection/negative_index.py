@@ -0,0 +1,268 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.core.config import get_settings
+from src.core.constants import NegativeIndexMode
+from src.core.logging import get_logger
+from src.infrastructure.monitoring.stats_registry import get_stats_registry
+
+logger = get_logger(__name__)
+
+SNAPSHOT_FILE = "negative_index.bin"
+
+
+def bloom_positions(key: bytes, bits: int, hashes: int) -> list[int]:
+    """Bit positions of a key (double hashing of one blake2b digest)."""
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over a bytearray; all filters of an index share their positions."""
+
+    def __init__(self, bits: int, data: Optional[bytearray] = None):
+        self.data = data if data is not None else bytearray((bits + 7) // 8)
+
+    def add(self, positions: list[int]) -> None:
+        data = self.data
+        for position in positions:
+            data[position >> 3] |= 1 << (position & 7)
+
+    def contains(self, positions: list[int]) -> bool:
+        data = self.data
+        return all(data[position >> 3] & (1 << (position & 7)) for position in positions)
+
+    def merge(self, other: bytes) -> None:
+        """OR in the bits of an equally sized filter (e.g. another process's snapshot)."""
+        merged = int.from_bytes(self.data, "little") | int.from_bytes(other, "little")
+        self.data = bytearray(merged.to_bytes(len(self.data), "little"))
+
+
+class NegativeIndex:
+    """
+    Compact memory of (module, payload) pairs that recently returned NOT_FOUND (204).
+
+    Time-bucketed Bloom filters: a 204 goes into the filter of the current
+    bucket and a lookup checks every live bucket, so entries age out when
+    their bucket rotates out after the TTL. At ~1.2 bytes per entry (1%
+    false positives) it holds tens of millions of pairs where a result
+    cache would need a full entry each. A false positive skips a module
+    that would have run; a registration after a 204 is missed until the
+    entry ages out. Only trusted in TRUST mode; OBSERVE just counts what
+    would have been skipped.
+
+    Filters are snapshotted to DATA_DIR periodically and merged with the
+    snapshot on disk, so the API processes of a host share what they learn.
+    """
+
+    def __init__(
+        self,
+        mode: NegativeIndexMode,
+        ttl: int,
+        buckets: int,
+        capacity: int,
+        fp_rate: float,
+        snapshot_path: str,
+        snapshot_interval: int
+    ):
+        self.mode = mode
+        self.bucket_seconds = max(1, ttl // buckets)
+        self.bucket_count = buckets
+        self.capacity = capacity
+        # Optimal size for `capacity` entries at `fp_rate`
+        self.bits = max(64, int(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self.added = 0
+        self.lookups = 0
+        self.hits = 0
+        self.skipped = 0
+        self._filters: dict[int, BloomFilter] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != NegativeIndexMode.OFF
+
+    def _epoch(self) -> int:
+        return int(time.time() // self.bucket_seconds)
+
+    def _live(self) -> list[BloomFilter]:
+        """Filters of the unexpired buckets, dropping expired ones."""
+        oldest = self._epoch() - self.bucket_count + 1
+        for epoch in [epoch for epoch in self._filters if epoch < oldest]:
+            del self._filters[epoch]
+        return list(self._filters.values())
+
+    def _positions(self, label: str, payload_key: str) -> list[int]:
+        return bloom_positions(f"{label}\0{payload_key}".encode(), self.bits, self.hashes)
+
+    def add(self, label: str, payload_key: str) -> None:
+        """Remember that `label` ("<family>/<module>") returned 204 for the payload."""
+        if not self.enabled:
+            return
+        epoch = self._epoch()
+        current = self._filters.get(epoch)
+        if current is None:
+            self._live()
+            current = self._filters[epoch] = BloomFilter(self.bits)
+        current.add(self._positions(label, payload_key))
+        self.added += 1
+
+    def split(self, family: str, payload_key: str, modules: list[str]) -> tuple[list[str], dict[str, str]]:
+        """
+        Separate modules known to return 204 for a payload.
+
+        Returns:
+            tuple[list[str], dict[str, str]]: (modules to run, module -> skip reason);
+                nothing is skipped unless the mode is TRUST
+        """
+        if not self.enabled:
+            return modules, {}
+        filters = self._live()
+        if not filters:
+            return modules, {}
+
+        run, skipped = [], {}
+        for module_name in modules:
+            positions = self._positions(f"{family}/{module_name}", payload_key)
+            self.lookups += 1
+            if any(bloom.contains(positions) for bloom in filters):
+                self.hits += 1
+                if self.mode == NegativeIndexMode.TRUST:
+                    skipped[module_name] = "known negative"
+                    continue
+            run.append(module_name)
+        self.skipped += len(skipped)
+        return run, skipped
+
+    def _header(self) -> dict[str, Any]:
+        return {"bits": self.bits, "hashes": self.hashes, "bucket_seconds": self.bucket_seconds}
+
+    def _read_snapshot(self) -> dict[int, bytes]:
+        """Buckets of the snapshot on disk (empty if missing or made with other parameters)."""
+        try:
+            with open(self.snapshot_path, "rb") as handle:
+                header = json.loads(handle.readline())
+                if {key: header.get(key) for key in self._header()} != self._header():
+                    logger.info("Ignoring negative index snapshot with different parameters")
+                    return {}
+                size = (self.bits + 7) // 8
+                return {epoch: handle.read(size) for epoch in header["epochs"]}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable negative index snapshot: {str(e)}")
+            return {}
+
+    def _write_snapshot(self, buckets: dict[int, bytes]) -> None:
+        os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+        tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as handle:
+            handle.write(json.dumps({**self._header(), "epochs": list(buckets)}).encode() + b"\n")
+            for data in buckets.values():
+                handle.write(data)
+        os.replace(tmp_path, self.snapshot_path)
+
+    def restore(self) -> None:
+        """Load the snapshot on disk."""
+        oldest = self._epoch() - self.bucket_count + 1
+        for epoch, data in self._read_snapshot().items():
+            if epoch >= oldest:
+                self._filters[epoch] = BloomFilter(self.bits, bytearray(data))
+        if self._filters:
+            logger.info(f"Restored negative index: {len(self._filters)} buckets")
+
+    def _merge_and_save(self, own: dict[int, bytes]) -> dict[int, bytes]:
+        """Merge our buckets with the snapshot on disk and write the union back."""
+        oldest = self._epoch() - self.bucket_count + 1
+        merged = {epoch: data for epoch, data in self._read_snapshot().items() if epoch >= oldest}
+        for epoch, data in own.items():
+            if epoch in merged:
+                union = int.from_bytes(merged[epoch], "little") | int.from_bytes(data, "little")
+                data = union.to_bytes(len(data), "little")
+            merged[epoch] = data
+        self._write_snapshot(merged)
+        return merged
+
+    async def snapshot(self) -> None:
+        """Persist the filters, picking up what other processes saved meanwhile."""
+        own = {epoch: bytes(bloom.data) for epoch, bloom in self._filters.items()}
+        try:
+            merged = await asyncio.to_thread(self._merge_and_save, own)
+        except OSError as e:
+            logger.error(f"Failed to snapshot negative index: {str(e)}")
+            return
+        for epoch, data in merged.items():
+            bloom = self._filters.get(epoch)
+            if bloom is None:
+                self._filters[epoch] = BloomFilter(self.bits, bytearray(data))
+            else:
+                bloom.merge(data)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            await self.snapshot()
+
+    def start(self) -> None:
+        """Restore the snapshot and start periodic snapshots."""
+        self.restore()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic snapshots and save a final one."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.snapshot()
+
+    def stats(self) -> dict[str, Any]:
+        """Size and effectiveness for the stats registry."""
+        filters = self._live()
+        return {
+            "mode": self.mode.value,
+            "buckets": len(filters),
+            "memory_mb": round(len(filters) * self.bits / 8 / 1024 / 1024, 1),
+            "added": self.added,
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else None,
+            "skipped": self.skipped,
+        }
+
+
+@lru_cache()
+def get_negative_index() -> NegativeIndex:
+    """
+    Get the worker-wide negative index.
+
+    Returns:
+        NegativeIndex: Index configured from NEGATIVE_INDEX_* settings
+    """
+    settings = get_settings()
+    index = NegativeIndex(
+        mode=settings.NEGATIVE_INDEX_MODE,
+        ttl=settings.NEGATIVE_INDEX_TTL,
+        buckets=settings.NEGATIVE_INDEX_BUCKETS,
+        capacity=settings.NEGATIVE_INDEX_CAPACITY,
+        fp_rate=settings.NEGATIVE_INDEX_FP_RATE,
+        snapshot_path=os.path.join(settings.DATA_DIR, SNAPSHOT_FILE),
+        snapshot_interval=settings.NEGATIVE_INDEX_SNAPSHOT_INTERVAL
+    )
+    get_stats_registry().register("negative_index", index.stats)
+    return index
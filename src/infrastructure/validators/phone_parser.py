@@ -0,0 +1,61 @@
+import re
+from functools import lru_cache
+
+import phonenumbers
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.domain.exceptions import ValidationException
+from src.domain.models.search import ParsedPhone
+from src.infrastructure.monitoring.stats_registry import cache_stats, get_stats_registry
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+def clean_phone(phone: str) -> str:
+    """Strip formatting and make sure the number carries a leading '+'."""
+    cleaned = re.sub(r'[^\d+]', '', phone)
+    if not cleaned.startswith('+'):
+        cleaned = '+' + cleaned
+    return cleaned
+
+
+@lru_cache(maxsize=settings.PHONE_PARSE_CACHE_SIZE)
+def _parse_cleaned(cleaned: str) -> ParsedPhone:
+    parsed = phonenumbers.parse(cleaned, None)
+    return ParsedPhone(
+        e164=phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
+        country_code=str(parsed.country_code),
+        national_number=str(parsed.national_number),
+        region=phonenumbers.region_code_for_number(parsed),
+        valid=phonenumbers.is_valid_number(parsed)
+    )
+
+
+def parse_phone(phone: str) -> ParsedPhone:
+    """
+    Parse a phone number (LRU-cached on the cleaned form).
+
+    Args:
+        phone: Phone number in any common format, e.g. "+7 (931) 999-99-99"
+
+    Returns:
+        ParsedPhone: Parsed number (shared cached instance, do not mutate)
+
+    Raises:
+        ValidationException: If the number cannot be parsed
+    """
+    try:
+        return _parse_cleaned(clean_phone(phone))
+    except phonenumbers.NumberParseException as e:
+        logger.error(f"Invalid phone number: {phone} - {str(e)}")
+        raise ValidationException(f"Invalid phone number format: {str(e)}")
+
+
+def phone_parse_cache_info():
+    """Hit/miss statistics of the parse cache."""
+    return _parse_cleaned.cache_info()
+
+
+get_stats_registry().register("caches.phone_parse", lambda: cache_stats(phone_parse_cache_info()))
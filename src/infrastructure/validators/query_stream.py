@@ -0,0 +1,65 @@
+import json
+from typing import AsyncIterator
+
+from src.core.logging import get_logger
+from src.domain.exceptions import ValidationException
+
+logger = get_logger(__name__)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[bytes]:
+    """
+    Split a byte stream into lines without buffering more than one line.
+
+    Raises:
+        ValidationException: If a line is longer than max_line_bytes
+    """
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+        if len(pending) > max_line_bytes:
+            raise ValidationException(f"Input line longer than {max_line_bytes} bytes")
+    if pending:
+        yield pending
+
+
+def parse_query_line(line: bytes) -> str:
+    """
+    Query of one input line: a JSON string, a JSON object with a "query"
+    field, or the plain text of the line.
+
+    Raises:
+        ValidationException: If a JSON line carries no query string
+    """
+    text = line.decode("utf-8", errors="replace").strip()
+    if not text.startswith(('"', "{")):
+        return text
+    try:
+        value = json.loads(text)
+    except ValueError:
+        raise ValidationException(f"Malformed JSON line: {text[:100]}")
+    if isinstance(value, dict):
+        value = value.get("query")
+    if not isinstance(value, str):
+        raise ValidationException(f"No query string in line: {text[:100]}")
+    return value
+
+
+async def iter_queries(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[str]:
+    """
+    Queries of an NDJSON / line-delimited upload, read incrementally.
+
+    Blank lines are skipped; lines that cannot be parsed are passed through
+    as-is so they come back as per-query errors instead of failing the upload.
+    """
+    async for line in iter_lines(chunks, max_line_bytes):
+        if not line.strip():
+            continue
+        try:
+            yield parse_query_line(line)
+        except ValidationException as e:
+            logger.warning(f"Unparseable query line: {e.message}")
+            yield line.decode("utf-8", errors="replace").strip()
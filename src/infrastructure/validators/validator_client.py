@@ -1,11 +1,11 @@
 import httpx
 from typing import Any, List
-import re
-import phonenumbers
 from email_validator import validate_email, EmailNotValidError
 
 from src.core.logging import get_logger
-from src.domain.exceptions import ExternalServiceException
+from src.domain.exceptions import ExternalServiceException, ValidationException
+from src.infrastructure.monitoring.blocking_detector import blocking_label
+from src.infrastructure.validators.phone_parser import clean_phone, parse_phone
 from src.core.constants import DataType
 
 from src.core.config import get_settings
@@ -32,13 +32,7 @@ class DirectValidator:
     def validate_phone(phone: str) -> bool:
         """Validate phone number format directly."""
         try:
-            # Clean phone number
-            cleaned_phone = re.sub(r'[^\d+]', '', phone)
-            if not cleaned_phone.startswith('+'):
-                cleaned_phone = '+' + cleaned_phone
-                
-            parsed = phonenumbers.parse(cleaned_phone, None)
-            return phonenumbers.is_valid_number(parsed)
+            return parse_phone(phone).valid
         except:
             return False
     
@@ -57,25 +51,24 @@ class DirectValidator:
                 }
             }
         
-        # Phone detection
-        if self.validate_phone(clean_query):
-            try:
-                # Basic phone info extraction
-                cleaned_phone = re.sub(r'[^\d+]', '', clean_query)
-                if not cleaned_phone.startswith('+'):
-                    cleaned_phone = '+' + cleaned_phone
-                    
-                return {
-                    "type": DataType.PHONE,
-                    "clean_data": cleaned_phone,
-                    "extra": {
-                        "country_code": "7",  # Default for legacy compatibility
-                        "operator": "Unknown",
-                        "correct_length": True
-                    }
+        # Phone detection (parsed once, cached, and handed to the phone search)
+        try:
+            parsed_phone = parse_phone(clean_query)
+        except ValidationException:
+            parsed_phone = None
+        
+        if parsed_phone is not None and parsed_phone.valid:
+            return {
+                "type": DataType.PHONE,
+                "clean_data": clean_phone(clean_query),
+                "extra": {
+                    "country_code": parsed_phone.country_code,
+                    "region": parsed_phone.region,
+                    "operator": "Unknown",
+                    "correct_length": True,
+                    "parsed_phone": parsed_phone.dict()
                 }
-            except:
-                pass
+            }
         
         # Fallback for unknown types
         return {
@@ -110,7 +103,8 @@ class ValidatorClient:
         
         #   OPTION 2: Always available DIRECT connection bypass
         logger.info(f"Using DIRECT validation bypass for: {query}")
-        return self.direct_validator.validate(query)
+        with blocking_label("validation"):
+            return self.direct_validator.validate(query)
     
     async def validate_direct_only(self, query: str) -> dict[str, Any]:
         """
@@ -118,7 +112,8 @@ class ValidatorClient:
         This fulfills the requirement for direct connection that bypasses validation.
         """
         logger.info(f"DIRECT BYPASS: Validating without external service: {query}")
-        return self.direct_validator.validate(query)
+        with blocking_label("validation"):
+            return self.direct_validator.validate(query)
     
     async def _validate_external(self, query: str) -> dict[str, Any]:
         """Validate using external service with DIRECT HTTP connection."""
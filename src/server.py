@@ -0,0 +1,120 @@
+"""
+Production server entry point.
+
+    python -m src.server
+
+Runs uvicorn with uvloop and httptools when they are installed, sizes the
+worker processes from WORKERS (default: CPU count) and applies the SERVER_*
+tuning settings. The effective configuration is reported by /status.
+"""
+import asyncio
+import importlib.util
+import json
+import os
+from typing import Any, Optional
+
+from src.core.config import Settings, get_settings
+from src.core.constants import ServerHttp, ServerLoop
+from src.core.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+# Environment variable handing the launcher's configuration to the workers
+RUNTIME_ENV = "HOLEHE_SERVER_RUNTIME"
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _cpu_count() -> int:
+    """CPUs this process may use, honouring affinity and a cgroup v2 CPU quota (containers)."""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def _resolve(requested: str, preferred: str, fallback: str, auto: str) -> str:
+    """Requested implementation, or the fallback when the preferred one is missing."""
+    if requested == auto:
+        return preferred if _installed(preferred) else fallback
+    if requested == preferred and not _installed(preferred):
+        logger.warning(f"{preferred} is not installed, using {fallback}")
+        return fallback
+    return requested
+
+
+def resolve_runtime(settings: Settings) -> dict[str, Any]:
+    """
+    Effective server configuration for the given settings.
+
+    Returns:
+        dict: uvicorn options (host, port, workers, loop, http, ...)
+    """
+    return {
+        "host": settings.HOST,
+        "port": settings.PORT,
+        "workers": settings.WORKERS or _cpu_count(),
+        "loop": _resolve(settings.SERVER_LOOP.value, "uvloop", "asyncio", ServerLoop.AUTO.value),
+        "http": _resolve(settings.SERVER_HTTP.value, "httptools", "h11", ServerHttp.AUTO.value),
+        "backlog": settings.SERVER_BACKLOG,
+        "keepalive_timeout": settings.SERVER_KEEPALIVE_TIMEOUT,
+        "limit_concurrency": settings.SERVER_LIMIT_CONCURRENCY,
+        "limit_max_requests": settings.SERVER_LIMIT_MAX_REQUESTS,
+        "graceful_shutdown": settings.SERVER_GRACEFUL_SHUTDOWN,
+    }
+
+
+def runtime_info() -> dict[str, Any]:
+    """
+    Runtime of the current worker process.
+
+    Returns:
+        dict: Launcher configuration (None when started by plain uvicorn),
+            pid and the event loop actually running
+    """
+    launcher: Optional[dict[str, Any]] = None
+    if RUNTIME_ENV in os.environ:
+        launcher = json.loads(os.environ[RUNTIME_ENV])
+    loop = type(asyncio.get_running_loop())
+    return {
+        "launcher": launcher,
+        "pid": os.getpid(),
+        "event_loop": f"{loop.__module__}.{loop.__qualname__}",
+    }
+
+
+def main() -> None:
+    import uvicorn
+
+    setup_logging()
+    settings = get_settings()
+    runtime = resolve_runtime(settings)
+    os.environ[RUNTIME_ENV] = json.dumps(runtime)
+    logger.info(f"Server runtime: {runtime}")
+
+    uvicorn.run(
+        "main:app",
+        host=runtime["host"],
+        port=runtime["port"],
+        workers=runtime["workers"],
+        loop=runtime["loop"],
+        http=runtime["http"],
+        backlog=runtime["backlog"],
+        timeout_keep_alive=runtime["keepalive_timeout"],
+        limit_concurrency=runtime["limit_concurrency"],
+        limit_max_requests=runtime["limit_max_requests"],
+        timeout_graceful_shutdown=runtime["graceful_shutdown"],
+        log_level=settings.LOG_LEVEL.lower(),
+        log_config=None
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Simulated upstream site farm for load testing.
+
+Run the farm, then start the service with HTTP_TRANSPORT_MODE=routed so
+every module request is sent here instead of the real site:
+
+    python -m src.simulation.upstream_farm --scenario degraded --port 8900
+
+Each request is answered according to the profile of the module that made
+it (X-Upstream-Module header): a lognormal latency, random server errors,
+429s (random or over a per-module request rate), stalls and connection
+resets. Per-module counters are served at /__farm/stats.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+from pydantic import BaseModel, Field
+
+from src.core.logging import get_logger, setup_logging
+from src.infrastructure.http.routing_transport import UPSTREAM_MODULE_HEADER
+
+logger = get_logger(__name__)
+
+SCENARIO_DIR = Path(__file__).parent / "scenarios"
+STATS_PATH = "/__farm/stats"
+
+# z-score of the 99th percentile of the standard normal distribution
+Z_P99 = 2.326
+
+
+class LatencyProfile(BaseModel):
+    """Lognormal latency given by its median and 99th percentile."""
+    median_ms: float = Field(default=100, gt=0)
+    p99_ms: float = Field(default=500, gt=0)
+
+    def sample(self) -> float:
+        """Draw a latency in seconds."""
+        sigma = max(0.0, math.log(self.p99_ms / self.median_ms) / Z_P99)
+        return random.lognormvariate(math.log(self.median_ms), sigma) / 1000
+
+
+class UpstreamProfile(BaseModel):
+    """Behaviour of one simulated site."""
+    latency: LatencyProfile = LatencyProfile()
+    status: int = 200
+    body: str = "{}"
+    content_type: str = "application/json"
+    error_ratio: float = Field(default=0, ge=0, le=1, description="Share of 503 responses")
+    rate_limit_ratio: float = Field(default=0, ge=0, le=1, description="Share of random 429 responses")
+    rate_limit_rps: Optional[float] = Field(default=None, gt=0, description="Requests per second before 429s")
+    stall_ratio: float = Field(default=0, ge=0, le=1, description="Share of requests that hang")
+    stall_ms: float = Field(default=30000, ge=0, description="How long a stalled request hangs before the connection drops")
+    reset_ratio: float = Field(default=0, ge=0, le=1, description="Share of connections reset without a response")
+
+
+def _merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class Scenario:
+    """
+    Scenario file: `defaults` profile plus per-module overrides in `modules`,
+    keyed by "<family>/<module>" or by bare module name.
+    """
+
+    def __init__(self, name: str, defaults: dict[str, Any], modules: dict[str, dict[str, Any]]):
+        self.name = name
+        self.default_profile = UpstreamProfile(**defaults)
+        self.profiles = {
+            label: UpstreamProfile(**_merge(defaults, override or {}))
+            for label, override in modules.items()
+        }
+
+    @classmethod
+    def load(cls, scenario: str) -> "Scenario":
+        """
+        Load a bundled scenario by name or a scenario file by path.
+
+        Args:
+            scenario: "healthy", "degraded", "rate_limited" or a YAML path
+        """
+        path = Path(scenario)
+        if not path.exists():
+            path = SCENARIO_DIR / f"{scenario}.yaml"
+        with open(path, encoding="utf-8") as file:
+            data = yaml.safe_load(file) or {}
+        return cls(path.stem, data.get("defaults") or {}, data.get("modules") or {})
+
+    def profile_for(self, label: Optional[str]) -> UpstreamProfile:
+        if not label:
+            return self.default_profile
+        profile = self.profiles.get(label)
+        if profile is None:
+            profile = self.profiles.get(label.rsplit("/", 1)[-1], self.default_profile)
+        return profile
+
+
+class _TokenBucket:
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class UpstreamFarm:
+    """asyncio HTTP/1.1 server answering for every simulated site."""
+
+    def __init__(self, scenario: Scenario):
+        self.scenario = scenario
+        self.stats: dict[str, Counter] = defaultdict(Counter)
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    def _rate_limited(self, label: str, profile: UpstreamProfile) -> bool:
+        if random.random() < profile.rate_limit_ratio:
+            return True
+        if profile.rate_limit_rps is None:
+            return False
+        bucket = self._buckets.get(label)
+        if bucket is None:
+            bucket = self._buckets[label] = _TokenBucket(profile.rate_limit_rps)
+        return not bucket.take()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[tuple[str, dict[str, str]]]:
+        """Read one request; returns (path, lower-case headers) or None on EOF."""
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        parts = request_line.decode("latin-1").split()
+        path = parts[1] if len(parts) > 1 else "/"
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                await reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif headers.get("content-length"):
+            await reader.readexactly(int(headers["content-length"]))
+        return path, headers
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: bytes,
+        content_type: str,
+        extra_headers: Optional[dict[str, str]] = None
+    ) -> None:
+        head = [
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive",
+        ]
+        head.extend(f"{name}: {value}" for name, value in (extra_headers or {}).items())
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one keep-alive connection."""
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                path, headers = request
+
+                if path == STATS_PATH:
+                    body = json.dumps({"scenario": self.scenario.name, "modules": self.stats}).encode()
+                    await self._respond(writer, 200, body, "application/json")
+                    continue
+
+                label = headers.get(UPSTREAM_MODULE_HEADER, "_unscoped")
+                profile = self.scenario.profile_for(label)
+                stats = self.stats[label]
+                stats["requests"] += 1
+
+                if random.random() < profile.reset_ratio:
+                    stats["reset"] += 1
+                    writer.transport.abort()
+                    return
+                if random.random() < profile.stall_ratio:
+                    stats["stalled"] += 1
+                    await asyncio.sleep(profile.stall_ms / 1000)
+                    writer.transport.abort()
+                    return
+
+                await asyncio.sleep(profile.latency.sample())
+                if self._rate_limited(label, profile):
+                    stats["429"] += 1
+                    await self._respond(writer, 429, b'{"error": "rate limited"}', "application/json", {"Retry-After": "1"})
+                elif random.random() < profile.error_ratio:
+                    stats["503"] += 1
+                    await self._respond(writer, 503, b'{"error": "unavailable"}', "application/json")
+                else:
+                    stats[str(profile.status)] += 1
+                    await self._respond(writer, profile.status, profile.body.encode(), profile.content_type)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self.handle, host, port, backlog=4096)
+        logger.info(f"Upstream farm listening on http://{host}:{port} (scenario={self.scenario.name})")
+        async with server:
+            await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulated upstream site farm")
+    parser.add_argument("--scenario", default="healthy", help="healthy, degraded, rate_limited or a YAML path")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    args = parser.parse_args()
+
+    setup_logging()
+    farm = UpstreamFarm(Scenario.load(args.scenario))
+    try:
+        asyncio.run(farm.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        logger.info(f"Upstream farm stopped: {json.dumps(farm.stats)}")
+
+
+if __name__ == "__main__":
+    main()